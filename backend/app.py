@@ -1,5 +1,7 @@
 import logging
 import os
+import signal
+import threading
 from datetime import date
 
 import click
@@ -13,6 +15,7 @@ from routes.auth_routes import auth_bp
 from routes.dashboard_routes import dashboard_bp
 from routes.google_auth_routes import google_auth_bp
 from routes.preference_routes import preference_bp
+from scrapers import runtime_stats
 from services.scheduler_service import SchedulerService
 
 
@@ -74,6 +77,20 @@ def create_app():
                         "status": "healthy",
                         "database": "connected",
                         "scheduler": scheduler_state,
+                        "scheduler_leader": bool(
+                            scheduler_service and scheduler_service.leader_lock.is_leader
+                        ),
+                        # Scraping runs in the scheduler leader, which publishes
+                        # its counters on the lease row as `leader.status`.
+                        "leader": (
+                            scheduler_service.leader_lock.lease_info() if scheduler_service else None
+                        ),
+                        # Counters of the process that answered this request.
+                        "process": {
+                            "id": scheduler_service.leader_lock.holder if scheduler_service else None,
+                            "scrapes_here": scheduler_state == "running",
+                            **runtime_stats(),
+                        },
                     }
                 ),
                 200,
@@ -192,6 +209,55 @@ def register_cli_commands(app: Flask):
             init_database(seed_sample=seed)
         click.echo("Database initialized.")
 
+    @app.cli.command("scrape-all")
+    @click.option("--url-id", "url_ids", type=int, multiple=True, help="Limit to the sources of these monitored URL IDs.")
+    def scrape_all_command(url_ids):
+        """Scrape every active source URL once, concurrently in one batch."""
+        scheduler_service = app.extensions["scheduler_service"]
+        results = scheduler_service.scrape_batch(list(url_ids) or None)
+        succeeded = sum(1 for result in results.values() if result.get("success"))
+        found = sum(result.get("notifications_found", 0) for result in results.values())
+        click.echo(f"Scraped {len(results)} sources ({succeeded} succeeded), {found} notifications found.")
+
+    @app.cli.command("scrape-load")
+    @click.option("--hours", default=24, show_default=True, help="Length of the window to plan.")
+    @click.option("--bucket-minutes", default=1, show_default=True, help="Width of each histogram bucket.")
+    def scrape_load_command(hours, bucket_minutes):
+        """Print how many scrapes are planned per time bucket over the coming window."""
+        scheduler_service = app.extensions["scheduler_service"]
+        histogram = scheduler_service.load_histogram(window_hours=hours, bucket_minutes=bucket_minutes)
+        if not histogram:
+            click.echo("No active sources to schedule.")
+            return
+
+        for bucket, count in histogram.items():
+            click.echo(f"{bucket:%Y-%m-%d %H:%M}  {count:3d}  {'#' * count}")
+        total = sum(histogram.values())
+        peak_bucket, peak = max(histogram.items(), key=lambda item: item[1])
+        click.echo(
+            f"{total} scrapes in {hours}h across {len(histogram)} of {hours * 60 // bucket_minutes} buckets; "
+            f"peak {peak} at {peak_bucket:%H:%M} UTC (runs may start up to "
+            f"{scheduler_service.jitter_seconds}s later with jitter)."
+        )
+
+    @app.cli.command("run-scheduler")
+    def run_scheduler_command():
+        """Run the scraping scheduler in the foreground until interrupted or sent SIGTERM."""
+        scheduler_service = app.extensions["scheduler_service"]
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+        scheduler_service.start_scheduler()
+        click.echo(f"Scheduler process started as {scheduler_service.leader_lock.holder}.")
+        try:
+            while not stop.wait(1):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            scheduler_service.stop_scheduler()
+            click.echo("Scheduler process stopped.")
+
 
 def configure_logging(app: Flask):
     if app.logger.handlers:
@@ -206,6 +272,9 @@ def configure_logging(app: Flask):
 def register_scheduler(app: Flask):
     scheduler = SchedulerService(app=app)
     app.extensions["scheduler_service"] = scheduler
+    if not app.config.get("SCHEDULER_IN_WEB", True):
+        # Jobs run in the separate `flask run-scheduler` process.
+        return
 
     if hasattr(app, "before_first_request"):
         @app.before_first_request
@@ -0,0 +1,138 @@
+import re
+import sys
+import timeit
+from pathlib import Path
+
+from scrapers.generic_scraper import GenericScraper
+from scrapers.pdf_extraction import extract_pdf_text
+
+FILLER = (
+    "The Commission reserves the right to cancel the examination. Candidates must read the "
+    "instructions carefully before filling the online application form. "
+)
+HEADER = (
+    "Advertisement for Assistant Section Officer Grade II. Total posts: 142. "
+    "Qualification: Bachelor's degree from a recognised university. Age 21-30 years. "
+    "Last date to apply: 15/03/2025, 6 PM. "
+)
+
+
+def legacy_extract_job_details(scraper, text):
+    """extract_job_details as it was before the single-pass extractor."""
+
+    def clean_text(value):
+        if not value:
+            return ""
+        return re.sub(r"\s+", " ", value).strip()
+
+    def extract_age_limit(value):
+        if not value:
+            return ""
+        patterns = [
+            r"\b(\d{1,2}\s*[-to]+\s*\d{1,2}\s*years?)\b",
+            r"\b(below\s*\d{1,2}\s*years?)\b",
+            r"\b(upper\s*age\s*limit\s*[:\-]?\s*\d{1,2}\s*years?)\b",
+            r"\b(max(?:imum)?\s*\d{1,2}\s*years?)\b",
+            r"\b(min(?:imum)?\s*\d{1,2}\s*years?)\b",
+        ]
+        for pattern in patterns:
+            match = re.search(pattern, value, flags=re.IGNORECASE)
+            if match:
+                return clean_text(match.group(1))
+        return ""
+
+    cleaned = clean_text(text)
+    lower = cleaned.lower()
+    title_match = re.search(
+        r"(recruitment|notification|advertisement)\s*(for)?\s*([A-Za-z0-9 /-]{5,120})",
+        cleaned,
+        flags=re.IGNORECASE,
+    )
+    post_count_match = re.search(
+        r"(vacanc(?:y|ies)|posts?)\s*[:\-]?\s*(\d{1,6})", cleaned, flags=re.IGNORECASE
+    )
+    date_match = re.search(
+        r"(last\s+date(?:\s+to\s+apply)?|apply\s+before)\s*[:\-]?\s*([^\n,;]+)",
+        cleaned,
+        flags=re.IGNORECASE,
+    )
+    qualification = ""
+    qualification_pattern = re.search(
+        r"(qualification|eligible|eligibility)\s*[:\-]?\s*([^\n]{5,200})",
+        cleaned,
+        flags=re.IGNORECASE,
+    )
+    if qualification_pattern:
+        qualification = clean_text(qualification_pattern.group(2))
+    elif any(k in lower for k in ["graduate", "12th", "10th", "diploma", "degree"]):
+        qualification = "Mentioned in notification"
+
+    parsed_last_date = scraper.parse_date(date_match.group(2)) if date_match else None
+    return {
+        "job_title": clean_text(title_match.group(3)) if title_match else "",
+        "age_limit": extract_age_limit(cleaned),
+        "qualification_required": qualification,
+        "last_date_to_apply": parsed_last_date.isoformat() if parsed_last_date else None,
+        "vacancy_count": int(post_count_match.group(2)) if post_count_match else None,
+    }
+
+
+def synthetic_samples():
+    samples = {}
+    for size_kb in (2, 50, 500):
+        repeat = max(size_kb * 1024 // len(FILLER), 1)
+        samples[f"fields first, {size_kb} KB"] = HEADER + FILLER * repeat
+        samples[f"fields last, {size_kb} KB"] = FILLER * repeat + HEADER
+        samples[f"no fields, {size_kb} KB"] = FILLER * repeat
+    samples["listing row"] = "Notification for Combined Defence Services Exam (I) 2025 12/01/2025"
+    return samples
+
+
+def corpus_samples(corpus_dir):
+    samples = {}
+    for path in sorted(Path(corpus_dir).rglob("*")):
+        if path.suffix.lower() == ".pdf":
+            try:
+                samples[path.name] = extract_pdf_text(str(path))["text"]
+            except RuntimeError as exc:
+                print(f"Skipping {path.name}: {exc}")
+        elif path.suffix.lower() == ".txt":
+            samples[path.name] = path.read_text(encoding="utf-8", errors="ignore")
+    return samples
+
+
+def benchmark(samples, number):
+    """Compare output and speed of the legacy and single-pass field extractors."""
+    scraper = GenericScraper("https://example.com", config={"pdf_cache": None, "pdf_extractor": None})
+    mismatches = 0
+    total_legacy = total_current = 0.0
+
+    print(f"{'sample':<28}{'chars':>10}{'legacy ms':>12}{'current ms':>12}{'speedup':>10}  same")
+    print("-" * 80)
+    for name, text in samples.items():
+        cleaned = scraper.clean_text(text)
+        same = legacy_extract_job_details(scraper, cleaned) == scraper.extract_job_details(cleaned)
+        mismatches += not same
+
+        legacy = timeit.timeit(lambda: legacy_extract_job_details(scraper, cleaned), number=number)
+        current = timeit.timeit(lambda: scraper.extract_job_details(cleaned), number=number)
+        total_legacy += legacy
+        total_current += current
+        print(
+            f"{name[:27]:<28}{len(cleaned):>10}{legacy / number * 1000:>12.3f}"
+            f"{current / number * 1000:>12.3f}{legacy / current:>9.1f}x  {'yes' if same else 'NO'}"
+        )
+
+    print("-" * 80)
+    print(f"Overall speedup: {total_legacy / total_current:.1f}x, mismatching samples: {mismatches}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help"):
+        print("Usage: python benchmark_field_extraction.py [corpus_dir] [iterations]")
+        print("Without a corpus, synthetic notices of 2 KB to 500 KB are used.")
+        sys.exit(0)
+
+    samples = corpus_samples(sys.argv[1]) if len(sys.argv) > 1 else synthetic_samples()
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    benchmark(samples, iterations)
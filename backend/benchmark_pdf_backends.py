@@ -0,0 +1,84 @@
+import sys
+import time
+from pathlib import Path
+
+from scrapers.generic_scraper import GenericScraper
+from scrapers.pdf_backends import available_backends
+from scrapers.pdf_extraction import extract_pdf_text
+
+FIELDS = ["job_title", "age_limit", "qualification_required", "last_date_to_apply", "vacancy_count"]
+REFERENCE_BACKEND = "pdfplumber"
+
+
+def benchmark(corpus_dir, backends):
+    """Time each text backend over a folder of PDFs and compare extracted fields."""
+    pdf_paths = sorted(Path(corpus_dir).rglob("*.pdf"))
+    if not pdf_paths:
+        print(f"No PDFs found under {corpus_dir}")
+        return
+
+    scraper = GenericScraper("https://example.com", config={"pdf_cache": None, "pdf_extractor": None})
+    reference = REFERENCE_BACKEND if REFERENCE_BACKEND in backends else backends[0]
+    results = {}
+
+    for backend in backends:
+        pages = 0
+        failures = 0
+        elapsed = 0.0
+        details = {}
+        for path in pdf_paths:
+            started = time.perf_counter()
+            try:
+                extracted = extract_pdf_text(str(path), backends=(backend,))
+            except RuntimeError as exc:
+                print(f"  [{backend}] failed on {path.name}: {exc}")
+                failures += 1
+                continue
+            finally:
+                elapsed += time.perf_counter() - started
+            pages += extracted["pages_read"]
+            details[path] = scraper.extract_job_details(scraper.clean_text(extracted["text"]))
+        results[backend] = {"pages": pages, "seconds": elapsed, "failures": failures, "details": details}
+
+    print(f"\nCorpus: {len(pdf_paths)} PDFs from {corpus_dir} (reference backend: {reference})\n")
+    header = f"{'backend':<12}{'pages':>8}{'seconds':>10}{'pages/sec':>12}{'failures':>10}"
+    print(header + "".join(f"{field[:12]:>14}" for field in FIELDS))
+    print("-" * (len(header) + 14 * len(FIELDS)))
+
+    reference_details = results[reference]["details"]
+    for backend, result in results.items():
+        pages_per_second = result["pages"] / result["seconds"] if result["seconds"] else 0.0
+        row = (
+            f"{backend:<12}{result['pages']:>8}{result['seconds']:>10.2f}"
+            f"{pages_per_second:>12.1f}{result['failures']:>10}"
+        )
+        compared = [path for path in result["details"] if path in reference_details]
+        for field in FIELDS:
+            if not compared:
+                row += f"{'n/a':>14}"
+                continue
+            matches = sum(
+                1
+                for path in compared
+                if result["details"][path][field] == reference_details[path][field]
+            )
+            row += f"{matches / len(compared):>14.0%}"
+        print(row)
+
+    print("\nField columns show agreement with the reference backend's extract_job_details output.")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_pdf_backends.py <corpus_dir> [backend,backend,...]")
+        print("Example: python benchmark_pdf_backends.py ~/notice-pdfs pdfium,pdfplumber")
+        print(f"Available backends: {', '.join(available_backends())}")
+        sys.exit(1)
+
+    selected = sys.argv[2].split(",") if len(sys.argv) > 2 else available_backends()
+    unknown = [name for name in selected if name not in available_backends()]
+    if unknown:
+        print(f"Unknown or unavailable backends: {', '.join(unknown)}")
+        sys.exit(1)
+
+    benchmark(sys.argv[1], selected)
@@ -13,6 +13,10 @@ GOOGLE_REDIRECT_URI = os.getenv(
 )
 
 
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in {"1", "true", "yes", "on"}
+
+
 def _normalize_database_url(url: str | None) -> str:
     if not url:
         return "sqlite:///saspirant.db"
@@ -28,6 +32,9 @@ class Config:
     SQLALCHEMY_ENGINE_OPTIONS = {
         "pool_pre_ping": True,
     }
+    # Start the scraping scheduler inside web processes; production runs it
+    # as a separate `flask run-scheduler` process instead.
+    SCHEDULER_IN_WEB = _env_flag("SCHEDULER_IN_WEB", "true")
 
 
 class DevelopmentConfig(Config):
@@ -38,6 +45,7 @@ class DevelopmentConfig(Config):
 class ProductionConfig(Config):
     DEBUG = False
     ENV = "production"
+    SCHEDULER_IN_WEB = _env_flag("SCHEDULER_IN_WEB", "false")
 
 
 config_by_name = {
@@ -0,0 +1,90 @@
+from app import app, db
+from sqlalchemy import text, inspect
+
+# Scraper state columns added after the initial schema: (table, column, SQL type).
+NEW_COLUMNS = [
+    ("monitored_urls", "http_validators", "JSON"),
+    ("monitored_urls", "content_fingerprint", "VARCHAR(64)"),
+    ("monitored_urls", "render_strategy", "VARCHAR(20)"),
+    ("monitored_urls", "runs_since_static_probe", "INTEGER"),
+    ("monitored_urls", "canonical_url", "VARCHAR(2048)"),
+    ("monitored_urls", "listing_snapshot", "JSON"),
+    ("monitored_urls", "last_new_notification_at", "TIMESTAMP"),
+    ("job_notifications", "canonical_source_url", "VARCHAR(2048)"),
+    ("scheduler_leases", "status", "JSON"),
+    ("monitored_urls", "alerts_backfill_pending", "BOOLEAN"),
+]
+
+# Indexes on columns added above: (index name, table, column).
+NEW_INDEXES = [
+    ("ix_monitored_urls_canonical_url", "monitored_urls", "canonical_url"),
+    ("ix_job_notifications_canonical_source_url", "job_notifications", "canonical_source_url"),
+]
+
+# Unique indexes on existing tables: (index name, table, columns). Duplicate
+# rows are deleted first, keeping the oldest.
+NEW_UNIQUE_INDEXES = [
+    ("uq_sent_alerts_user_notification", "sent_alerts", ("user_id", "job_notification_id")),
+]
+
+
+def migrate():
+    with app.app_context():
+        # New tables (e.g. scrape_runs, seen_items) are created; existing tables are left alone.
+        db.create_all()
+        inspector = inspect(db.engine)
+
+        for table, column, column_type in NEW_COLUMNS:
+            existing = {col['name'] for col in inspector.get_columns(table)}
+            if column in existing:
+                print(f"✓ {table}.{column} already exists")
+                continue
+
+            print(f"Adding {table}.{column}...")
+            try:
+                with db.engine.connect() as conn:
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"))
+                    conn.commit()
+                print(f"✓ {table}.{column} added successfully")
+            except Exception as e:
+                print(f"✗ Error adding {table}.{column}: {e}")
+
+        for index, table, column in NEW_INDEXES:
+            existing = {ix['name'] for ix in inspect(db.engine).get_indexes(table)}
+            if index in existing:
+                print(f"✓ {index} already exists")
+                continue
+
+            print(f"Creating {index}...")
+            try:
+                with db.engine.connect() as conn:
+                    conn.execute(text(f"CREATE INDEX {index} ON {table} ({column})"))
+                    conn.commit()
+                print(f"✓ {index} created successfully")
+            except Exception as e:
+                print(f"✗ Error creating {index}: {e}")
+
+        for index, table, columns in NEW_UNIQUE_INDEXES:
+            table_inspector = inspect(db.engine)
+            existing = {ix['name'] for ix in table_inspector.get_indexes(table)}
+            existing |= {uc['name'] for uc in table_inspector.get_unique_constraints(table)}
+            if index in existing:
+                print(f"✓ {index} already exists")
+                continue
+
+            column_list = ", ".join(columns)
+            print(f"Creating {index}...")
+            try:
+                with db.engine.connect() as conn:
+                    removed = conn.execute(text(
+                        f"DELETE FROM {table} WHERE id NOT IN "
+                        f"(SELECT MIN(id) FROM {table} GROUP BY {column_list})"
+                    )).rowcount
+                    conn.execute(text(f"CREATE UNIQUE INDEX {index} ON {table} ({column_list})"))
+                    conn.commit()
+                print(f"✓ {index} created successfully ({removed} duplicate rows removed)")
+            except Exception as e:
+                print(f"✗ Error creating {index}: {e}")
+
+if __name__ == '__main__':
+    migrate()
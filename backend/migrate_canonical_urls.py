@@ -0,0 +1,106 @@
+import sys
+
+from app import app, db
+from migrate_add_scrape_state import migrate as add_columns
+from models import JobNotification, MonitoredURL, ScrapeRun, SeenItem, SentAlert
+from services.url_canonical import canonicalize_url
+
+
+def merge_monitored_urls(dry_run):
+    """Fill canonical_url and merge each user's rows that share it into the oldest one."""
+    keepers = {}
+    merged = 0
+    for row in MonitoredURL.query.order_by(MonitoredURL.id).all():
+        row.canonical_url = canonicalize_url(row.url)
+        keeper = keepers.setdefault((row.user_id, row.canonical_url), row)
+        if keeper is row:
+            continue
+
+        print(f"  user {row.user_id}: merging #{row.id} {row.url} into #{keeper.id} {keeper.url}")
+        merged += 1
+        if dry_run:
+            continue
+        keeper.is_active = keeper.is_active or row.is_active
+        keeper.scrape_frequency_hours = min(keeper.scrape_frequency_hours or 6, row.scrape_frequency_hours or 6)
+        if row.last_scraped_at and (not keeper.last_scraped_at or row.last_scraped_at > keeper.last_scraped_at):
+            keeper.last_scraped_at = row.last_scraped_at
+        ScrapeRun.query.filter_by(monitored_url_id=row.id).update({"monitored_url_id": keeper.id})
+        db.session.delete(row)
+    return merged
+
+
+def merge_job_notifications(dry_run):
+    """Fill canonical_source_url and merge notifications with the same title from one source."""
+    keepers = {}
+    merged = 0
+    for job in JobNotification.query.order_by(JobNotification.id).all():
+        job.canonical_source_url = canonicalize_url(job.source_url or job.pdf_url or "Not specified")
+        keeper = keepers.setdefault((job.job_title, job.canonical_source_url), job)
+        if keeper is job:
+            continue
+
+        merged += 1
+        if dry_run:
+            continue
+        alerted = {alert.user_id for alert in SentAlert.query.filter_by(job_notification_id=keeper.id)}
+        for alert in SentAlert.query.filter_by(job_notification_id=job.id).all():
+            if alert.user_id in alerted:
+                db.session.delete(alert)
+            else:
+                alert.job_notification_id = keeper.id
+                alerted.add(alert.user_id)
+        db.session.flush()
+        db.session.delete(job)
+    return merged
+
+
+def rekey_seen_items(dry_run):
+    """Move seen items recorded under raw URLs to their canonical source."""
+    groups = {}
+    for item in SeenItem.query.order_by(SeenItem.id).all():
+        groups.setdefault((canonicalize_url(item.source_url), item.item_key), []).append(item)
+
+    moves = []
+    for (canonical, _), items in groups.items():
+        # Keep a row already under the canonical URL, else the oldest.
+        keeper = next((item for item in items if item.source_url == canonical), items[0])
+        if not dry_run:
+            for item in items:
+                if item is not keeper:
+                    db.session.delete(item)
+        if keeper.source_url != canonical:
+            moves.append((keeper, canonical))
+
+    if not dry_run:
+        # The deletes must reach the database before any update takes over
+        # their (source_url, item_key); a flush issues updates first.
+        db.session.flush()
+        for keeper, canonical in moves:
+            keeper.source_url = canonical
+    return len(moves)
+
+
+def backfill(dry_run=False):
+    add_columns()
+    with app.app_context():
+        print("Canonicalizing monitored URLs...")
+        merged_urls = merge_monitored_urls(dry_run)
+        print("Canonicalizing job notification sources...")
+        merged_jobs = merge_job_notifications(dry_run)
+        moved_items = rekey_seen_items(dry_run)
+
+        if dry_run:
+            db.session.rollback()
+            print(f"Dry run: would merge {merged_urls} monitored URLs and {merged_jobs} notifications, "
+                  f"re-key {moved_items} seen items.")
+            return
+        db.session.commit()
+        print(f"✓ Merged {merged_urls} monitored URLs and {merged_jobs} notifications, "
+              f"re-keyed {moved_items} seen items.")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] not in ("--dry-run",):
+        print("Usage: python migrate_canonical_urls.py [--dry-run]")
+        sys.exit(1)
+    backfill(dry_run="--dry-run" in sys.argv[1:])
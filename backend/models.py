@@ -3,6 +3,8 @@ from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
 from werkzeug.security import check_password_hash, generate_password_hash
 
+from services.url_canonical import canonicalize_url
+
 db = SQLAlchemy()
 
 
@@ -55,13 +57,75 @@ class MonitoredURL(db.Model):
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
     url = db.Column(db.String(2048), nullable=False)
+    # `canonicalize_url(url)`, filled on insert; rows sharing it are one source.
+    canonical_url = db.Column(
+        db.String(2048),
+        nullable=True,
+        index=True,
+        default=lambda context: canonicalize_url(context.get_current_parameters()["url"]),
+    )
     website_name = db.Column(db.String(150), nullable=True)
     scraper_type = db.Column(db.String(20), nullable=False)
     last_scraped_at = db.Column(db.DateTime, nullable=True)
+    # Last run that found items the source had not produced before.
+    last_new_notification_at = db.Column(db.DateTime, nullable=True)
     is_active = db.Column(db.Boolean, nullable=False, default=True)
     scrape_frequency_hours = db.Column(db.Integer, nullable=False, default=6)
+    http_validators = db.Column(db.JSON, nullable=True)
+    content_fingerprint = db.Column(db.String(64), nullable=True)
+    # Digests of the listing's (href, text) entries from the last parsed run.
+    listing_snapshot = db.Column(db.JSON, nullable=True)
+    # "static" or "dynamic"; NULL until the first scrape detects it.
+    render_strategy = db.Column(db.String(20), nullable=True)
+    # Set when a user adds the URL; the scheduler leader then alerts them to
+    # notices the source already lists and clears it.
+    alerts_backfill_pending = db.Column(db.Boolean, nullable=True, default=False)
+    runs_since_static_probe = db.Column(db.Integer, nullable=True, default=0)
 
     user = db.relationship("User", back_populates="monitored_urls")
+    scrape_runs = db.relationship(
+        "ScrapeRun", back_populates="monitored_url", cascade="all, delete-orphan", lazy=True
+    )
+
+
+class ScrapeRun(db.Model):
+    __tablename__ = "scrape_runs"
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    monitored_url_id = db.Column(
+        db.Integer, db.ForeignKey("monitored_urls.id"), nullable=False, index=True
+    )
+    started_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    success = db.Column(db.Boolean, nullable=False, default=False)
+    notifications_found = db.Column(db.Integer, nullable=False, default=0)
+    new_notifications_saved = db.Column(db.Integer, nullable=False, default=0)
+    fingerprint_hit = db.Column(db.Boolean, nullable=True)
+    stats = db.Column(db.JSON, nullable=True)
+
+    monitored_url = db.relationship("MonitoredURL", back_populates="scrape_runs")
+
+
+class SeenItem(db.Model):
+    __tablename__ = "seen_items"
+    __table_args__ = (db.UniqueConstraint("source_url", "item_key", name="uq_seen_items_source_key"),)
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    source_url = db.Column(db.String(2048), nullable=False, index=True)
+    # SHA-256 hex digest of the scraper's item key (PDF URL, or title::date).
+    item_key = db.Column(db.String(64), nullable=False)
+    first_seen_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+
+class SchedulerLease(db.Model):
+    __tablename__ = "scheduler_leases"
+
+    name = db.Column(db.String(64), primary_key=True)
+    holder = db.Column(db.String(255), nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+    renewed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    # Scraper counters the holder publishes on each renewal; served by /health.
+    status = db.Column(db.JSON, nullable=True)
 
 
 class JobNotification(db.Model):
@@ -69,6 +133,7 @@ class JobNotification(db.Model):
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     source_url = db.Column(db.String(2048), nullable=True)
+    canonical_source_url = db.Column(db.String(2048), nullable=True, index=True)
     job_title = db.Column(db.String(255), nullable=False)
     organization = db.Column(db.String(255), nullable=True)
     notification_date = db.Column(db.Date, nullable=True)
@@ -88,6 +153,10 @@ class JobNotification(db.Model):
 
 class SentAlert(db.Model):
     __tablename__ = "sent_alerts"
+    # One alert per user and notification, however many runs race to send it.
+    __table_args__ = (
+        db.UniqueConstraint("user_id", "job_notification_id", name="uq_sent_alerts_user_notification"),
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
@@ -2,9 +2,11 @@ from urllib.parse import urlparse
 
 import requests
 from flask import Blueprint, current_app, jsonify, request
+from sqlalchemy import or_
 from sqlalchemy.exc import SQLAlchemyError
 
 from models import MonitoredURL, User, UserPreference, db
+from services.url_canonical import canonicalize_url
 
 preference_bp = Blueprint("preference_routes", __name__)
 
@@ -39,10 +41,8 @@ def detect_scraper_type(url):
         if "application/pdf" in content_type or url.lower().endswith(".pdf"):
             return "pdf"
 
+        # Client-rendered pages often link PDFs too; they still need a browser.
         body = response.text.lower()
-        if ".pdf" in body:
-            return "pdf"
-
         dynamic_markers = (
             "__next_data__",
             "ng-version",
@@ -52,6 +52,9 @@ def detect_scraper_type(url):
         )
         if any(marker in body for marker in dynamic_markers):
             return "dynamic"
+
+        if ".pdf" in body:
+            return "pdf"
     except requests.RequestException:
         pass
 
@@ -82,6 +85,7 @@ def _format_url_response(monitored_url):
         "url": monitored_url.url,
         "website_name": monitored_url.website_name,
         "scraper_type": monitored_url.scraper_type,
+        "render_strategy": monitored_url.render_strategy,
         "last_scraped_at": (
             monitored_url.last_scraped_at.isoformat() if monitored_url.last_scraped_at else None
         ),
@@ -89,6 +93,18 @@ def _format_url_response(monitored_url):
     }
 
 
+def _sync_scheduled_source(canonical_url):
+    """Update the source's scrape job now if this process runs the scheduler."""
+    scheduler_service = current_app.extensions.get("scheduler_service")
+    if not scheduler_service or not canonical_url:
+        return
+    try:
+        scheduler_service.sync_source(canonical_url)
+    except Exception:
+        # The leader's periodic reconciliation applies the change instead.
+        current_app.logger.exception("Could not update scrape job for %s.", canonical_url)
+
+
 @preference_bp.post("/<int:user_id>")
 def create_or_update_preferences(user_id):
     try:
@@ -210,7 +226,11 @@ def add_monitored_url(user_id):
         if not parsed.netloc:
             return jsonify({"error": "url must include a valid domain"}), 400
 
-        existing = MonitoredURL.query.filter_by(user_id=user_id, url=clean_url).first()
+        canonical_url = canonicalize_url(clean_url)
+        existing = MonitoredURL.query.filter(
+            MonitoredURL.user_id == user_id,
+            or_(MonitoredURL.canonical_url == canonical_url, MonitoredURL.url == clean_url),
+        ).first()
         if existing:
             return jsonify({"error": "URL already exists for this user"}), 400
 
@@ -224,14 +244,23 @@ def add_monitored_url(user_id):
         if scraper_type not in ALLOWED_SCRAPER_TYPES:
             return jsonify({"error": "scraper_type must be one of: html, pdf, dynamic"}), 400
 
+        # Only an explicit "dynamic" is seeded; otherwise the first scrape
+        # detects the rendering strategy, so adding a URL makes no request.
+        render_strategy = "dynamic" if scraper_type == "dynamic" else None
+
         monitored_url = MonitoredURL(
             user_id=user_id,
             url=clean_url,
+            canonical_url=canonical_url,
             website_name=website_name.strip(),
             scraper_type=scraper_type,
+            render_strategy=render_strategy,
+            # The scheduler leader alerts the user to notices already listed.
+            alerts_backfill_pending=True,
         )
         db.session.add(monitored_url)
         db.session.commit()
+        _sync_scheduled_source(canonical_url)
 
         return (
             jsonify({"message": "URL added", "monitored_url": _format_url_response(monitored_url)}),
@@ -275,8 +304,10 @@ def delete_monitored_url(user_id, url_id):
         if not monitored_url:
             return jsonify({"error": "Monitored URL not found"}), 404
 
+        canonical_url = monitored_url.canonical_url
         db.session.delete(monitored_url)
         db.session.commit()
+        _sync_scheduled_source(canonical_url)
         return jsonify({"message": "URL removed"}), 200
     except SQLAlchemyError:
         db.session.rollback()
@@ -1,4 +1,11 @@
+from .async_engine import AsyncScrapeEngine
+from .browser_pool import BrowserPool, browser_pool_stats, get_browser_pool
+from .circuit_breaker import CircuitBreakerRegistry, classify_error, get_circuit_breakers
 from .generic_scraper import GenericScraper
+from .http_session import SessionPool, configure_session_pool, get_session_pool
+from .pdf_cache import PDFTextCache, get_pdf_cache
+from .pdf_extraction import PDFExtractionService, get_pdf_extractor
+from .rate_limiter import DomainRateLimiter, configure_rate_limiter, get_rate_limiter
 from .ssc_scraper import SSCScraper
 from .state_psc_scraper import StatePSCScraper
 from .university_scraper import UniversityScraper
@@ -8,6 +15,9 @@ from .upsc_scraper import UPSCScraper
 def get_scraper(url, scraper_type=None, config=None):
     """
     Auto-detect which scraper to use based on URL.
+
+    All returned scrapers share the process-wide keep-alive session pool unless
+    `config["session_pool"]` overrides it.
     """
     normalized = (url or "").lower()
     config = config or {}
@@ -26,6 +36,19 @@ def get_scraper(url, scraper_type=None, config=None):
     return GenericScraper(url=url, config=config)
 
 
+def runtime_stats():
+    """Return this process's counters for the shared scraping resources."""
+    pdf_cache = get_pdf_cache()
+    return {
+        "http_pool": get_session_pool().stats(),
+        "rate_limiter": get_rate_limiter().stats(),
+        "browser_pool": browser_pool_stats(),
+        "circuit_breakers": get_circuit_breakers().stats(),
+        "pdf_cache": pdf_cache.stats() if pdf_cache else None,
+        "pdf_extractor": get_pdf_extractor().stats(),
+    }
+
+
 __all__ = [
     "UPSCScraper",
     "SSCScraper",
@@ -33,4 +56,22 @@ __all__ = [
     "StatePSCScraper",
     "GenericScraper",
     "get_scraper",
+    "runtime_stats",
+    "AsyncScrapeEngine",
+    "SessionPool",
+    "get_session_pool",
+    "configure_session_pool",
+    "DomainRateLimiter",
+    "get_rate_limiter",
+    "configure_rate_limiter",
+    "BrowserPool",
+    "get_browser_pool",
+    "browser_pool_stats",
+    "CircuitBreakerRegistry",
+    "classify_error",
+    "get_circuit_breakers",
+    "PDFTextCache",
+    "get_pdf_cache",
+    "PDFExtractionService",
+    "get_pdf_extractor",
 ]
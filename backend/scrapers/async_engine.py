@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any
+from urllib.parse import urlparse
+
+from .base_scraper import BaseScraper
+
+ScrapeJob = tuple[Any, BaseScraper, "datetime | date | str | None"]
+
+
+class AsyncScrapeEngine:
+    """
+    Run scrapers concurrently on one long-lived asyncio event loop.
+
+    Each job is split into its two stages:
+
+    1. `fetch_listing_source` (network, Selenium fallback) runs on a bounded
+       I/O thread pool.
+    2. `parse_listing_source` + `parse_listing` (BeautifulSoup, regex
+       extraction, linked PDFs) runs on a separate parse pool so HTML parsing
+       never happens on the event loop.
+
+    The loop runs on a background thread started on first use, and its
+    global semaphore, per-host semaphores and thread pools are shared by
+    every caller: batches from `run` and single scheduled scrapes from
+    `scrape` queue for the same slots, so the caps hold process-wide no
+    matter how many scheduler threads submit work. Results keep the
+    `scrape()` contract: a list of notification dictionaries per job.
+
+    Only the scheduling is asynchronous. The scrapers' own waits (rate
+    limiting, retry backoff, waiting for a pooled browser) are blocking
+    `time.sleep` calls; they hold an I/O pool thread, never the event loop,
+    so a host that is throttling ties up at most `per_host_concurrency`
+    of the `max_concurrency` I/O threads.
+
+    Example:
+        engine = AsyncScrapeEngine(max_concurrency=20, per_host_concurrency=2)
+        results = engine.run([(url_id, scraper, last_scraped_at), ...])
+        notifications = engine.scrape(scraper, last_scraped_at)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        per_host_concurrency: int | None = None,
+        parse_workers: int | None = None,
+    ) -> None:
+        self.max_concurrency = int(
+            max_concurrency or os.getenv("SCRAPER_MAX_CONCURRENCY", 16)
+        )
+        self.per_host_concurrency = int(
+            per_host_concurrency or os.getenv("SCRAPER_PER_HOST_CONCURRENCY", 2)
+        )
+        self.parse_workers = int(
+            parse_workers or os.getenv("SCRAPER_PARSE_WORKERS", os.cpu_count() or 2)
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._global_limit: asyncio.Semaphore | None = None
+        # Per-host semaphores and the number of jobs queued or running for
+        # each host; idle hosts are dropped. Only touched on the loop thread.
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self._host_jobs: dict[str, int] = {}
+        self._io_executor: ThreadPoolExecutor | None = None
+        self._parse_executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._io_executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="scrape-io"
+                )
+                self._parse_executor = ThreadPoolExecutor(
+                    max_workers=self.parse_workers, thread_name_prefix="scrape-parse"
+                )
+                self._global_limit = asyncio.Semaphore(self.max_concurrency)
+                self._host_limits = {}
+                self._host_jobs = {}
+                threading.Thread(
+                    target=loop.run_forever, name="scrape-engine", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    def run(self, jobs: Iterable[ScrapeJob]) -> dict[Any, dict[str, Any]]:
+        """Run a batch of jobs to completion from synchronous code."""
+        return asyncio.run_coroutine_threadsafe(self.run_batch(jobs), self._ensure_loop()).result()
+
+    def scrape(
+        self, scraper: BaseScraper, last_scraped_time: datetime | date | str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Run one scraper under the engine's caps and wait for its notifications.
+
+        Raises:
+            RuntimeError: When fetching or parsing failed.
+        """
+        outcome = self.submit(scraper.url, scraper, last_scraped_time).result()
+        if outcome["error"] is not None:
+            raise RuntimeError(outcome["error"])
+        return outcome["notifications"]
+
+    def submit(
+        self, key: Any, scraper: BaseScraper, last_scraped_time: datetime | date | str | None = None
+    ) -> Future:
+        """Queue one job; the returned future resolves to its outcome (see `run_batch`)."""
+        return asyncio.run_coroutine_threadsafe(
+            self._run_job((key, scraper, last_scraped_time)), self._ensure_loop()
+        )
+
+    async def run_batch(self, jobs: Iterable[ScrapeJob]) -> dict[Any, dict[str, Any]]:
+        """
+        Run all jobs concurrently on the engine loop and return outcomes keyed by job key.
+
+        Each outcome is a dictionary with `notifications` (the `scrape()`
+        output), `error` (message or None) and `duration_seconds`.
+        """
+        jobs = list(jobs)
+        outcomes = await asyncio.gather(*[self._run_job(job) for job in jobs])
+        return {job[0]: outcome for job, outcome in zip(jobs, outcomes)}
+
+    def close(self) -> None:
+        """Stop the event loop and shut the thread pools down."""
+        with self._lock:
+            loop, self._loop = self._loop, None
+            executors = (self._io_executor, self._parse_executor)
+            self._io_executor = self._parse_executor = None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    async def _run_job(self, job: ScrapeJob) -> dict[str, Any]:
+        key, scraper, last_scraped_time = job
+        host = (urlparse(scraper.url).hostname or "").lower()
+        host_limit = self._host_limits.get(host)
+        if host_limit is None:
+            host_limit = self._host_limits[host] = asyncio.Semaphore(self.per_host_concurrency)
+        self._host_jobs[host] = self._host_jobs.get(host, 0) + 1
+        loop = asyncio.get_running_loop()
+
+        try:
+            async with self._global_limit, host_limit:
+                started = time.perf_counter()
+                try:
+                    page_source = await loop.run_in_executor(
+                        self._io_executor, scraper.fetch_listing_source
+                    )
+                    notifications: list[dict[str, Any]] = []
+                    if page_source is not None:
+                        notifications = await loop.run_in_executor(
+                            self._parse_executor, self._parse, scraper, page_source, last_scraped_time
+                        )
+                    error = None
+                except Exception as exc:
+                    self.logger.exception("Async scrape failed for %s", scraper.url)
+                    notifications, error = [], str(exc) or exc.__class__.__name__
+        finally:
+            self._host_jobs[host] -= 1
+            if not self._host_jobs[host]:
+                # Nobody holds or awaits the semaphore, so a later job can start afresh.
+                del self._host_jobs[host]
+                del self._host_limits[host]
+
+        return {
+            "key": key,
+            "notifications": notifications,
+            "error": error,
+            "duration_seconds": round(time.perf_counter() - started, 3),
+        }
+
+    @staticmethod
+    def _parse(
+        scraper: BaseScraper,
+        page_source: str,
+        last_scraped_time: datetime | date | str | None,
+    ) -> list[dict[str, Any]]:
+        soup = scraper.parse_listing_source(page_source)
+        if soup is None:
+            return []
+        return scraper.parse_listing(soup, last_scraped_time)
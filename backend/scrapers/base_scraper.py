@@ -1,24 +1,43 @@
 from __future__ import annotations
 
-import io
+import hashlib
 import logging
-import re
+import random
+import tempfile
 import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any
+from concurrent.futures import Future, wait
+from datetime import date, datetime
+from typing import IO, Any
+from urllib.parse import urljoin
 
-import pdfplumber
-import requests
 from bs4 import BeautifulSoup, Tag
 from requests import Response
-from requests.exceptions import RequestException
-from selenium import webdriver
+from requests.exceptions import HTTPError, RequestException
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
+
+from .browser_pool import BrowserPool, get_browser_pool
+from .circuit_breaker import (
+    PERMANENT,
+    CircuitBreakerRegistry,
+    classify_error,
+    get_circuit_breakers,
+)
+from .date_parsing import parse_date
+from .field_extraction import find_age_limit, scan_job_fields
+from .fingerprint import fingerprint_html
+from .http_session import PoolTimeout, SessionPool, get_session_pool
+from .pdf_backends import default_backend_names
+from .pdf_cache import PDFTextCache, get_pdf_cache
+from .pdf_extraction import (
+    PDFExtractionService,
+    extract_pdf_text,
+    get_pdf_extractor,
+    get_pdf_followup_executor,
+)
+from .rate_limiter import DomainRateLimiter, get_rate_limiter
+from .targeted_parse import parse_html, strainer_for
 
 
 class BaseScraper(ABC):
@@ -33,6 +52,18 @@ class BaseScraper(ABC):
         "Accept-Language": "en-US,en;q=0.9",
         "Connection": "keep-alive",
     }
+    # Bump when `extract_job_details` output changes so cached PDF details are recomputed.
+    DETAILS_VERSION = 1
+    # Markers of client-rendered pages, checked on a URL's first static fetch.
+    DYNAMIC_MARKERS = (
+        "__next_data__",
+        "ng-version",
+        "data-reactroot",
+        "window.__initial_state__",
+        'id="app"',
+    )
+    # Incremental PDF extraction stops reading pages once all of these are found.
+    PDF_TARGET_FIELDS = ("age_limit", "qualification_required", "last_date_to_apply")
 
     def __init__(self, url: str, config: dict[str, Any] | None = None) -> None:
         """
@@ -47,97 +78,729 @@ class BaseScraper(ABC):
         self.timeout = int(self.config.get("timeout", 20))
         self.max_retries = int(self.config.get("max_retries", 3))
         self.retry_delay_seconds = int(self.config.get("retry_delay_seconds", 2))
+        self.max_retry_delay_seconds = int(self.config.get("max_retry_delay_seconds", 30))
+        self.max_pdf_bytes = int(self.config.get("max_pdf_mb", 50)) * 1024 * 1024
+        # PDFs smaller than this stay in memory; larger ones spill to a temp file.
+        self.pdf_spool_bytes = int(self.config.get("pdf_spool_kb", 1024)) * 1024
+        # Pass `"pdf_cache": None` in config to disable the shared PDF text cache.
+        self.pdf_cache: PDFTextCache | None = (
+            self.config["pdf_cache"] if "pdf_cache" in self.config else get_pdf_cache()
+        )
+        # Pass `"pdf_extractor": None` in config to extract PDF text inline instead.
+        self.pdf_extractor: PDFExtractionService | None = (
+            self.config["pdf_extractor"] if "pdf_extractor" in self.config else get_pdf_extractor()
+        )
+        # Pages read per PDF before giving up on missing fields (0 disables early stopping).
+        self.pdf_page_budget = int(self.config.get("pdf_page_budget", 5)) or None
+        # Read the rest of PDFs cut short by the page budget. Off by default, as
+        # the early stop is what saves the CPU; the scheduler turns it on when a
+        # subscriber's preferences are matched against the whole text.
+        self.pdf_full_text = bool(self.config.get("pdf_full_text", False))
+        # Text backends tried in order; see `pdf_backends.default_backend_names`.
+        self.pdf_backends: tuple[str, ...] = tuple(
+            self.config.get("pdf_backends") or default_backend_names()
+        )
+        # URL -> Future resolving to the full text of PDFs returned partially.
+        self.pending_full_texts: dict[str, Future] = {}
+        # URL -> raw `extract_pdf_text` result of PDFs whose reading stopped early.
+        self._partial_pdf_extracts: dict[str, dict[str, Any]] = {}
+        self.pdf_hashes: dict[str, str] = {}
+        self.session_pool: SessionPool = self.config.get("session_pool") or get_session_pool()
+        self.rate_limiter: DomainRateLimiter = self.config.get("rate_limiter") or get_rate_limiter()
+        self.circuit_breakers: CircuitBreakerRegistry = (
+            self.config.get("circuit_breakers") or get_circuit_breakers()
+        )
+        self.browser_pool: BrowserPool = self.config.get("browser_pool") or get_browser_pool(
+            user_agent=self.DEFAULT_HEADERS["User-Agent"]
+        )
+        # Per-URL cache validators ({"etag": ..., "last_modified": ...}) from earlier runs.
+        self.http_validators: dict[str, dict[str, str]] = dict(
+            self.config.get("http_validators") or {}
+        )
+        self.not_modified_urls: set[str] = set()
+        self._requested_urls: set[str] = set()
+        # Normalized listing-page hash from the previous run, for sites without validators.
+        self.previous_fingerprint: str | None = self.config.get("content_fingerprint")
+        self.content_fingerprint: str | None = None
+        self.listing_unchanged = False
+        self.run_stats: dict[str, Any] = {}
+        # Cross-run record of processed items (`services.seen_store.SeenItemStore`), keyed
+        # by `seen_source`; None keeps deduplication within a single run only.
+        self.seen_store = self.config.get("seen_store")
+        self.seen_source: str = self.config.get("seen_source") or url
+        # Keys of items processed this run, for the caller to mark seen once saved.
+        self.new_item_keys: set[str] = set()
+        # Keys of items whose PDF could not be downloaded or read; the caller
+        # should leave them unseen so a later run reads the PDF again.
+        self.incomplete_item_keys: set[str] = set()
+        # Digests of the listing's (href, text) entries on the previous run; see `diff_listing`.
+        previous_snapshot = self.config.get("listing_snapshot")
+        self.previous_listing: set[str] | None = (
+            set(previous_snapshot) if previous_snapshot is not None else None
+        )
+        self.listing_snapshot: list[str] | None = None
+        # Build only the subtrees `listing_selectors` can match (False parses whole pages).
+        self.targeted_parse = bool(self.config.get("targeted_parse", True))
+        # Learned per-URL rendering strategy: "static" (plain HTTP), "dynamic"
+        # (Selenium) or None until the first fetch detects it.
+        self.render_strategy: str | None = self.config.get("render_strategy")
+        self.runs_since_static_probe = int(self.config.get("runs_since_static_probe") or 0)
+        self.static_probe_interval = int(self.config.get("static_probe_interval", 10))
+        self.rendered_with: str | None = None
+        self._tried_static = False
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def fetch_page(self, url: str) -> BeautifulSoup | None:
         """
         Fetch an HTML page and return a BeautifulSoup object.
 
+        Sends `If-None-Match`/`If-Modified-Since` when validators are known for
+        the URL. A 304 response adds the URL to `not_modified_urls`.
+
         Args:
             url: URL to request.
 
         Returns:
             BeautifulSoup object when successful, otherwise None.
         """
-        response = self._request_with_retry(url)
+        html = self.fetch_page_source(url)
+        if html is None:
+            return None
+        return BeautifulSoup(html, "lxml")
+
+    def fetch_page_source(self, url: str, max_retries: int | None = None) -> str | None:
+        """
+        Fetch an HTML page and return its decoded body without parsing it.
+
+        Args:
+            url: URL to request.
+            max_retries: Override for `self.max_retries`.
+
+        Returns:
+            Page source when successful, otherwise None (including on 304).
+        """
+        response = self._request_with_retry(url, conditional=True, max_retries=max_retries)
         if not response:
             return None
-        return BeautifulSoup(response.text, "lxml")
+        # Closing returns the pooled connection, including after a bodiless 304.
+        with response:
+            if response.status_code == 304:
+                return None
+            return response.text
+
+    def fetch_listing_source(self) -> str | None:
+        """
+        Fetch the listing page source, falling back to Selenium when needed.
+
+        This is the I/O half of `load_listing_page`; it never parses HTML.
+        URLs whose learned `render_strategy` is "dynamic" go straight to
+        Selenium, except every `static_probe_interval` runs, when the static
+        path is probed once (single attempt) in case the site changed. When
+        no strategy is known yet, a static page that `looks_client_rendered`
+        is fetched again with Selenium.
+
+        Returns:
+            Page source, or None when the page is unchanged since the last run
+            (HTTP 304) or could not be fetched.
+        """
+        probing = self.render_strategy == "dynamic"
+        if probing and self.runs_since_static_probe + 1 < self.static_probe_interval:
+            return self._fetch_rendered_listing()
+
+        self._tried_static = True
+        page_source = self.fetch_page_source(self.url, max_retries=1 if probing else None)
+        if page_source is not None:
+            if self.render_strategy is None and self.looks_client_rendered(page_source):
+                rendered = self._fetch_rendered_listing()
+                if rendered is not None:
+                    return rendered
+            self.rendered_with = "static"
+            return page_source
+        if self.url in self.not_modified_urls:
+            self.rendered_with = "static"
+            self.listing_unchanged = True
+            self.logger.info("Listing page not modified since last run: %s", self.url)
+            return None
+        return self._fetch_rendered_listing()
+
+    def looks_client_rendered(self, page_source: str) -> bool:
+        """Return whether static HTML carries a JavaScript framework's mount markers."""
+        body = page_source.lower()
+        return any(marker in body for marker in self.DYNAMIC_MARKERS)
+
+    def _fetch_rendered_listing(self) -> str | None:
+        page_source = self.fetch_with_selenium(self.url)
+        if not page_source:
+            return None
+        self.rendered_with = "dynamic"
+        return page_source
+
+    def export_render_state(self) -> dict[str, Any]:
+        """
+        Return the rendering strategy learned from this run, to persist per URL.
+
+        The strategy becomes whichever path delivered the page. When neither
+        did, the previous strategy is kept.
+        """
+        strategy = self.rendered_with or self.render_strategy
+        if strategy == "static" or self._tried_static:
+            runs_since_probe = 0
+        else:
+            runs_since_probe = self.runs_since_static_probe + 1
+        return {"render_strategy": strategy, "runs_since_static_probe": runs_since_probe}
+
+    def parse_listing_source(self, page_source: str) -> BeautifulSoup | None:
+        """
+        Parse listing page source unless its content is unchanged.
+
+        The page body is fingerprinted before parsing; when it matches
+        `previous_fingerprint` the page is not parsed at all. Otherwise only
+        the subtrees `listing_selectors` can match are built, and parse time
+        and tree size are recorded in `run_stats`.
+
+        Returns:
+            BeautifulSoup object, or None when the fingerprint matches.
+        """
+        self.content_fingerprint = fingerprint_html(page_source)
+        if self.previous_fingerprint and self.content_fingerprint == self.previous_fingerprint:
+            self.listing_unchanged = True
+            self.run_stats["fingerprint"] = "hit"
+            self.logger.info("Listing page content unchanged since last run: %s", self.url)
+            return None
+
+        self.run_stats["fingerprint"] = "miss"
+        strainer = strainer_for(self.listing_selectors()) if self.targeted_parse else None
+        soup, parse_stats = parse_html(page_source, strainer)
+        self.run_stats.update(parse_stats)
+        return soup
+
+    def item_key(self, item: dict[str, Any]) -> str:
+        """Return the dedup key of a notification: its PDF URL, else title and date."""
+        return item.get("pdf_url") or f"{item.get('job_title')}::{item.get('notification_date')}"
+
+    def drop_seen_items(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Remove items that `seen_store` recorded on an earlier run.
+
+        Called by `parse_listing` before any PDF is downloaded. Keys of the
+        remaining items are added to `new_item_keys`.
+        """
+        keys = [self.item_key(item) for item in items]
+        unseen = set(keys)
+        if self.seen_store is not None and unseen:
+            unseen = self.seen_store.unseen_keys(self.seen_source, unseen)
+            self._count_stat("seen_items_skipped", len(set(keys) - unseen))
+        self.new_item_keys.update(unseen)
+        return [item for item, key in zip(items, keys) if key in unseen]
+
+    def listing_entry(self, element: Tag) -> str:
+        """Return the digest of an element's (absolute href, text) pair."""
+        link = element if element.name == "a" else element.find("a", href=True)
+        href = urljoin(self.url, link["href"]) if link is not None and link.get("href") else ""
+        text = self.clean_text(element.get_text(" ", strip=True))
+        return hashlib.sha1(f"{href}\n{text}".encode("utf-8")).hexdigest()[:16]
+
+    def diff_listing(self, elements: list[Tag]) -> list[Tag]:
+        """
+        Keep only listing elements whose (href, text) entry is new since the last run.
+
+        Called by `parse_listing` on its candidate anchors or rows, before any
+        of them is parsed. The current entries become `listing_snapshot` and
+        the added/removed counts go to `run_stats`. Without a previous
+        snapshot every element counts as added.
+        """
+        entries = [self.listing_entry(element) for element in elements]
+        current = set(entries)
+        self.listing_snapshot = sorted(current)
+        if self.previous_listing is None:
+            added, removed = current, set()
+        else:
+            added, removed = current - self.previous_listing, self.previous_listing - current
+
+        self.run_stats["listing_entries"] = len(current)
+        self.run_stats["listing_added"] = len(added)
+        self.run_stats["listing_removed"] = len(removed)
+        self.logger.info(
+            "Listing diff for %s: %s added, %s removed, %s total",
+            self.url,
+            len(added),
+            len(removed),
+            len(current),
+        )
+        return [element for element, entry in zip(elements, entries) if entry in added]
+
+    def export_listing_snapshot(self) -> list[str] | None:
+        """Return the listing entries to persist, or None to keep the previous snapshot."""
+        return self.listing_snapshot
+
+    def listing_selectors(self) -> list[str] | None:
+        """
+        Return every CSS selector `parse_listing` queries, fallbacks included.
+
+        The listing page is parsed into a tree holding only the subtrees these
+        selectors can match. None (the default) parses the whole page.
+        """
+        return None
+
+    def load_listing_page(self) -> BeautifulSoup | None:
+        """
+        Fetch and parse the scraper's listing page.
+
+        Returns:
+            BeautifulSoup object, or None when the page is unchanged since the
+            last run (HTTP 304 or same fingerprint) or could not be fetched.
+        """
+        page_source = self.fetch_listing_source()
+        if page_source is None:
+            return None
+        return self.parse_listing_source(page_source)
+
+    def scrape(self, last_scraped_time: datetime | date | str | None = None) -> list[dict[str, Any]]:
+        """
+        Scrape the listing page and return new notification dictionaries.
+
+        Args:
+            last_scraped_time: Time of the previous successful scrape, if any.
+
+        Returns:
+            List of notification dictionaries, empty when nothing changed.
+        """
+        soup = self.load_listing_page()
+        if soup is None:
+            return []
+        return self.parse_listing(soup, last_scraped_time)
 
     def fetch_with_selenium(self, url: str) -> str | None:
         """
         Fetch dynamic content using headless Chrome and return page source.
 
+        A warm browser is leased from the shared `BrowserPool` instead of
+        launching Chrome for every call. Only navigation failures (timeouts
+        and network errors while loading the page) count against the host's
+        circuit breaker; a pool lease timeout or a broken driver is a local
+        problem and just releases an admitted trial request.
+
         Args:
             url: URL to load in browser.
 
         Returns:
             Page source HTML string when successful, otherwise None.
         """
-        options = Options()
-        options.add_argument("--headless=new")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument(f"user-agent={self.DEFAULT_HEADERS['User-Agent']}")
+        if not self.circuit_breakers.allow_request(url):
+            self.logger.warning("Circuit open for %s; skipping Selenium fetch.", url)
+            self.run_stats["circuit_open"] = True
+            return None
 
-        driver = None
+        navigation_error: Exception | None = None
         try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
-            driver.set_page_load_timeout(self.timeout)
-            driver.get(url)
-            WebDriverWait(driver, self.timeout).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
-            )
-            return driver.page_source
-        except (WebDriverException, TimeoutException) as exc:
+            with self.browser_pool.lease(timeout=self.timeout) as driver:
+                driver.set_page_load_timeout(self.timeout)
+                self._throttle(url)
+                try:
+                    driver.get(url)
+                    WebDriverWait(driver, self.timeout).until(
+                        lambda d: d.execute_script("return document.readyState") == "complete"
+                    )
+                except Exception as exc:
+                    if self._is_navigation_error(exc):
+                        navigation_error = exc
+                    raise
+                page_source = driver.page_source
+        except Exception as exc:
+            # Every error must settle an admitted trial request.
+            if exc is navigation_error:
+                self.circuit_breakers.record_failure(url)
+            else:
+                self.circuit_breakers.release_trial(url)
             self.logger.error("Selenium fetch failed for %s: %s", url, exc)
             return None
-        finally:
-            if driver is not None:
-                driver.quit()
+        self.circuit_breakers.record_success(url)
+        return page_source
+
+    @staticmethod
+    def _is_navigation_error(exc: BaseException) -> bool:
+        """Return whether a Selenium error came from the remote page rather than the driver."""
+        if isinstance(exc, TimeoutException):
+            return True
+        return isinstance(exc, WebDriverException) and "net::ERR_" in (exc.msg or "")
 
-    def download_pdf(self, pdf_url: str) -> bytes | None:
+    def download_pdf(self, pdf_url: str) -> IO[bytes] | None:
         """
-        Download PDF bytes from a URL.
+        Stream a PDF into a spooled temporary file.
+
+        Uses a conditional request like `fetch_page`; an unchanged PDF (304)
+        returns None since it was already processed on an earlier run. PDFs
+        whose Content-Length or streamed size exceeds `max_pdf_bytes` are
+        abandoned. The body is never held in memory as a whole: it is written
+        in chunks to a file that spills to disk above `pdf_spool_bytes`.
 
         Args:
             pdf_url: Direct or redirected PDF URL.
 
         Returns:
-            PDF bytes when successful, otherwise None.
+            Open binary file positioned at the start (caller must close it),
+            otherwise None.
         """
-        response = self._request_with_retry(pdf_url, stream=True)
+        response = self._request_with_retry(pdf_url, stream=True, conditional=True)
         if not response:
             return None
-        return response.content
 
-    def extract_text_from_pdf(self, pdf_bytes: bytes) -> str:
+        # Every early return must release the streamed response's pooled connection.
+        with response:
+            if response.status_code == 304:
+                return None
+            declared_size = response.headers.get("Content-Length", "")
+            if declared_size.isdigit() and int(declared_size) > self.max_pdf_bytes:
+                self.logger.warning(
+                    "Skipping PDF larger than %s bytes (%s declared): %s",
+                    self.max_pdf_bytes,
+                    declared_size,
+                    pdf_url,
+                )
+                return None
+
+            pdf_file = tempfile.SpooledTemporaryFile(max_size=self.pdf_spool_bytes)
+            digest = hashlib.sha256()
+            size = 0
+            try:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    size += len(chunk)
+                    digest.update(chunk)
+                    if size > self.max_pdf_bytes:
+                        self.logger.warning(
+                            "Aborting PDF download over %s bytes: %s", self.max_pdf_bytes, pdf_url
+                        )
+                        pdf_file.close()
+                        return None
+                    pdf_file.write(chunk)
+            except RequestException as exc:
+                self.logger.warning("PDF download interrupted for %s: %s", pdf_url, exc)
+                pdf_file.close()
+                return None
+
+        self.pdf_hashes[pdf_url] = digest.hexdigest()
+        self._count_stat("pdf_bytes_downloaded", size)
+        pdf_file.seek(0)
+        return pdf_file
+
+    def fetch_pdf_text(self, pdf_url: str) -> str | None:
+        """
+        Download a PDF and extract its text without buffering it in memory.
+
+        Returns:
+            Extracted text ("" when the PDF has no text layer), or None when
+            the PDF was not downloaded (failure, unchanged, or too large).
+        """
+        pdf_file = self.download_pdf(pdf_url)
+        if pdf_file is None:
+            return None
+        with pdf_file:
+            return self.extract_text_from_pdf(pdf_file)
+
+    def fetch_pdf_details(self, pdf_url: str) -> tuple[str, dict[str, Any]] | None:
+        """
+        Return `(text, extract_job_details(text))` for one PDF.
+
+        See `fetch_pdf_details_many`; prefer that when a page links several PDFs.
+        """
+        return self.fetch_pdf_details_many([pdf_url]).get(pdf_url)
+
+    def fetch_pdf_details_many(
+        self, pdf_urls: list[str]
+    ) -> dict[str, tuple[str, dict[str, Any]] | None]:
         """
-        Extract text from PDF bytes with pdfplumber.
+        Fetch text and job details for all PDFs linked from a page.
+
+        PDFs are downloaded one after another (they share the host's rate
+        limit) and each is handed to `pdf_extractor` as soon as it arrives, so
+        text extraction runs in worker processes while the next download is in
+        flight. Results are collected as extractions finish. Without an
+        extractor (`"pdf_extractor": None` in config) text is extracted inline.
+
+        Extraction is incremental: pages are read one at a time and stop once
+        every field in `PDF_TARGET_FIELDS` is found, or after
+        `pdf_page_budget` pages. For PDFs cut short this way the returned text
+        is partial; when `pdf_full_text` is set the remaining pages are read
+        in the background, resuming where reading stopped, and the full text
+        is exposed through `pending_full_texts`.
+
+        When the PDF cache holds validators for a URL, a conditional request is
+        sent and a 304 is served from the cache without downloading. A
+        downloaded PDF whose body hash is already cached skips extraction.
+
+        Returns:
+            Mapping of URL to `(text, details)`, or None when the PDF could not
+            be obtained or its extraction timed out. URLs that got None for
+            any reason other than a 304 are added to `incomplete_item_keys`.
+        """
+        results: dict[str, tuple[str, dict[str, Any]] | None] = {}
+        pending: dict[Future, str] = {}
+        pdf_files: dict[str, IO[bytes]] = {}
+        stop_check = (
+            JobFieldsFound(type(self), self.PDF_TARGET_FIELDS) if self.pdf_page_budget else None
+        )
+        try:
+            for pdf_url in dict.fromkeys(pdf_urls):
+                pdf_file, cached_result = self._open_pdf(pdf_url)
+                if pdf_file is None:
+                    results[pdf_url] = cached_result
+                    continue
+                pdf_files[pdf_url] = pdf_file
+                if self.pdf_extractor is None:
+                    results[pdf_url] = self._finish_pdf(
+                        pdf_url, self._extract_inline(pdf_url, pdf_file, stop_check)
+                    )
+                else:
+                    future = self.pdf_extractor.submit(
+                        pdf_file, self.pdf_page_budget, stop_check, self.pdf_backends
+                    )
+                    pending[future] = pdf_url
+
+            if pending:
+                started = time.perf_counter()
+                for pdf_url, extracted in self.pdf_extractor.as_completed(pending):
+                    results[pdf_url] = (
+                        None if extracted is None else self._finish_pdf(pdf_url, extracted)
+                    )
+                self.run_stats["pdf_extract_wait_seconds"] = round(
+                    self.run_stats.get("pdf_extract_wait_seconds", 0)
+                    + time.perf_counter()
+                    - started,
+                    3,
+                )
+            if self.pdf_full_text:
+                for pdf_url, partial in self._partial_pdf_extracts.items():
+                    if pdf_url in pdf_files and pdf_url not in self.pending_full_texts:
+                        self._complete_pdf_text(pdf_url, pdf_files[pdf_url], partial)
+        finally:
+            for pdf_file in pdf_files.values():
+                pdf_file.close()
+        # `item_key` of an item with a PDF is its PDF URL.
+        self.incomplete_item_keys.update(
+            pdf_url
+            for pdf_url, result in results.items()
+            if result is None and pdf_url not in self.not_modified_urls
+        )
+        return results
+
+    def _extract_inline(
+        self, pdf_url: str, pdf_file: IO[bytes], stop_check: JobFieldsFound | None
+    ) -> dict[str, Any]:
+        try:
+            return extract_pdf_text(
+                pdf_file, None, self.pdf_page_budget, stop_check, self.pdf_backends
+            )
+        except RuntimeError as exc:
+            self.logger.error("PDF text extraction failed for %s: %s", pdf_url, exc)
+            return {"text": "", "pages_read": 0, "page_count": 0, "backend": None}
+
+    def _finish_pdf(
+        self, pdf_url: str, extracted: dict[str, Any]
+    ) -> tuple[str, dict[str, Any]]:
+        pdf_text = self.clean_text(extracted["text"])
+        details = self.extract_job_details(pdf_text)
+        self._count_stat("pdf_pages_read", extracted["pages_read"])
+        if extracted["backend"]:
+            self._count_stat(f"pdf_extracted_with_{extracted['backend']}")
+        if extracted["pages_read"] < extracted["page_count"]:
+            # Partial text is never cached; it is stored once the full text is known.
+            self._partial_pdf_extracts[pdf_url] = extracted
+            self._count_stat("pdf_pages_skipped", extracted["page_count"] - extracted["pages_read"])
+        elif self.pdf_cache is not None:
+            self.pdf_cache.record(hit=False)
+            self._count_stat("pdf_cache_misses")
+            self._cache_pdf_text(pdf_url, pdf_text, details)
+        return pdf_text, details
+
+    def _complete_pdf_text(self, pdf_url: str, pdf_file: IO[bytes], partial: dict[str, Any]) -> None:
+        """
+        Read the rest of a partially read PDF without waiting for it.
+
+        Reading resumes after the last page already read, with the backend
+        that read it, so no page is extracted twice. Joining the texts,
+        detail extraction and caching run on the follow-up thread pool, and
+        so do callbacks added to the `pending_full_texts` future.
+        """
+        full_text: Future = Future()
+        full_text.set_running_or_notify_cancel()
+        followup = get_pdf_followup_executor()
+        start_page = partial["pages_read"]
+        backends = (partial["backend"],) if partial["backend"] else self.pdf_backends
+
+        def _complete(rest: dict[str, Any] | None) -> None:
+            try:
+                pdf_text = None
+                if rest is not None:
+                    pdf_text = self.clean_text("\n".join(filter(None, (partial["text"], rest["text"]))))
+                if pdf_text and self.pdf_cache is not None:
+                    self.pdf_cache.record(hit=False)
+                    self._cache_pdf_text(pdf_url, pdf_text, self.extract_job_details(pdf_text))
+                full_text.set_result(pdf_text or None)
+            except Exception as exc:
+                full_text.set_exception(exc)
+
+        if self.pdf_extractor is None:
+            pdf_file.seek(0)
+            pdf_bytes = pdf_file.read()
+
+            def _read_rest() -> None:
+                try:
+                    rest = extract_pdf_text(pdf_bytes, backends=backends, start_page=start_page)
+                except RuntimeError as exc:
+                    self.logger.error("PDF text extraction failed for %s: %s", pdf_url, exc)
+                    rest = None
+                _complete(rest)
+
+            followup.submit(_read_rest)
+        else:
+            future = self.pdf_extractor.submit(pdf_file, backends=backends, start_page=start_page)
+            future.add_done_callback(
+                lambda done: followup.submit(_complete, self.pdf_extractor.outcome(done, pdf_url))
+            )
+        self.pending_full_texts[pdf_url] = full_text
+
+    def complete_full_texts(
+        self, notifications: list[dict[str, Any]], timeout: float | None = None
+    ) -> int:
+        """
+        Wait for `pending_full_texts` and fold them into scraped notifications.
+
+        Each notification whose PDF was read partially gets the full text as
+        `full_details`, and fields the first pages did not state are filled
+        from it, so the notification is saved and matched on the whole
+        document. Texts not ready within `timeout` seconds stay partial.
+
+        Returns:
+            Number of notifications completed.
+        """
+        waiting = [
+            item for item in notifications if item.get("pdf_url") in self.pending_full_texts
+        ]
+        if not waiting:
+            return 0
+        futures = {self.pending_full_texts[item["pdf_url"]] for item in waiting}
+        wait(futures, timeout=timeout)
+
+        completed = 0
+        for item in waiting:
+            future = self.pending_full_texts[item["pdf_url"]]
+            if not future.done() or future.cancelled() or future.exception() or not future.result():
+                self.logger.warning("Full PDF text not ready; keeping partial text for %s", item["pdf_url"])
+                continue
+            pdf_text = future.result()
+            details = self.extract_job_details(pdf_text)
+            item["full_details"] = pdf_text
+            for field in ("age_limit", "qualification_required"):
+                if item.get(field) in (None, "", "Not specified") and details.get(field):
+                    item[field] = details[field]
+            if not item.get("last_date_to_apply"):
+                item["last_date_to_apply"] = details.get("last_date_to_apply")
+            completed += 1
+        self._count_stat("pdf_full_texts_completed", completed)
+        return completed
+
+    def _cache_pdf_text(self, pdf_url: str, pdf_text: str, details: dict[str, Any]) -> None:
+        self.pdf_cache.put(
+            pdf_url,
+            self.pdf_hashes[pdf_url],
+            pdf_text,
+            details,
+            self.DETAILS_VERSION,
+            validators=self.http_validators.get(pdf_url),
+        )
+
+    def _open_pdf(
+        self, pdf_url: str
+    ) -> tuple[IO[bytes] | None, tuple[str, dict[str, Any]] | None]:
+        """Return `(pdf_file, None)` when the PDF needs extracting, else `(None, cached result)`."""
+        if self.pdf_cache is None:
+            return self.download_pdf(pdf_url), None
+
+        cached = self.pdf_cache.latest_for_url(pdf_url)
+        # The cache, not the per-URL validators, decides whether a 304 is acceptable.
+        if cached and cached["validators"]:
+            self.http_validators[pdf_url] = cached["validators"]
+        else:
+            self.http_validators.pop(pdf_url, None)
+
+        pdf_file = self.download_pdf(pdf_url)
+        if pdf_file is None:
+            if cached and pdf_url in self.not_modified_urls:
+                return None, self._cached_pdf_details(cached)
+            return None, None
+
+        cached = self.pdf_cache.get(pdf_url, self.pdf_hashes[pdf_url])
+        if cached:
+            pdf_file.close()
+            return None, self._cached_pdf_details(cached)
+        return pdf_file, None
+
+    def _cached_pdf_details(self, entry: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        self.pdf_cache.record(hit=True)
+        self._count_stat("pdf_cache_hits")
+        details = entry["details"]
+        if details is None or entry["details_version"] != self.DETAILS_VERSION:
+            details = self.extract_job_details(entry["text"])
+            self.pdf_cache.update_details(
+                entry["url"], entry["content_hash"], details, self.DETAILS_VERSION
+            )
+        return entry["text"], details
+
+    def _count_stat(self, key: str, amount: int = 1) -> None:
+        self.run_stats[key] = self.run_stats.get(key, 0) + amount
+
+    def export_http_validators(self) -> dict[str, dict[str, str]]:
+        """
+        Return cache validators to persist for the next run.
+
+        When the listing page was unchanged, nothing else was requested, so all
+        known validators are kept. Otherwise only URLs requested in this run
+        are kept, which drops PDFs that have left the listing.
+        """
+        if self.listing_unchanged:
+            return dict(self.http_validators)
+        return {
+            url: validators
+            for url, validators in self.http_validators.items()
+            if url in self._requested_urls
+        }
+
+    def extract_text_from_pdf(self, pdf_source: bytes | IO[bytes]) -> str:
+        """
+        Extract text from a PDF with the configured text backends.
+
+        Backends in `pdf_backends` are tried in order, falling back to the
+        next when one fails or returns no text.
 
         Args:
-            pdf_bytes: Raw PDF bytes.
+            pdf_source: Raw PDF bytes, or a seekable binary file.
 
         Returns:
             Cleaned text extracted from all pages, or empty string on failure.
         """
-        if not pdf_bytes:
+        if not pdf_source:
             return ""
+        if isinstance(pdf_source, bytearray):
+            pdf_source = bytes(pdf_source)
 
         try:
-            text_parts: list[str] = []
-            with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text() or ""
-                    if page_text:
-                        text_parts.append(page_text)
-            return self.clean_text("\n".join(text_parts))
-        except Exception as exc:
+            extracted = extract_pdf_text(pdf_source, backends=self.pdf_backends)
+            return self.clean_text(extracted["text"])
+        except RuntimeError as exc:
             self.logger.error("PDF text extraction failed: %s", exc)
             return ""
 
+    @abstractmethod
+    def parse_listing(
+        self, soup: BeautifulSoup, last_scraped_time: datetime | date | str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Extract new notifications from a parsed listing page.
+
+        Must be implemented by child scrapers.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def parse_notification(self, html_element: Tag) -> dict[str, Any]:
         """
@@ -149,7 +812,7 @@ class BaseScraper(ABC):
 
     def extract_job_details(self, text: str) -> dict[str, Any]:
         """
-        Extract job attributes using regex and keyword-based parsing.
+        Extract job attributes with a single precompiled scan (see `field_extraction`).
 
         Args:
             text: Raw notification text.
@@ -158,45 +821,24 @@ class BaseScraper(ABC):
             Dictionary with common extracted fields.
         """
         cleaned = self.clean_text(text)
-        lower = cleaned.lower()
-
-        title_match = re.search(
-            r"(recruitment|notification|advertisement)\s*(for)?\s*([A-Za-z0-9 /-]{5,120})",
-            cleaned,
-            flags=re.IGNORECASE,
-        )
-        post_count_match = re.search(
-            r"(vacanc(?:y|ies)|posts?)\s*[:\-]?\s*(\d{1,6})",
-            cleaned,
-            flags=re.IGNORECASE,
-        )
-        date_match = re.search(
-            r"(last\s+date(?:\s+to\s+apply)?|apply\s+before)\s*[:\-]?\s*([^\n,;]+)",
-            cleaned,
-            flags=re.IGNORECASE,
-        )
+        fields = scan_job_fields(cleaned)
 
         qualification = ""
-        qualification_pattern = re.search(
-            r"(qualification|eligible|eligibility)\s*[:\-]?\s*([^\n]{5,200})",
-            cleaned,
-            flags=re.IGNORECASE,
-        )
-        if qualification_pattern:
-            qualification = self.clean_text(qualification_pattern.group(2))
-        elif any(k in lower for k in ["graduate", "12th", "10th", "diploma", "degree"]):
+        if fields["qualification"]:
+            qualification = self.clean_text(fields["qualification"])
+        elif fields["qualification_hint"]:
             qualification = "Mentioned in notification"
 
         parsed_last_date = None
-        if date_match:
-            parsed_last_date = self.parse_date(date_match.group(2))
+        if fields["last_date"]:
+            parsed_last_date = self.parse_date(fields["last_date"])
 
         return {
-            "job_title": self.clean_text(title_match.group(3)) if title_match else "",
-            "age_limit": self.extract_age_limit(cleaned),
+            "job_title": self.clean_text(fields["title"]) if fields["title"] else "",
+            "age_limit": self.clean_text(fields["age_limit"]) if fields["age_limit"] else "",
             "qualification_required": qualification,
             "last_date_to_apply": parsed_last_date.isoformat() if parsed_last_date else None,
-            "vacancy_count": int(post_count_match.group(2)) if post_count_match else None,
+            "vacancy_count": int(fields["vacancies"]) if fields["vacancies"] else None,
         }
 
     def clean_text(self, text: str) -> str:
@@ -211,8 +853,8 @@ class BaseScraper(ABC):
         """
         if not text:
             return ""
-        text = re.sub(r"\s+", " ", text)
-        return text.strip()
+        # str.split() uses the same whitespace definition as the regex `\s`.
+        return " ".join(text.split())
 
     def parse_date(self, date_string: str) -> datetime.date | None:
         """
@@ -224,34 +866,11 @@ class BaseScraper(ABC):
             - 15-Feb-2025
             - 15 February 2025
             - 2025-02-15
-        """
-        if not date_string:
-            return None
-
-        candidate = self.clean_text(date_string)
-        formats = [
-            "%d/%m/%Y",
-            "%d-%m-%Y",
-            "%d-%b-%Y",
-            "%d-%B-%Y",
-            "%d %b %Y",
-            "%d %B %Y",
-            "%Y-%m-%d",
-        ]
-
-        for date_format in formats:
-            try:
-                return datetime.strptime(candidate, date_format).date()
-            except ValueError:
-                continue
 
-        embedded = re.search(
-            r"(\d{1,2}[/-][A-Za-z0-9]{1,3}[/-]\d{2,4}|\d{4}-\d{2}-\d{2})",
-            candidate,
-        )
-        if embedded:
-            return self.parse_date(embedded.group(1))
-        return None
+        Non-date strings are rejected cheaply and results are memoized; see
+        `date_parsing.parse_date`.
+        """
+        return parse_date(date_string)
 
     def extract_age_limit(self, text: str) -> str:
         """
@@ -264,19 +883,8 @@ class BaseScraper(ABC):
         """
         if not text:
             return ""
-
-        patterns = [
-            r"\b(\d{1,2}\s*[-to]+\s*\d{1,2}\s*years?)\b",
-            r"\b(below\s*\d{1,2}\s*years?)\b",
-            r"\b(upper\s*age\s*limit\s*[:\-]?\s*\d{1,2}\s*years?)\b",
-            r"\b(max(?:imum)?\s*\d{1,2}\s*years?)\b",
-            r"\b(min(?:imum)?\s*\d{1,2}\s*years?)\b",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, flags=re.IGNORECASE)
-            if match:
-                return self.clean_text(match.group(1))
-        return ""
+        age_limit = find_age_limit(text)
+        return self.clean_text(age_limit) if age_limit else ""
 
     def safe_parse_notifications(self, elements: list[Tag]) -> list[dict[str, Any]]:
         """
@@ -298,43 +906,158 @@ class BaseScraper(ABC):
                 self.logger.warning("Failed to parse one notification element: %s", exc)
         return parsed
 
+    def _throttle(self, url: str) -> None:
+        """Wait for the shared per-host rate limiter and record the wait in `run_stats`."""
+        waited = self.rate_limiter.acquire(url)
+        self.run_stats["rate_limit_wait_seconds"] = round(
+            self.run_stats.get("rate_limit_wait_seconds", 0.0) + waited, 3
+        )
+
+    def _conditional_headers(self, url: str) -> dict[str, str]:
+        validators = self.http_validators.get(url) or {}
+        headers: dict[str, str] = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def _remember_validators(self, url: str, response: Response) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self.http_validators[url] = {
+                key: value
+                for key, value in (("etag", etag), ("last_modified", last_modified))
+                if value
+            }
+        else:
+            self.http_validators.pop(url, None)
+
     def _request_with_retry(
-        self, url: str, stream: bool = False, method: str = "GET"
+        self,
+        url: str,
+        stream: bool = False,
+        method: str = "GET",
+        conditional: bool = False,
+        max_retries: int | None = None,
     ) -> Response | None:
         """
         Make an HTTP request with retry logic for transient failures.
 
+        Requests go through the shared keep-alive session pool so repeated
+        fetches from the same host reuse open connections, and every attempt
+        waits on the shared per-host rate limiter first. Permanent errors
+        (e.g. 404/403) are not retried, transient ones back off exponentially
+        with jitter, and requests fail fast while the host's circuit is open.
+
         Args:
             url: URL to request.
             stream: Whether response should be streamed.
             method: HTTP method, defaults to GET.
+            conditional: Send cache validators stored for `url`, and accept a
+                304 Not Modified response as success.
+            max_retries: Override for `self.max_retries`.
 
         Returns:
             `requests.Response` when successful, otherwise None.
         """
-        for attempt in range(1, self.max_retries + 1):
+        headers = dict(self.DEFAULT_HEADERS)
+        if conditional:
+            headers.update(self._conditional_headers(url))
+            self._requested_urls.add(url)
+
+        max_retries = max_retries or self.max_retries
+        for attempt in range(1, max_retries + 1):
+            if not self.circuit_breakers.allow_request(url):
+                self.logger.warning("Circuit open for %s; failing fast.", url)
+                self.run_stats["circuit_open"] = True
+                return None
             try:
-                response = requests.request(
+                self._throttle(url)
+                response = self.session_pool.request(
                     method=method,
                     url=url,
-                    headers=self.DEFAULT_HEADERS,
+                    headers=headers,
                     timeout=self.timeout,
                     allow_redirects=True,
                     stream=stream,
                 )
+                if not response.ok:
+                    # Release the pooled connection; unread streamed bodies keep it checked out.
+                    response.close()
                 response.raise_for_status()
+                self.circuit_breakers.record_success(url)
+                if conditional:
+                    if response.status_code == 304:
+                        self.not_modified_urls.add(url)
+                    else:
+                        self._remember_validators(url, response)
                 return response
             except RequestException as exc:
+                error_kind = classify_error(exc)
+                if error_kind == PERMANENT and isinstance(exc, HTTPError):
+                    # The host answered; only transient failures count against it.
+                    self.circuit_breakers.record_success(url)
+                elif isinstance(exc, PoolTimeout):
+                    # Local connection contention says nothing about the host.
+                    self.circuit_breakers.release_trial(url)
+                else:
+                    self.circuit_breakers.record_failure(url)
+
                 self.logger.warning(
-                    "Request attempt %s/%s failed for %s: %s",
+                    "Request attempt %s/%s failed for %s (%s): %s",
                     attempt,
-                    self.max_retries,
+                    max_retries,
                     url,
+                    error_kind,
                     exc,
                 )
-                if attempt < self.max_retries:
-                    time.sleep(self.retry_delay_seconds)
+                if error_kind == PERMANENT:
+                    self.logger.error("Permanent failure for %s; not retrying.", url)
+                    break
+                if attempt < max_retries:
+                    time.sleep(self._retry_delay(attempt, exc))
                 else:
                     self.logger.error("All retries exhausted for %s", url)
+            except Exception:
+                # Unexpected errors (e.g. a closed pool) happen in this process;
+                # they say nothing about the host but must still settle a trial.
+                self.circuit_breakers.release_trial(url)
+                raise
         return None
 
+    def _retry_delay(self, attempt: int, exc: RequestException) -> float:
+        """
+        Exponential backoff with full jitter, honouring a numeric Retry-After.
+
+        The delay before retry `attempt + 1` is drawn uniformly from
+        `[0, retry_delay_seconds * 2 ** (attempt - 1)]`, capped at
+        `max_retry_delay_seconds`.
+        """
+        response = getattr(exc, "response", None)
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.strip().isdigit():
+            return min(float(retry_after), self.max_retry_delay_seconds)
+
+        ceiling = min(self.retry_delay_seconds * 2 ** (attempt - 1), self.max_retry_delay_seconds)
+        return random.uniform(0, ceiling)
+
+
+class JobFieldsFound:
+    """
+    Picklable stop check for incremental PDF extraction.
+
+    True once `extract_job_details` of `scraper_class` fills every field in
+    `fields`. `extract_job_details` only uses stateless helpers, so it runs on
+    a bare instance; this lets the check travel to extraction worker processes.
+    """
+
+    def __init__(self, scraper_class: type[BaseScraper], fields: tuple[str, ...]) -> None:
+        self.scraper_class = scraper_class
+        self.fields = fields
+
+    def __call__(self, text: str) -> bool:
+        probe = self.scraper_class.__new__(self.scraper_class)
+        details = probe.extract_job_details(text)
+        return all(details.get(field) for field in self.fields)
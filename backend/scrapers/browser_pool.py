@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+_driver_path: str | None = None
+_driver_path_lock = threading.Lock()
+
+
+def resolve_driver_path() -> str:
+    """Resolve the chromedriver binary once per process."""
+    global _driver_path
+    if _driver_path is None:
+        with _driver_path_lock:
+            if _driver_path is None:
+                _driver_path = os.getenv("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+    return _driver_path
+
+
+class PooledBrowser:
+    """A Chrome driver plus the bookkeeping the pool needs to recycle it."""
+
+    def __init__(self, driver: webdriver.Chrome) -> None:
+        self.driver = driver
+        self.pages_served = 0
+        self.last_used = time.monotonic()
+
+
+class BrowserPool:
+    """
+    Bounded pool of warm headless Chrome instances.
+
+    Browsers are leased with `lease()` and returned automatically. A browser
+    is quit instead of being returned after `max_pages_per_browser` pages,
+    after any WebDriver error, or once it has been idle for
+    `idle_timeout_seconds`.
+
+    Args:
+        max_browsers: Maximum Chrome processes alive at once.
+        max_pages_per_browser: Pages served before a browser is recycled.
+        idle_timeout_seconds: Idle time after which a browser is quit.
+        user_agent: User-Agent sent by every browser.
+
+    Example:
+        with pool.lease() as driver:
+            driver.get(url)
+            html = driver.page_source
+    """
+
+    def __init__(
+        self,
+        max_browsers: int | None = None,
+        max_pages_per_browser: int | None = None,
+        idle_timeout_seconds: float | None = None,
+        user_agent: str | None = None,
+    ) -> None:
+        self.max_browsers = int(max_browsers or os.getenv("SELENIUM_POOL_SIZE", 2))
+        self.max_pages_per_browser = int(
+            max_pages_per_browser or os.getenv("SELENIUM_MAX_PAGES_PER_BROWSER", 50)
+        )
+        self.idle_timeout_seconds = float(
+            idle_timeout_seconds or os.getenv("SELENIUM_IDLE_TIMEOUT_SECONDS", 300)
+        )
+        self.user_agent = user_agent
+
+        self._idle: list[PooledBrowser] = []
+        self._alive = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._reaper: threading.Thread | None = None
+        self._counters = {"launched": 0, "leases": 0, "recycled": 0, "evicted_idle": 0, "discarded": 0}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _build_options(self) -> Options:
+        options = Options()
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        if self.user_agent:
+            options.add_argument(f"user-agent={self.user_agent}")
+        return options
+
+    def _launch(self) -> PooledBrowser:
+        service = Service(resolve_driver_path())
+        driver = webdriver.Chrome(service=service, options=self._build_options())
+        with self._condition:
+            self._counters["launched"] += 1
+        self._ensure_reaper()
+        return PooledBrowser(driver)
+
+    def _quit(self, browser: PooledBrowser) -> None:
+        try:
+            browser.driver.quit()
+        except Exception as exc:
+            self.logger.warning("Failed to quit pooled browser cleanly: %s", exc)
+
+    def acquire(self, timeout: float | None = None) -> PooledBrowser:
+        """
+        Lease a browser, launching one if the pool is below `max_browsers`.
+
+        Raises:
+            TimeoutError: No browser became available within `timeout`.
+            WebDriverException: Chrome could not be started.
+        """
+        self.evict_idle()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("BrowserPool is closed.")
+                if self._idle:
+                    browser = self._idle.pop()
+                    self._counters["leases"] += 1
+                    return browser
+                if self._alive < self.max_browsers:
+                    self._alive += 1
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("Timed out waiting for a pooled browser.")
+                self._condition.wait(remaining)
+
+        try:
+            browser = self._launch()
+        except Exception:
+            with self._condition:
+                self._alive -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._counters["leases"] += 1
+        return browser
+
+    def release(self, browser: PooledBrowser, discard: bool = False) -> None:
+        """Return a leased browser, quitting it when broken or worn out."""
+        browser.pages_served += 1
+        browser.last_used = time.monotonic()
+
+        recycle = browser.pages_served >= self.max_pages_per_browser
+        if not discard and not recycle:
+            try:
+                browser.driver.delete_all_cookies()
+            except WebDriverException:
+                discard = True
+
+        if discard or recycle or self._closed:
+            self._quit(browser)
+            with self._condition:
+                self._alive -= 1
+                if discard or recycle:
+                    self._counters["discarded" if discard else "recycled"] += 1
+                self._condition.notify()
+            return
+
+        with self._condition:
+            self._idle.append(browser)
+            self._condition.notify()
+
+    @contextmanager
+    def lease(self, timeout: float | None = None) -> Iterator[webdriver.Chrome]:
+        """Context manager yielding a driver; it is discarded if the block raises."""
+        browser = self.acquire(timeout=timeout)
+        try:
+            yield browser.driver
+        except BaseException:
+            self.release(browser, discard=True)
+            raise
+        self.release(browser)
+
+    def evict_idle(self) -> int:
+        """Quit browsers idle for longer than `idle_timeout_seconds`."""
+        cutoff = time.monotonic() - self.idle_timeout_seconds
+        with self._condition:
+            expired = [browser for browser in self._idle if browser.last_used < cutoff]
+            if not expired:
+                return 0
+            self._idle = [browser for browser in self._idle if browser.last_used >= cutoff]
+            self._alive -= len(expired)
+            self._counters["evicted_idle"] += len(expired)
+            self._condition.notify(len(expired))
+
+        for browser in expired:
+            self._quit(browser)
+        return len(expired)
+
+    def _ensure_reaper(self) -> None:
+        with self._condition:
+            if self._reaper is not None and self._reaper.is_alive():
+                return
+            self._reaper = threading.Thread(
+                target=self._reap_idle, name="browser-pool-reaper", daemon=True
+            )
+            self._reaper.start()
+
+    def _reap_idle(self) -> None:
+        interval = max(self.idle_timeout_seconds / 2, 1.0)
+        while True:
+            time.sleep(interval)
+            self.evict_idle()
+            with self._condition:
+                if self._closed or self._alive == 0:
+                    self._reaper = None
+                    return
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool size and lifecycle counters."""
+        with self._condition:
+            return {
+                "max_browsers": self.max_browsers,
+                "alive": self._alive,
+                "idle": len(self._idle),
+                **self._counters,
+            }
+
+    def close(self) -> None:
+        """Quit all idle browsers; leased ones are quit when released."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._alive -= len(idle)
+            self._condition.notify_all()
+        for browser in idle:
+            self._quit(browser)
+
+
+_browser_pool: BrowserPool | None = None
+_browser_pool_lock = threading.Lock()
+
+
+def get_browser_pool(**kwargs: Any) -> BrowserPool:
+    """
+    Return the process-wide browser pool, creating it on first use.
+
+    Keyword arguments are passed to `BrowserPool` only when the pool is created.
+    """
+    global _browser_pool
+    if _browser_pool is None:
+        with _browser_pool_lock:
+            if _browser_pool is None:
+                _browser_pool = BrowserPool(**kwargs)
+                atexit.register(_browser_pool.close)
+    return _browser_pool
+
+
+def browser_pool_stats() -> dict[str, Any] | None:
+    """
+    Return the process-wide pool's stats, or None before a scraper has created it.
+
+    Unlike `get_browser_pool()` this never creates the pool, so reading stats
+    cannot fix the pool's settings (such as its User-Agent) before a scraper does.
+    """
+    pool = _browser_pool
+    return pool.stats() if pool is not None else None
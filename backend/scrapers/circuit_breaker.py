@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import Any
+from urllib.parse import urlparse
+
+from requests.exceptions import (
+    HTTPError,
+    InvalidHeader,
+    InvalidSchema,
+    InvalidURL,
+    MissingSchema,
+    SSLError,
+    TooManyRedirects,
+)
+
+PERMANENT = "permanent"
+TRANSIENT = "transient"
+
+# 4xx statuses that can succeed on a later attempt.
+RETRYABLE_CLIENT_STATUSES = {408, 425, 429}
+
+
+def classify_error(exc: BaseException) -> str:
+    """
+    Classify a request failure as "permanent" (never retry) or "transient".
+
+    4xx responses other than 408/425/429, malformed URLs, redirect loops and
+    TLS certificate errors are permanent. 5xx responses, timeouts and
+    connection failures are transient.
+    """
+    if isinstance(exc, HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+        if 400 <= status < 500 and status not in RETRYABLE_CLIENT_STATUSES:
+            return PERMANENT
+        return TRANSIENT
+    if isinstance(
+        exc, (InvalidURL, MissingSchema, InvalidSchema, InvalidHeader, TooManyRedirects, SSLError)
+    ):
+        return PERMANENT
+    return TRANSIENT
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one host.
+
+    closed -> open after `failure_threshold` consecutive transient failures.
+    open -> half_open once `reset_timeout_seconds` has passed; one trial
+    request is then let through. A successful trial closes the breaker, and a
+    failed one re-opens it with the timeout doubled (up to
+    `max_reset_timeout_seconds`). Every request `allow_request` admits must
+    end in `record_success`, `record_failure` or `release_trial`, or a
+    half-open breaker never admits another trial.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout_seconds: float,
+        max_reset_timeout_seconds: float,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout_seconds
+        self.max_reset_timeout = max_reset_timeout_seconds
+        self.reset_timeout = reset_timeout_seconds
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: float | None = None
+        self.times_opened = 0
+        self.rejected = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - (self.opened_at or 0) < self.reset_timeout:
+                    self.rejected += 1
+                    return False
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self._trial_in_flight:
+                self.rejected += 1
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.reset_timeout = self.base_reset_timeout
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN:
+                self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+                self._open()
+            elif self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def release_trial(self) -> None:
+        """End an admitted request without a verdict on the host (e.g. it never left this process)."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+        self._trial_in_flight = False
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            retry_in = None
+            if self.state == self.OPEN and self.opened_at is not None:
+                retry_in = max(self.reset_timeout - (time.monotonic() - self.opened_at), 0.0)
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+                "retry_in_seconds": None if retry_in is None else round(retry_in, 1),
+            }
+
+
+class CircuitBreakerRegistry:
+    """
+    Process-wide registry of per-host circuit breakers.
+
+    Args:
+        failure_threshold: Consecutive transient failures that open a breaker.
+        reset_timeout_seconds: Initial time a breaker stays open.
+        max_reset_timeout_seconds: Upper bound for the doubled open time.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int | None = None,
+        reset_timeout_seconds: float | None = None,
+        max_reset_timeout_seconds: float | None = None,
+    ) -> None:
+        self.failure_threshold = int(
+            failure_threshold or os.getenv("SCRAPER_BREAKER_FAILURE_THRESHOLD", 5)
+        )
+        self.reset_timeout_seconds = float(
+            reset_timeout_seconds or os.getenv("SCRAPER_BREAKER_RESET_SECONDS", 300)
+        )
+        self.max_reset_timeout_seconds = float(
+            max_reset_timeout_seconds or os.getenv("SCRAPER_BREAKER_MAX_RESET_SECONDS", 3600)
+        )
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def get(self, url: str) -> CircuitBreaker:
+        host = (urlparse(url).hostname or "").lower()
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    self.failure_threshold,
+                    self.reset_timeout_seconds,
+                    self.max_reset_timeout_seconds,
+                )
+                self._breakers[host] = breaker
+            return breaker
+
+    def allow_request(self, url: str) -> bool:
+        return self.get(url).allow_request()
+
+    def record_success(self, url: str) -> None:
+        self.get(url).record_success()
+
+    def release_trial(self, url: str) -> None:
+        self.get(url).release_trial()
+
+    def record_failure(self, url: str) -> None:
+        breaker = self.get(url)
+        was_open = breaker.state == CircuitBreaker.OPEN
+        breaker.record_failure()
+        if not was_open and breaker.state == CircuitBreaker.OPEN:
+            self.logger.warning(
+                "Circuit opened for %s after %s consecutive failures.",
+                urlparse(url).hostname,
+                breaker.consecutive_failures,
+            )
+
+    def stats(self) -> dict[str, Any]:
+        """Return breaker state per host, plus the list of hosts currently open."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        hosts = {host: breaker.snapshot() for host, breaker in breakers.items()}
+        return {
+            "open_hosts": sorted(host for host, snap in hosts.items() if snap["state"] != "closed"),
+            "hosts": hosts,
+        }
+
+
+_circuit_breakers: CircuitBreakerRegistry | None = None
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Return the process-wide circuit breaker registry, creating it on first use."""
+    global _circuit_breakers
+    if _circuit_breakers is None:
+        with _circuit_breakers_lock:
+            if _circuit_breakers is None:
+                _circuit_breakers = CircuitBreakerRegistry()
+    return _circuit_breakers
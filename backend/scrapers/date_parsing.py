@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import calendar
+import re
+from datetime import date
+from functools import lru_cache
+
+_MONTHS = {name.lower(): index for index, name in enumerate(calendar.month_name) if name}
+_MONTHS.update({name.lower(): index for index, name in enumerate(calendar.month_abbr) if name})
+_ABBREVIATIONS = {name.lower() for name in calendar.month_abbr if name}
+_MONTH_NAMES = "|".join(sorted(_MONTHS, key=len, reverse=True))
+
+# Same day/month/year sub-patterns `strptime` uses for %d, %m and %Y.
+_DAY = r"3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9]"
+_MONTH = r"1[0-2]|0[1-9]|[1-9]"
+_YEAR = r"\d\d\d\d"
+
+# One pattern for every format `BaseScraper.parse_date` used to try in turn:
+# %d/%m/%Y, %d-%m-%Y, %d-%b-%Y, %d-%B-%Y, %d %b %Y, %d %B %Y and %Y-%m-%d.
+_DATE = re.compile(
+    rf"(?P<d>{_DAY})(?P<sep>[/-])(?P<m>{_MONTH})(?P=sep)(?P<Y>{_YEAR})"
+    rf"|(?P<nd>{_DAY})(?:-(?P<dash_month>{_MONTH_NAMES})-|\s+(?P<space_month>{_MONTH_NAMES})\s+)"
+    rf"(?P<nY>{_YEAR})"
+    rf"|(?P<iY>{_YEAR})-(?P<im>{_MONTH})-(?P<id>{_DAY})",
+    flags=re.IGNORECASE,
+)
+_EMBEDDED_DATE = re.compile(r"(\d{1,2}[/-][A-Za-z0-9]{1,3}[/-]\d{2,4}|\d{4}-\d{2}-\d{2})")
+_DIGIT = re.compile(r"\d")
+
+
+@lru_cache(maxsize=4096)
+def match_date_format(value: str) -> tuple[date, str] | None:
+    """
+    Parse a string that is exactly a date in one of the supported formats.
+
+    Accepts the same strings as `datetime.strptime` would for those formats
+    (case-insensitive month names, one- or two-digit day and month).
+
+    Returns:
+        `(date, strptime_format)` or None when the string is not such a date.
+    """
+    match = _DATE.fullmatch(value)
+    if match is None:
+        return None
+
+    groups = match.groupdict()
+    if groups["d"]:
+        day, month, year = groups["d"], groups["m"], groups["Y"]
+        date_format = f"%d{groups['sep']}%m{groups['sep']}%Y"
+    elif groups["nd"]:
+        month_name = (groups["dash_month"] or groups["space_month"]).lower()
+        day, month, year = groups["nd"], _MONTHS[month_name], groups["nY"]
+        code = "%b" if month_name in _ABBREVIATIONS else "%B"
+        date_format = f"%d-{code}-%Y" if groups["dash_month"] else f"%d {code} %Y"
+    else:
+        day, month, year = groups["id"], groups["im"], groups["iY"]
+        date_format = "%Y-%m-%d"
+
+    try:
+        return date(int(year), int(month), int(day)), date_format
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def parse_date(value: str) -> date | None:
+    """
+    Parse a date written in a supported format, or embedded in other text.
+
+    Behaves like the original `BaseScraper.parse_date`: whitespace is
+    normalized, the whole string is tried against every format, and
+    otherwise the first date-like substring is. Strings without a digit are
+    rejected before any pattern runs, and results are kept in a bounded LRU
+    cache since listing pages repeat the same strings run after run.
+    """
+    if not value or not _DIGIT.search(value):
+        return None
+
+    candidate = " ".join(value.split())
+    matched = match_date_format(candidate)
+    if matched:
+        return matched[0]
+
+    embedded = _EMBEDDED_DATE.search(candidate)
+    if embedded:
+        matched = match_date_format(embedded.group(1))
+        if matched:
+            return matched[0]
+    return None
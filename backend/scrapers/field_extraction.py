@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+
+_TITLE = re.compile(
+    r"(?:recruitment|notification|advertisement)\s*(?:for)?\s*([A-Za-z0-9 /-]{5,120})",
+    flags=re.IGNORECASE,
+)
+_VACANCIES = re.compile(r"(?:vacanc(?:y|ies)|posts?)\s*[:\-]?\s*(\d{1,6})", flags=re.IGNORECASE)
+_LAST_DATE = re.compile(
+    r"(?:last\s+date(?:\s+to\s+apply)?|apply\s+before)\s*[:\-]?\s*([^\n,;]+)",
+    flags=re.IGNORECASE,
+)
+_QUALIFICATION = re.compile(
+    r"(?:qualification|eligible|eligibility)\s*[:\-]?\s*([^\n]{5,200})",
+    flags=re.IGNORECASE,
+)
+# Age-limit phrasings, most specific first; the earliest pattern that matches
+# anywhere in the text wins, regardless of position.
+_AGE_PATTERNS = [
+    re.compile(pattern, flags=re.IGNORECASE)
+    for pattern in (
+        r"\b(\d{1,2}\s*[-to]+\s*\d{1,2}\s*years?)\b",
+        r"\b(below\s*\d{1,2}\s*years?)\b",
+        r"\b(upper\s*age\s*limit\s*[:\-]?\s*\d{1,2}\s*years?)\b",
+        r"\b(max(?:imum)?\s*\d{1,2}\s*years?)\b",
+        r"\b(min(?:imum)?\s*\d{1,2}\s*years?)\b",
+    )
+]
+_QUALIFICATION_HINTS = ("graduate", "12th", "10th", "diploma", "degree")
+
+# Every field pattern above can only match where one of these words (or a
+# number) starts, and no trigger word starts inside another. Scanning the
+# lowercased text for triggers visits every candidate position once;
+# the field patterns are then only tried, anchored, at those positions.
+_TRIGGERS = re.compile(
+    r"recruitment|notification|advertisement|vacanc|posts?|last|apply|qualification|eligib"
+    r"|below|upper|max|min|graduate|diploma|degree|1[02]th|\b\d"
+)
+_TRIGGERS_ANY_CASE = re.compile(_TRIGGERS.pattern, flags=re.IGNORECASE)
+_FIELDS_BY_TRIGGER = {
+    "r": [("title", _TITLE)],
+    "n": [("title", _TITLE)],
+    "a": [("title", _TITLE), ("last_date", _LAST_DATE)],
+    "v": [("vacancies", _VACANCIES)],
+    "p": [("vacancies", _VACANCIES)],
+    "l": [("last_date", _LAST_DATE)],
+    "q": [("qualification", _QUALIFICATION)],
+    "e": [("qualification", _QUALIFICATION)],
+    "b": [(1, _AGE_PATTERNS[1])],
+    "u": [(2, _AGE_PATTERNS[2])],
+    "m": [(3, _AGE_PATTERNS[3]), (4, _AGE_PATTERNS[4])],
+    **{digit: [(0, _AGE_PATTERNS[0])] for digit in "0123456789"},
+}
+_FIELD_COUNT = 4
+
+
+def _triggers(text: str):
+    lowered = text.lower()
+    # Lowercasing a few non-ASCII characters changes the string length, which
+    # would shift positions; fall back to a case-insensitive scan then.
+    if len(lowered) == len(text):
+        return _TRIGGERS.finditer(lowered)
+    return _TRIGGERS_ANY_CASE.finditer(text)
+
+
+def find_age_limit(text: str) -> str | None:
+    """Return the raw age-limit phrase from the highest-priority matching pattern."""
+    for pattern in _AGE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+
+def scan_job_fields(text: str) -> dict[str, Any]:
+    """
+    Find the raw job-detail fields in whitespace-normalized text in one pass.
+
+    Gives the same matches as searching for each field pattern separately,
+    and stops early once every field, including the highest-priority age
+    pattern, has been found.
+
+    Returns:
+        `title`, `vacancies`, `last_date`, `qualification` and `age_limit`
+        as raw matched strings (or None), plus `qualification_hint`, which is
+        True when a qualification keyword such as "graduate" appears.
+    """
+    found: dict[str, str] = {}
+    ages: dict[int, str] = {}
+    qualification_hint = False
+    for trigger in _triggers(text):
+        word = trigger.group().lower()
+        if word in _QUALIFICATION_HINTS:
+            qualification_hint = True
+            continue
+
+        position = trigger.start()
+        for field, pattern in _FIELDS_BY_TRIGGER[word[0]]:
+            if field in found or field in ages:
+                continue
+            match = pattern.match(text, position)
+            if match:
+                if isinstance(field, int):
+                    ages[field] = match.group(1)
+                else:
+                    found[field] = match.group(1)
+        if 0 in ages and len(found) == _FIELD_COUNT:
+            break
+
+    return {
+        "title": found.get("title"),
+        "vacancies": found.get("vacancies"),
+        "last_date": found.get("last_date"),
+        "qualification": found.get("qualification"),
+        "qualification_hint": qualification_hint,
+        "age_limit": ages[min(ages)] if ages else None,
+    }
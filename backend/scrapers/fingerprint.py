@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import hashlib
+import re
+
+# Markup that changes between requests without the notices themselves changing.
+_VOLATILE_BLOCKS = re.compile(
+    r"<script\b.*?</script\s*>|<style\b.*?</style\s*>|<!--.*?-->|<noscript\b.*?</noscript\s*>",
+    flags=re.IGNORECASE | re.DOTALL,
+)
+_CSRF_INPUTS = re.compile(
+    r"<input\b[^>]*\bname\s*=\s*[\"']?[^\"'>\s]*(?:csrf|token|__viewstate|__eventvalidation)"
+    r"[^>]*>",
+    flags=re.IGNORECASE,
+)
+_CSRF_META = re.compile(
+    r"<meta\b[^>]*\bname\s*=\s*[\"']?[^\"'>\s]*(?:csrf|token)[^>]*>",
+    flags=re.IGNORECASE,
+)
+_NONCE_ATTRS = re.compile(r"\s(?:nonce|data-timestamp|data-time)\s*=\s*(\"[^\"]*\"|'[^']*'|\S+)", re.IGNORECASE)
+_CACHE_BUSTERS = re.compile(
+    r"([?&](?:v|ver|version|_|t|ts|timestamp|rand|nocache|jsessionid|phpsessid|sid)=)[^&\"'\s>]*",
+    flags=re.IGNORECASE,
+)
+_SESSION_PATH_PARAMS = re.compile(r";jsessionid=[^?\"'\s>]*", flags=re.IGNORECASE)
+_TIMES_OF_DAY = re.compile(
+    r"\b\d{1,2}:\d{2}(?::\d{2})?(?:\s*[ap]\.?m\.?)?\b", flags=re.IGNORECASE
+)
+_COUNTERS = re.compile(
+    r"\b(visitors?|visitor\s+count|hits|page\s+views?|last\s+updated(?:\s+on)?)\s*[:\-]?\s*[^<]{0,40}",
+    flags=re.IGNORECASE,
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_html(html: str) -> str:
+    """
+    Strip volatile markup so semantically unchanged pages normalize equally.
+
+    Removes scripts, styles, comments, CSRF/viewstate tokens, nonces,
+    cache-busting query params, session ids, times of day, visitor counters
+    and "last updated" stamps, then collapses whitespace.
+    """
+    if not html:
+        return ""
+    text = _VOLATILE_BLOCKS.sub(" ", html)
+    text = _CSRF_INPUTS.sub(" ", text)
+    text = _CSRF_META.sub(" ", text)
+    text = _NONCE_ATTRS.sub(" ", text)
+    text = _SESSION_PATH_PARAMS.sub("", text)
+    text = _CACHE_BUSTERS.sub(r"\1", text)
+    text = _COUNTERS.sub(r"\1", text)
+    text = _TIMES_OF_DAY.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def fingerprint_html(html: str) -> str:
+    """Return a SHA-256 hex digest of the normalized page body."""
+    return hashlib.sha256(normalize_html(html).encode("utf-8", errors="ignore")).hexdigest()
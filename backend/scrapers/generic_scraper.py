@@ -104,27 +104,28 @@ class GenericScraper(BaseScraper):
     def check_if_new(
         self, item: dict[str, Any], last_scraped_time: datetime | date | str | None
     ) -> bool:
-        key = item.get("pdf_url") or f"{item.get('job_title')}::{item.get('notification_date')}"
+        key = self.item_key(item)
         if key in self._seen_keys:
             return False
         self._seen_keys.add(key)
         return True
 
-    def scrape(self, last_scraped_time: datetime | date | str | None = None) -> list[dict[str, Any]]:
-        soup = self.fetch_page(self.url)
-        if not soup:
-            page_source = self.fetch_with_selenium(self.url)
-            if not page_source:
-                return []
-            soup = BeautifulSoup(page_source, "lxml")
+    def listing_selectors(self) -> list[str]:
+        return ["a[href]"]
 
-        anchors = [a for a in soup.select("a[href]") if isinstance(a, Tag)]
-        out: list[dict[str, Any]] = []
+    def parse_listing(
+        self, soup: BeautifulSoup, last_scraped_time: datetime | date | str | None = None
+    ) -> list[dict[str, Any]]:
+        anchors = self.diff_listing([a for a in soup.select("a[href]") if isinstance(a, Tag)])
+        items: list[dict[str, Any]] = []
         for anchor in anchors:
             title = self.clean_text(anchor.get_text(" ", strip=True)).lower()
             if not any(k in title for k in ["notification", "notice", "exam", "recruitment", "vacancy", "result"]):
                 continue
-            item = self.parse_notification(anchor)
+            items.append(self.parse_notification(anchor))
+
+        out: list[dict[str, Any]] = []
+        for item in self.drop_seen_items(items):
             if self.check_if_new(item, last_scraped_time):
                 out.append(item)
         return out
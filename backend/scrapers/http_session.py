@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import weakref
+from typing import Any
+from urllib.parse import urlparse
+
+import requests
+from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import EmptyPoolError
+
+
+class PoolTimeout(requests.exceptions.ConnectionError):
+    """No pooled connection to the host became free within the pool timeout."""
+
+
+class ConnectionStats:
+    """Thread-safe per-host counters for requests sent and connections opened."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hosts: dict[str, dict[str, int]] = {}
+
+    def _host_counters(self, host: str) -> dict[str, int]:
+        counters = self._hosts.get(host)
+        if counters is None:
+            counters = {"requests": 0, "new_connections": 0}
+            self._hosts[host] = counters
+        return counters
+
+    def record_request(self, host: str) -> None:
+        with self._lock:
+            self._host_counters(host)["requests"] += 1
+
+    def record_new_connection(self, host: str) -> None:
+        with self._lock:
+            self._host_counters(host)["new_connections"] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return totals and per-host counters.
+
+        `reused_connections` is the number of requests that did not need a new
+        TCP/TLS handshake because a kept-alive connection was available.
+        """
+        with self._lock:
+            hosts = {host: dict(counters) for host, counters in self._hosts.items()}
+
+        total_requests = 0
+        total_new = 0
+        for counters in hosts.values():
+            counters["reused_connections"] = max(
+                counters["requests"] - counters["new_connections"], 0
+            )
+            total_requests += counters["requests"]
+            total_new += counters["new_connections"]
+
+        return {
+            "requests": total_requests,
+            "new_connections": total_new,
+            "reused_connections": max(total_requests - total_new, 0),
+            "hosts": hosts,
+        }
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that reports request and connection counts to `ConnectionStats`.
+
+    With a blocking pool, waiting for a free connection gives up after
+    `pool_timeout` seconds and raises `PoolTimeout`, so a leaked or slow
+    connection fails requests (which are retried) instead of hanging them.
+    """
+
+    def __init__(self, stats: ConnectionStats, pool_timeout: float | None = None, **kwargs: Any) -> None:
+        # Must be set before HTTPAdapter.__init__, which builds the pool manager.
+        self.stats = stats
+        self.pool_timeout = pool_timeout
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        stats = self.stats
+        pool_timeout = self.pool_timeout
+
+        class CountingHTTPConnectionPool(HTTPConnectionPool):
+            def _new_conn(self):
+                stats.record_new_connection(self.host)
+                return super()._new_conn()
+
+            def _get_conn(self, timeout=None):
+                return super()._get_conn(timeout if timeout is not None else pool_timeout)
+
+        class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+            def _new_conn(self):
+                stats.record_new_connection(self.host)
+                return super()._new_conn()
+
+            def _get_conn(self, timeout=None):
+                return super()._get_conn(timeout if timeout is not None else pool_timeout)
+
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": CountingHTTPConnectionPool,
+            "https": CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs: Any) -> Response:
+        self.stats.record_request(urlparse(request.url).hostname or "")
+        try:
+            return super().send(request, **kwargs)
+        except EmptyPoolError as exc:
+            raise PoolTimeout(exc, request=request) from exc
+
+
+class SessionPool:
+    """
+    Shared keep-alive HTTP session pool for scrapers.
+
+    One `PooledHTTPAdapter` (and therefore one urllib3 connection pool per host)
+    is shared by every thread. Each thread gets its own `requests.Session` so
+    cookie state is never mutated concurrently.
+
+    Args:
+        pool_connections: Number of distinct hosts to keep connection pools for.
+        pool_maxsize: Maximum open connections per host.
+        pool_block: Wait when a host has `pool_maxsize` connections in use
+            instead of opening extra, unpooled connections (off by default).
+        pool_timeout: Seconds a blocking pool waits for a free connection
+            before the request fails with `PoolTimeout`.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int | None = None,
+        pool_maxsize: int | None = None,
+        pool_block: bool | None = None,
+        pool_timeout: float | None = None,
+    ) -> None:
+        self.pool_connections = int(
+            pool_connections or os.getenv("SCRAPER_POOL_CONNECTIONS", 20)
+        )
+        self.pool_maxsize = int(pool_maxsize or os.getenv("SCRAPER_POOL_MAXSIZE", 4))
+        if pool_block is None:
+            pool_block = os.getenv("SCRAPER_POOL_BLOCK", "false").lower() in {"1", "true", "yes"}
+        self.pool_block = pool_block
+        self.pool_timeout = float(pool_timeout or os.getenv("SCRAPER_POOL_TIMEOUT", 30))
+
+        self.connection_stats = ConnectionStats()
+        self.adapter = PooledHTTPAdapter(
+            self.connection_stats,
+            pool_timeout=self.pool_timeout,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        self._local = threading.local()
+        # Weak, so a session is dropped once the thread that owned it exits.
+        self._sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def get_session(self) -> requests.Session:
+        """Return the calling thread's session, creating it on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self.adapter)
+            session.mount("https://", self.adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions.add(session)
+        return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        """Send a request through the calling thread's pooled session."""
+        return self.get_session().request(method=method, url=url, **kwargs)
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool configuration together with connection reuse counters."""
+        return {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "pool_block": self.pool_block,
+            "pool_timeout": self.pool_timeout,
+            **self.connection_stats.snapshot(),
+        }
+
+    def close(self) -> None:
+        """Close all sessions and drop pooled connections."""
+        with self._lock:
+            sessions, self._sessions = list(self._sessions), weakref.WeakSet()
+        for session in sessions:
+            session.close()
+        self.adapter.close()
+
+
+_session_pool: SessionPool | None = None
+_session_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> SessionPool:
+    """Return the process-wide session pool, creating it on first use."""
+    global _session_pool
+    if _session_pool is None:
+        with _session_pool_lock:
+            if _session_pool is None:
+                _session_pool = SessionPool()
+    return _session_pool
+
+
+def configure_session_pool(**kwargs: Any) -> SessionPool:
+    """
+    Replace the process-wide session pool with a newly configured one.
+
+    Accepts the same keyword arguments as `SessionPool`.
+    """
+    global _session_pool
+    with _session_pool_lock:
+        previous = _session_pool
+        _session_pool = SessionPool(**kwargs)
+    if previous is not None:
+        previous.close()
+    return _session_pool
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import IO
+
+import pdfplumber
+
+try:
+    import pypdfium2
+except ImportError:  # pragma: no cover - installed alongside pdfplumber
+    pypdfium2 = None
+
+PDFSource = bytes | str | IO[bytes]
+
+
+class PdfplumberBackend:
+    """Text via pdfplumber: full layout analysis, slow but the most tolerant."""
+
+    name = "pdfplumber"
+
+    @contextmanager
+    def open(self, source: PDFSource, start_page: int = 0) -> Iterator[tuple[int, Iterator[str]]]:
+        with pdfplumber.open(source) as pdf:
+            yield len(pdf.pages), (page.extract_text() or "" for page in pdf.pages[start_page:])
+
+
+class PdfiumBackend:
+    """Text-only extraction via PDFium (C library), no layout analysis."""
+
+    name = "pdfium"
+
+    @contextmanager
+    def open(self, source: PDFSource, start_page: int = 0) -> Iterator[tuple[int, Iterator[str]]]:
+        document = pypdfium2.PdfDocument(source)
+        try:
+            yield len(document), self._page_texts(document, start_page)
+        finally:
+            document.close()
+
+    @staticmethod
+    def _page_texts(document, start_page: int = 0) -> Iterator[str]:
+        for index in range(start_page, len(document)):
+            page = document[index]
+            textpage = page.get_textpage()
+            try:
+                yield textpage.get_text_range() or ""
+            finally:
+                textpage.close()
+                page.close()
+
+
+PDF_BACKENDS = {"pdfium": PdfiumBackend, "pdfplumber": PdfplumberBackend}
+
+
+def available_backends() -> list[str]:
+    """Return the registered backend names whose libraries are installed."""
+    return [name for name in PDF_BACKENDS if name != "pdfium" or pypdfium2 is not None]
+
+
+def default_backend_names() -> tuple[str, ...]:
+    """
+    Return the configured backend order, fastest first.
+
+    Read from `PDF_TEXT_BACKENDS` (comma-separated, default
+    "pdfium,pdfplumber"); unknown or unavailable names are skipped.
+    """
+    configured = os.getenv("PDF_TEXT_BACKENDS", "pdfium,pdfplumber")
+    available = available_backends()
+    names = tuple(
+        name for name in (part.strip().lower() for part in configured.split(",")) if name in available
+    )
+    return names or ("pdfplumber",)
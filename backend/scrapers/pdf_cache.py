@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pdf_text_cache (
+    url TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    text BLOB NOT NULL,
+    details TEXT,
+    details_version INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (url, content_hash)
+);
+CREATE INDEX IF NOT EXISTS ix_pdf_text_cache_last_access ON pdf_text_cache (last_access);
+"""
+
+
+class PDFTextCache:
+    """
+    Persistent cache of extracted PDF text and `extract_job_details` results.
+
+    Entries are keyed by PDF URL plus a SHA-256 of the PDF body, and also keep
+    the response's ETag/Last-Modified so a conditional request can confirm a
+    hit without downloading the PDF again. Text is zlib-compressed in a SQLite
+    file; once the total stored size exceeds `max_bytes`, least recently used
+    entries are evicted.
+
+    Args:
+        path: SQLite file path; defaults to `PDF_CACHE_PATH` or a temp dir.
+        max_bytes: Size budget for compressed text; defaults to
+            `PDF_CACHE_MAX_MB` (200 MB).
+    """
+
+    def __init__(self, path: str | None = None, max_bytes: int | None = None) -> None:
+        self.path = path or os.getenv("PDF_CACHE_PATH") or os.path.join(
+            tempfile.gettempdir(), "saspirant-pdf-cache.sqlite3"
+        )
+        self.max_bytes = int(max_bytes or int(os.getenv("PDF_CACHE_MAX_MB", 200)) * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _row_to_entry(self, row: tuple) -> dict[str, Any]:
+        url, content_hash, etag, last_modified, text, details, details_version = row
+        return {
+            "url": url,
+            "content_hash": content_hash,
+            "validators": {
+                key: value
+                for key, value in (("etag", etag), ("last_modified", last_modified))
+                if value
+            },
+            "text": zlib.decompress(text).decode("utf-8"),
+            "details": json.loads(details) if details else None,
+            "details_version": details_version,
+        }
+
+    def _fetch(self, where: str, params: tuple) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, content_hash, etag, last_modified, text, details, details_version "
+                f"FROM pdf_text_cache WHERE {where} ORDER BY stored_at DESC LIMIT 1",
+                params,
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE pdf_text_cache SET last_access = ? WHERE url = ? AND content_hash = ?",
+                (time.time(), row[0], row[1]),
+            )
+        return self._row_to_entry(row)
+
+    def latest_for_url(self, url: str) -> dict[str, Any] | None:
+        """Return the most recently stored entry for a URL, if any."""
+        return self._fetch("url = ?", (url,))
+
+    def get(self, url: str, content_hash: str) -> dict[str, Any] | None:
+        """Return the entry for a URL and PDF body hash, if any."""
+        return self._fetch("url = ? AND content_hash = ?", (url, content_hash))
+
+    def put(
+        self,
+        url: str,
+        content_hash: str,
+        text: str,
+        details: dict[str, Any] | None,
+        details_version: int,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """Store extracted text and details, then evict LRU entries if over budget."""
+        validators = validators or {}
+        blob = zlib.compress(text.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pdf_text_cache "
+                "(url, content_hash, etag, last_modified, text, details, details_version, "
+                "size, stored_at, last_access) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    content_hash,
+                    validators.get("etag"),
+                    validators.get("last_modified"),
+                    blob,
+                    json.dumps(details) if details is not None else None,
+                    details_version,
+                    len(blob),
+                    now,
+                    now,
+                ),
+            )
+            self._evict_locked()
+
+    def update_details(
+        self, url: str, content_hash: str, details: dict[str, Any], details_version: int
+    ) -> None:
+        """Replace cached details after re-extracting them from cached text."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE pdf_text_cache SET details = ?, details_version = ? "
+                "WHERE url = ? AND content_hash = ?",
+                (json.dumps(details), details_version, url, content_hash),
+            )
+
+    def _evict_locked(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pdf_text_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute(
+            "SELECT url, content_hash, size FROM pdf_text_cache ORDER BY last_access ASC"
+        ).fetchall()
+        evicted = 0
+        for url, content_hash, size in rows:
+            if total <= target:
+                break
+            self._conn.execute(
+                "DELETE FROM pdf_text_cache WHERE url = ? AND content_hash = ?", (url, content_hash)
+            )
+            total -= size
+            evicted += 1
+        self._counters["evictions"] += evicted
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            self._counters["hits" if hit else "misses"] += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pdf_text_cache"
+            ).fetchone()
+            return {"entries": entries, "bytes": total, "max_bytes": self.max_bytes, **self._counters}
+
+
+_pdf_cache: PDFTextCache | None = None
+_pdf_cache_lock = threading.Lock()
+
+
+def get_pdf_cache() -> PDFTextCache | None:
+    """
+    Return the process-wide PDF text cache, creating it on first use.
+
+    Returns None (scrapers then run uncached) when the cache file cannot be
+    opened.
+    """
+    global _pdf_cache
+    if _pdf_cache is None:
+        with _pdf_cache_lock:
+            if _pdf_cache is None:
+                try:
+                    _pdf_cache = PDFTextCache()
+                except (OSError, sqlite3.Error) as exc:
+                    logging.getLogger(PDFTextCache.__name__).warning(
+                        "PDF text cache disabled: %s", exc
+                    )
+                    return None
+    return _pdf_cache
@@ -0,0 +1,518 @@
+from __future__ import annotations
+
+import atexit
+import io
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import shutil
+import signal
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import as_completed as futures_as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import IO, Any
+
+from .pdf_backends import PDF_BACKENDS, PDFSource, default_backend_names
+
+
+class PDFExtractionTimeout(TimeoutError):
+    """Raised inside a worker when one document exceeds its time budget."""
+
+
+def _raise_timeout(signum: int, frame: Any) -> None:
+    raise PDFExtractionTimeout("PDF extraction timed out.")
+
+
+def _read_pages(
+    backend_name: str,
+    source: PDFSource,
+    max_pages: int | None,
+    stop_check: Callable[[str], bool] | None,
+    start_page: int = 0,
+) -> dict[str, Any]:
+    text_parts: list[str] = []
+    pages_read = 0
+    with PDF_BACKENDS[backend_name]().open(source, start_page) as (page_count, page_texts):
+        for page_text in page_texts:
+            if max_pages and pages_read >= max_pages:
+                break
+            pages_read += 1
+            if page_text.strip():
+                text_parts.append(page_text)
+                if stop_check and stop_check("\n".join(text_parts)):
+                    break
+    return {
+        "text": "\n".join(text_parts),
+        "pages_read": pages_read,
+        "page_count": page_count,
+        "backend": backend_name,
+    }
+
+
+def extract_pdf_text(
+    source: PDFSource,
+    timeout_seconds: float | None = None,
+    max_pages: int | None = None,
+    stop_check: Callable[[str], bool] | None = None,
+    backends: tuple[str, ...] | None = None,
+    start_page: int = 0,
+) -> dict[str, Any]:
+    """
+    Extract raw text from a PDF (bytes, file path or binary file) page by page.
+
+    Backends (see `pdf_backends`) are tried in order; the next one is used
+    when a backend fails or finds no text. Reading begins at `start_page`
+    (to resume an extraction that stopped early) and stops after
+    `max_pages` pages, or as soon as `stop_check` returns True for the text
+    read so far. The per-document timeout is enforced with a real-time
+    interval timer, which interrupts extraction between Python bytecodes; it
+    is only armed in worker processes' main thread. Errors other than the
+    timeout are re-raised as `RuntimeError` so they always pickle back to the
+    parent.
+
+    Returns:
+        `{"text": str, "pages_read": int, "page_count": int, "backend": str}`,
+        where `pages_read` counts pages from `start_page` on.
+    """
+    use_alarm = (
+        bool(timeout_seconds)
+        and hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    )
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, float(timeout_seconds))
+    try:
+        result: dict[str, Any] | None = None
+        error: Exception | None = None
+        for backend_name in backends or default_backend_names():
+            if isinstance(source, bytes):
+                pdf_source: PDFSource = io.BytesIO(source)
+            else:
+                pdf_source = source
+                if not isinstance(source, str):
+                    source.seek(0)
+            try:
+                result = _read_pages(backend_name, pdf_source, max_pages, stop_check, start_page)
+            except PDFExtractionTimeout:
+                raise
+            except Exception as exc:
+                error = exc
+                continue
+            if result["text"]:
+                return result
+        if result is None and error is not None:
+            raise error
+        return result or {"text": "", "pages_read": 0, "page_count": 0, "backend": None}
+    except PDFExtractionTimeout:
+        raise
+    except Exception as exc:
+        raise RuntimeError(f"{exc.__class__.__name__}: {exc}") from None
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+# Set in each worker process by `_init_worker`; see `_run_task`.
+_start_queue: Any = None
+
+
+def _init_worker(start_queue: Any) -> None:
+    global _start_queue
+    _start_queue = start_queue
+
+
+def _run_task(task_id: int, dispatch: int, *args: Any) -> dict[str, Any]:
+    """Worker entry point: report that the task has begun, then extract."""
+    if _start_queue is not None:
+        _start_queue.put((task_id, dispatch))
+    return extract_pdf_text(*args)
+
+
+class _ExtractionTask:
+    """One submitted document: the caller's future plus what is needed to re-dispatch it."""
+
+    def __init__(self, task_id: int, args: tuple[Any, ...], handoff_path: str | None) -> None:
+        self.id = task_id
+        self.args = args
+        self.handoff_path = handoff_path
+        self.future: Future = Future()
+        self.executor: ProcessPoolExecutor | None = None
+        self.dispatches = 0
+        # Monotonic time the current dispatch began in a worker; None while queued.
+        self.started_at: float | None = None
+        self.settled = False
+
+
+class PDFExtractionService:
+    """
+    Process pool that runs pdfplumber off the scheduler/API process.
+
+    `submit()` blocks once `max_pending` documents are queued or running, so
+    a page with many PDFs cannot pile up unbounded work. Each worker exits
+    after `max_tasks_per_child` documents to cap pdfplumber memory growth.
+    A document is abandoned after `timeout_seconds`. Workers report when
+    they begin a document, and a watchdog thread resolves any document that
+    has been running past its budget plus `TIMEOUT_GRACE_SECONDS` (stuck
+    where the in-worker timer cannot interrupt it) as timed out, then
+    rebuilds the pool. Documents still queued, or running in other workers
+    when the pool is rebuilt, are dispatched again rather than failed.
+
+    Args:
+        max_workers: Worker processes; defaults to `PDF_EXTRACT_WORKERS` or
+            the CPU count.
+        max_pending: Documents queued or running at once; defaults to
+            `PDF_EXTRACT_QUEUE_SIZE` or twice `max_workers`.
+        timeout_seconds: Per-document budget; defaults to
+            `PDF_EXTRACT_TIMEOUT_SECONDS` (60).
+        max_tasks_per_child: Documents per worker before it is replaced;
+            defaults to `PDF_EXTRACT_TASKS_PER_CHILD` (25).
+        inline_max_bytes: PDFs up to this size are sent to workers as bytes;
+            larger ones are handed over as a temp file path. Defaults to
+            `PDF_EXTRACT_INLINE_KB` (1024 KB).
+
+    Example:
+        futures = {service.submit(pdf_file): url for url, pdf_file in files}
+        for url, text in service.as_completed(futures):
+            ...
+    """
+
+    # Extra time a running document gets on top of `timeout_seconds` before
+    # the watchdog gives up on its worker.
+    TIMEOUT_GRACE_SECONDS = 5.0
+    # Times a document is sent to a worker before a broken pool fails it.
+    MAX_DISPATCHES = 3
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        timeout_seconds: float | None = None,
+        max_tasks_per_child: int | None = None,
+        inline_max_bytes: int | None = None,
+    ) -> None:
+        self.max_workers = int(max_workers or os.getenv("PDF_EXTRACT_WORKERS", os.cpu_count() or 2))
+        self.max_pending = int(
+            max_pending or os.getenv("PDF_EXTRACT_QUEUE_SIZE", self.max_workers * 2)
+        )
+        self.timeout_seconds = float(
+            timeout_seconds or os.getenv("PDF_EXTRACT_TIMEOUT_SECONDS", 60)
+        )
+        self.max_tasks_per_child = int(
+            max_tasks_per_child or os.getenv("PDF_EXTRACT_TASKS_PER_CHILD", 25)
+        )
+        self.inline_max_bytes = int(
+            inline_max_bytes or int(os.getenv("PDF_EXTRACT_INLINE_KB", 1024)) * 1024
+        )
+
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._tasks: dict[int, _ExtractionTask] = {}
+        self._task_ids = itertools.count(1)
+        self._start_queue: Any = None
+        self._watchdog: threading.Thread | None = None
+        self._counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "redispatched": 0,
+            "pool_restarts": 0,
+        }
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("PDFExtractionService is closed.")
+            if self._executor is None:
+                # "spawn" keeps workers free of the parent's threads and locks;
+                # worker recycling is not available with "fork" anyway.
+                context = multiprocessing.get_context("spawn")
+                if self._start_queue is None:
+                    self._start_queue = context.Queue()
+                    self._watchdog = threading.Thread(
+                        target=self._watch, name="pdf-extract-watchdog", daemon=True
+                    )
+                    self._watchdog.start()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=context,
+                    max_tasks_per_child=self.max_tasks_per_child,
+                    initializer=_init_worker,
+                    initargs=(self._start_queue,),
+                )
+            return self._executor
+
+    def _restart(self, executor: ProcessPoolExecutor) -> None:
+        """Tear down a broken or hung pool; the next submit builds a new one."""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self._counters["pool_restarts"] += 1
+        # ProcessPoolExecutor cannot cancel running work, so hung workers are killed.
+        for process in list(getattr(executor, "_processes", {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _prepare_source(self, pdf_file: IO[bytes]) -> tuple[bytes | str, str | None]:
+        size = pdf_file.seek(0, os.SEEK_END)
+        pdf_file.seek(0)
+        if size <= self.inline_max_bytes:
+            return pdf_file.read(), None
+
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as handoff:
+            shutil.copyfileobj(pdf_file, handoff)
+        return handoff.name, handoff.name
+
+    def submit(
+        self,
+        pdf_file: IO[bytes],
+        max_pages: int | None = None,
+        stop_check: Callable[[str], bool] | None = None,
+        backends: tuple[str, ...] | None = None,
+        start_page: int = 0,
+    ) -> Future:
+        """
+        Queue a PDF for text extraction, blocking while the queue is full.
+
+        The caller keeps ownership of `pdf_file` and may close it as soon as
+        this returns. `max_pages`, `stop_check` (which must be picklable),
+        `backends` and `start_page` are passed to `extract_pdf_text`.
+
+        Returns:
+            Future resolving to the `extract_pdf_text` result.
+        """
+        self._slots.acquire()
+        try:
+            source, handoff_path = self._prepare_source(pdf_file)
+        except BaseException:
+            self._slots.release()
+            raise
+        task = _ExtractionTask(
+            next(self._task_ids),
+            (source, self.timeout_seconds, max_pages, stop_check, backends, start_page),
+            handoff_path,
+        )
+        with self._lock:
+            self._tasks[task.id] = task
+        try:
+            self._dispatch(task)
+        except BaseException as exc:
+            self._finish(task, None, exc)
+            raise
+
+        with self._lock:
+            self._counters["submitted"] += 1
+        return task.future
+
+    def _dispatch(self, task: _ExtractionTask) -> None:
+        """Send a task to the current pool, rebuilding the pool once if it is broken."""
+        for attempt in range(2):
+            executor = self._get_executor()
+            with self._lock:
+                task.dispatches += 1
+                task.started_at = None
+                task.executor = executor
+                dispatch = task.dispatches
+            try:
+                inner = executor.submit(_run_task, task.id, dispatch, *task.args)
+            except BrokenProcessPool:
+                self._restart(executor)
+                if attempt:
+                    raise
+                continue
+            except RuntimeError:
+                # Shut down by a concurrent `_restart`; use the replacement pool.
+                if attempt or self._closed:
+                    raise
+                continue
+            inner.add_done_callback(partial(self._settle, task, executor, dispatch))
+            return
+
+    def _settle(
+        self, task: _ExtractionTask, executor: ProcessPoolExecutor, dispatch: int, inner: Future
+    ) -> None:
+        """Done-callback of one dispatch: resolve the task, or dispatch it again."""
+        if task.settled or dispatch != task.dispatches:
+            return
+        broken = inner.cancelled() or isinstance(inner.exception(), BrokenProcessPool)
+        if not broken:
+            self._finish(task, inner.result() if inner.exception() is None else None, inner.exception())
+            return
+
+        self._restart(executor)
+        # Work that was waiting in the queue, or healthy work that shared a
+        # worker pool with a hung or crashed document, is sent again.
+        if task.dispatches < self.MAX_DISPATCHES and not self._closed:
+            with self._lock:
+                self._counters["redispatched"] += 1
+            try:
+                self._dispatch(task)
+                return
+            except Exception as exc:
+                self._finish(task, None, exc)
+                return
+        self._finish(task, None, BrokenProcessPool("PDF extraction worker pool broke."))
+
+    def _finish(
+        self, task: _ExtractionTask, result: dict[str, Any] | None, error: BaseException | None
+    ) -> None:
+        with self._lock:
+            if task.settled:
+                return
+            task.settled = True
+            self._tasks.pop(task.id, None)
+        self._slots.release()
+        if task.handoff_path:
+            try:
+                os.unlink(task.handoff_path)
+            except OSError:
+                pass
+        if task.future.set_running_or_notify_cancel():
+            if error is not None:
+                task.future.set_exception(error)
+            else:
+                task.future.set_result(result)
+
+    def _watch(self) -> None:
+        """Record when workers begin documents and abandon those running past their budget."""
+        budget = self.timeout_seconds + self.TIMEOUT_GRACE_SECONDS
+        while not self._closed:
+            try:
+                task_id, dispatch = self._start_queue.get(timeout=1.0)
+            except queue.Empty:
+                task_id = None
+            except (EOFError, OSError, ValueError):
+                return
+            now = time.monotonic()
+            with self._lock:
+                task = self._tasks.get(task_id)
+                if task is not None and task.dispatches == dispatch:
+                    task.started_at = now
+                hung = [
+                    task
+                    for task in self._tasks.values()
+                    if task.started_at is not None and now - task.started_at > budget
+                ]
+            for task in hung:
+                self.logger.warning("Abandoning hung PDF extraction task %s.", task.id)
+                executor = task.executor
+                self._finish(
+                    task, None, PDFExtractionTimeout("PDF extraction worker stopped responding.")
+                )
+                if executor is not None:
+                    self._restart(executor)
+
+    def outcome(self, future: Future, key: Any) -> dict[str, Any] | None:
+        """
+        Return a finished future's `extract_pdf_text` result, logging failures.
+
+        A PDF that could not be parsed yields an empty result (as with inline
+        extraction); None means it timed out or its worker died, so the
+        result must not be cached as an empty document.
+        """
+        try:
+            result = future.result()
+        except PDFExtractionTimeout:
+            self.logger.warning("PDF extraction timed out after %ss: %s", self.timeout_seconds, key)
+            counter, result = "timed_out", None
+        except BrokenProcessPool:
+            self.logger.warning("PDF extraction worker died while processing %s", key)
+            counter, result = "failed", None
+        except Exception as exc:
+            self.logger.error("PDF text extraction failed for %s: %s", key, exc)
+            counter, result = "failed", {
+                "text": "",
+                "pages_read": 0,
+                "page_count": 0,
+                "backend": None,
+            }
+        else:
+            counter = "completed"
+        with self._lock:
+            self._counters[counter] += 1
+        return result
+
+    def as_completed(
+        self, futures: dict[Future, Any]
+    ) -> Iterator[tuple[Any, dict[str, Any] | None]]:
+        """
+        Yield `(key, outcome(future))` for submitted futures in completion order.
+
+        Every future resolves: documents stuck in a worker are resolved as
+        timed out by the watchdog, so a caller whose documents are only
+        queued behind other work simply waits for them.
+        """
+        for future in futures_as_completed(futures):
+            yield futures[future], self.outcome(future, futures[future])
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool configuration and extraction counters."""
+        with self._lock:
+            running = sum(1 for task in self._tasks.values() if task.started_at is not None)
+            return {
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "timeout_seconds": self.timeout_seconds,
+                "running": self._executor is not None,
+                "in_flight": len(self._tasks),
+                "started": running,
+                **self._counters,
+            }
+
+    def close(self) -> None:
+        """Shut the worker pool down."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pdf_extractor: PDFExtractionService | None = None
+_pdf_extractor_lock = threading.Lock()
+
+
+def get_pdf_extractor() -> PDFExtractionService:
+    """Return the process-wide PDF extraction service, creating it on first use."""
+    global _pdf_extractor
+    if _pdf_extractor is None:
+        with _pdf_extractor_lock:
+            if _pdf_extractor is None:
+                _pdf_extractor = PDFExtractionService()
+                atexit.register(_pdf_extractor.close)
+    return _pdf_extractor
+
+
+_followup_executor: ThreadPoolExecutor | None = None
+
+
+def get_pdf_followup_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide thread pool for work that follows an extraction.
+
+    Done-callbacks of `PDFExtractionService` futures run on the process
+    pool's result-handling thread, so anything slower than handing work over
+    to this pool (detail extraction, cache writes, database commits) would
+    hold up every other extraction result. Sized by `PDF_FOLLOWUP_WORKERS` (2).
+    """
+    global _followup_executor
+    if _followup_executor is None:
+        with _pdf_extractor_lock:
+            if _followup_executor is None:
+                _followup_executor = ThreadPoolExecutor(
+                    max_workers=int(os.getenv("PDF_FOLLOWUP_WORKERS", 2)),
+                    thread_name_prefix="pdf-followup",
+                )
+    return _followup_executor
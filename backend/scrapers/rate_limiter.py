@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import ipaddress
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    `reserve()` takes a token immediately, letting the balance go negative,
+    and returns how long the caller must wait before using it. Callers are
+    therefore served in arrival order without holding the lock while waiting.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = max(float(rate), 1e-6)
+        self.capacity = max(float(capacity), 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class DomainRateLimiter:
+    """
+    Process-wide rate limiter with one token bucket per hostname.
+
+    Limits are configured per domain; a configured domain also applies to its
+    subdomains (`upsc.gov.in` covers `www.upsc.gov.in`), but every hostname
+    still gets its own bucket.
+
+    Args:
+        default_rate: Requests per second allowed for hosts without an override.
+        default_burst: Bucket capacity for hosts without an override.
+        domain_limits: Mapping of domain to `{"rate": float, "burst": int}`.
+    """
+
+    def __init__(
+        self,
+        default_rate: float | None = None,
+        default_burst: float | None = None,
+        domain_limits: dict[str, dict[str, float]] | None = None,
+    ) -> None:
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.default_rate = float(default_rate or os.getenv("SCRAPER_RATE_LIMIT_PER_SECOND", 1.0))
+        self.default_burst = float(default_burst or os.getenv("SCRAPER_RATE_LIMIT_BURST", 3))
+        if domain_limits is None:
+            domain_limits = self._load_domain_limits()
+        self.domain_limits = {domain.lower(): limits for domain, limits in domain_limits.items()}
+
+        self._buckets: dict[str, TokenBucket] = {}
+        self._metrics: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _load_domain_limits(self) -> dict[str, dict[str, float]]:
+        raw = os.getenv("SCRAPER_DOMAIN_RATE_LIMITS")
+        if not raw:
+            return {}
+        try:
+            limits = json.loads(raw)
+        except ValueError:
+            self.logger.warning("Ignoring invalid SCRAPER_DOMAIN_RATE_LIMITS value.")
+            return {}
+        return limits if isinstance(limits, dict) else {}
+
+    def limits_for(self, host: str) -> tuple[float, float]:
+        """Return `(rate, burst)` for a hostname, using the closest configured domain."""
+        labels = host.split(".")
+        try:
+            ipaddress.ip_address(host)
+            labels = [host]
+        except ValueError:
+            pass
+        for index in range(len(labels)):
+            limits = self.domain_limits.get(".".join(labels[index:]))
+            if limits:
+                return (
+                    float(limits.get("rate", self.default_rate)),
+                    float(limits.get("burst", self.default_burst)),
+                )
+        return self.default_rate, self.default_burst
+
+    def _bucket_for(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.limits_for(host)
+                bucket = TokenBucket(rate, burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        """
+        Block until a request to `url`'s host is allowed.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        host = (urlparse(url).hostname or "").lower()
+        if not host:
+            return 0.0
+
+        wait_seconds = self._bucket_for(host).reserve()
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+        with self._lock:
+            metrics = self._metrics.setdefault(
+                host, {"requests": 0, "throttled": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0}
+            )
+            metrics["requests"] += 1
+            if wait_seconds > 0:
+                metrics["throttled"] += 1
+                metrics["wait_seconds"] += wait_seconds
+                metrics["max_wait_seconds"] = max(metrics["max_wait_seconds"], wait_seconds)
+        return wait_seconds
+
+    def stats(self) -> dict[str, Any]:
+        """Return total and per-host request counts and wait times."""
+        with self._lock:
+            hosts = {host: dict(metrics) for host, metrics in self._metrics.items()}
+        for metrics in hosts.values():
+            metrics["wait_seconds"] = round(metrics["wait_seconds"], 3)
+            metrics["max_wait_seconds"] = round(metrics["max_wait_seconds"], 3)
+
+        return {
+            "requests": sum(int(m["requests"]) for m in hosts.values()),
+            "throttled": sum(int(m["throttled"]) for m in hosts.values()),
+            "wait_seconds": round(sum(m["wait_seconds"] for m in hosts.values()), 3),
+            "hosts": hosts,
+        }
+
+
+_rate_limiter: DomainRateLimiter | None = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> DomainRateLimiter:
+    """Return the process-wide rate limiter, creating it on first use."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = DomainRateLimiter()
+    return _rate_limiter
+
+
+def configure_rate_limiter(**kwargs: Any) -> DomainRateLimiter:
+    """
+    Replace the process-wide rate limiter with a newly configured one.
+
+    Accepts the same keyword arguments as `DomainRateLimiter`.
+    """
+    global _rate_limiter
+    with _rate_limiter_lock:
+        _rate_limiter = DomainRateLimiter(**kwargs)
+    return _rate_limiter
@@ -13,6 +13,14 @@ class SSCScraper(BaseScraper):
     """Scraper for SSC notifications including HTML notices and linked PDFs."""
 
     DEFAULT_URL = "https://ssc.gov.in/"
+    SELECTORS = [
+        ".latest-news a",
+        ".notification a",
+        ".notice a",
+        "a[href*='notice']",
+        "a[href*='notification']",
+        "a[href*='pdf']",
+    ]
 
     def __init__(self, url: str | None = None, config: dict[str, Any] | None = None) -> None:
         super().__init__(url or self.DEFAULT_URL, config=config)
@@ -47,7 +55,7 @@ class SSCScraper(BaseScraper):
     def check_if_new(
         self, item: dict[str, Any], last_scraped_time: datetime | date | str | None
     ) -> bool:
-        dedupe_key = item.get("pdf_url") or f"{item.get('job_title','')}::{item.get('notification_date','')}"
+        dedupe_key = self.item_key(item)
         if dedupe_key in self._seen_keys:
             return False
         self._seen_keys.add(dedupe_key)
@@ -69,46 +77,42 @@ class SSCScraper(BaseScraper):
                 return True
         return True
 
-    def scrape(self, last_scraped_time: datetime | date | str | None = None) -> list[dict[str, Any]]:
-        soup = self.fetch_page(self.url)
-        if not soup:
-            page_source = self.fetch_with_selenium(self.url)
-            if not page_source:
-                return []
-            soup = BeautifulSoup(page_source, "lxml")
-
-        selectors = [
-            ".latest-news a",
-            ".notification a",
-            ".notice a",
-            "a[href*='notice']",
-            "a[href*='notification']",
-            "a[href*='pdf']",
-        ]
+    def listing_selectors(self) -> list[str]:
+        return [*self.SELECTORS, "a[href]"]
 
+    def parse_listing(
+        self, soup: BeautifulSoup, last_scraped_time: datetime | date | str | None = None
+    ) -> list[dict[str, Any]]:
         anchors: list[Tag] = []
-        for selector in selectors:
+        for selector in self.SELECTORS:
             anchors.extend([a for a in soup.select(selector) if isinstance(a, Tag)])
         if not anchors:
             anchors = [a for a in soup.select("a[href]") if isinstance(a, Tag)]
+        anchors = self.diff_listing(anchors)
 
-        results: list[dict[str, Any]] = []
+        items: list[dict[str, Any]] = []
         for anchor in anchors:
             item = self.parse_notification(anchor)
 
             title_lc = item["job_title"].lower()
-            if not any(k in title_lc for k in ["exam", "notification", "notice", "recruitment", "vacancy"]):
-                continue
+            if any(k in title_lc for k in ["exam", "notification", "notice", "recruitment", "vacancy"]):
+                items.append(item)
+        items = self.drop_seen_items(items)
+
+        pdf_results = self.fetch_pdf_details_many(
+            [item["pdf_url"] for item in items if item.get("pdf_url")]
+        )
 
+        results: list[dict[str, Any]] = []
+        for item in items:
             pdf_url = item.get("pdf_url")
             if pdf_url:
-                pdf_bytes = self.download_pdf(pdf_url)
-                if pdf_bytes:
-                    pdf_text = self.extract_text_from_pdf(pdf_bytes)
+                pdf_result = pdf_results.get(pdf_url)
+                if pdf_result is not None:
+                    pdf_text, extracted = pdf_result
                     if not pdf_text:
                         self.logger.warning("OCR needed for scanned SSC PDF: %s", pdf_url)
                         continue
-                    extracted = self.extract_job_details(pdf_text)
                     item["full_details"] = pdf_text
                     item["age_limit"] = extracted["age_limit"] or item["age_limit"]
                     item["qualification_required"] = (
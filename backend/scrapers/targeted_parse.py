@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# A leading compound selector we can test from a start tag alone: an optional
+# tag name followed by any number of .class, #id and [attr...] parts.
+_COMPOUND = re.compile(r"(?P<tag>[A-Za-z][\w-]*|\*)?(?P<parts>(?:[.#][\w-]+|\[[^\]]+\])*)")
+_PART = re.compile(r"\.(?P<cls>[\w-]+)|#(?P<id>[\w-]+)|\[\s*(?P<attr>[\w-]+)")
+# Combinators and pseudo-classes that depend on siblings or on markup outside
+# the matched subtree; selectors using them need the whole document.
+_UNSUPPORTED = re.compile(r"[+~:]")
+
+
+class _Compound:
+    """The outermost simple selector of a CSS selector, checked per start tag."""
+
+    def __init__(self, tag: str | None, classes: set[str], element_id: str | None, attrs: set[str]):
+        self.tag = tag
+        self.classes = classes
+        self.element_id = element_id
+        self.attrs = attrs
+
+    def matches(self, name: str, attrs: dict[str, Any]) -> bool:
+        if self.tag and self.tag != name:
+            return False
+        if self.element_id and attrs.get("id") != self.element_id:
+            return False
+        if self.classes:
+            value = attrs.get("class") or ""
+            present = set(value.split() if isinstance(value, str) else value)
+            if not self.classes <= present:
+                return False
+        # Attribute values are not compared; keeping extra nodes is harmless
+        # because `parse_listing` still runs the full selector on the result.
+        return all(attr in attrs for attr in self.attrs)
+
+
+def _leading_compound(selector: str) -> _Compound | None:
+    selector = selector.strip()
+    if not selector or _UNSUPPORTED.search(selector):
+        return None
+    match = _COMPOUND.match(selector)
+    if not match or not match.group(0):
+        return None
+    rest = selector[match.end():]
+    if rest and not rest[0].isspace() and rest[0] != ">":
+        return None
+
+    tag = match.group("tag")
+    classes: set[str] = set()
+    element_id = None
+    attrs: set[str] = set()
+    for part in _PART.finditer(match.group("parts")):
+        if part.group("cls"):
+            classes.add(part.group("cls"))
+        elif part.group("id"):
+            element_id = part.group("id")
+        else:
+            attrs.add(part.group("attr").lower())
+    return _Compound(None if tag in (None, "*") else tag.lower(), classes, element_id, attrs)
+
+
+def strainer_for(selectors: Iterable[str] | None) -> SoupStrainer | None:
+    """
+    Build a SoupStrainer keeping only the subtrees the given selectors can match.
+
+    Every element a selector matches lies inside an element matching the
+    selector's outermost compound (`.notice` in `.notice a[href]`), so
+    keeping those elements with their descendants is enough for `select`
+    to return the same elements from the smaller tree.
+
+    Returns:
+        SoupStrainer, or None when there are no selectors or one of them uses
+        syntax (sibling combinators, pseudo-classes) that needs the whole page.
+    """
+    compounds = []
+    for selector in selectors or ():
+        for part in selector.split(","):
+            compound = _leading_compound(part)
+            if compound is None:
+                return None
+            compounds.append(compound)
+    if not compounds:
+        return None
+
+    def keep(name: str, attrs: dict[str, Any]) -> bool:
+        return any(compound.matches(name, attrs or {}) for compound in compounds)
+
+    return SoupStrainer(keep)
+
+
+def parse_html(page_source: str, strainer: SoupStrainer | None = None) -> tuple[BeautifulSoup, dict[str, Any]]:
+    """
+    Parse HTML with lxml, building only the strained subtrees when given one.
+
+    Returns:
+        `(soup, stats)` where stats holds `parse_seconds`, `parse_nodes`
+        (elements in the built tree) and `parse_mode` ("targeted" or "full").
+    """
+    started = time.perf_counter()
+    soup = BeautifulSoup(page_source, "lxml", parse_only=strainer)
+    elapsed = time.perf_counter() - started
+    return soup, {
+        "parse_seconds": round(elapsed, 4),
+        "parse_nodes": sum(1 for _ in soup.find_all(True)),
+        "parse_mode": "targeted" if strainer is not None else "full",
+    }
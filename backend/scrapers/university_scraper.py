@@ -59,7 +59,7 @@ class UniversityScraper(BaseScraper):
     def check_if_new(
         self, item: dict[str, Any], last_scraped_time: datetime | date | str | None
     ) -> bool:
-        key = item.get("pdf_url") or f"{item.get('job_title')}::{item.get('notification_date')}"
+        key = self.item_key(item)
         if key in self._seen_keys:
             return False
         self._seen_keys.add(key)
@@ -98,31 +98,31 @@ class UniversityScraper(BaseScraper):
             candidates = [a for a in soup.select("a[href]") if isinstance(a, Tag)]
         return candidates
 
-    def scrape(self, last_scraped_time: datetime | date | str | None = None) -> list[dict[str, Any]]:
-        soup = self.fetch_page(self.url)
-        if not soup:
-            page_source = self.fetch_with_selenium(self.url)
-            if not page_source:
-                return []
-            soup = BeautifulSoup(page_source, "lxml")
+    def listing_selectors(self) -> list[str]:
+        return [*self.selectors, "a[href]"]
 
-        candidates = self._collect_candidates(soup)
-        output: list[dict[str, Any]] = []
+    def parse_listing(
+        self, soup: BeautifulSoup, last_scraped_time: datetime | date | str | None = None
+    ) -> list[dict[str, Any]]:
+        candidates = self.diff_listing(self._collect_candidates(soup))
+        items = [self.parse_notification(item_tag) for item_tag in candidates]
+        items = [item for item in items if self._is_relevant(item["job_title"], item["full_details"])]
+        items = self.drop_seen_items(items)
 
-        for item_tag in candidates:
-            item = self.parse_notification(item_tag)
-            if not self._is_relevant(item["job_title"], item["full_details"]):
-                continue
+        pdf_results = self.fetch_pdf_details_many(
+            [item["pdf_url"] for item in items if item.get("pdf_url")]
+        )
 
+        output: list[dict[str, Any]] = []
+        for item in items:
             pdf_url = item.get("pdf_url")
             if pdf_url:
-                pdf_bytes = self.download_pdf(pdf_url)
-                if pdf_bytes:
-                    pdf_text = self.extract_text_from_pdf(pdf_bytes)
+                pdf_result = pdf_results.get(pdf_url)
+                if pdf_result is not None:
+                    pdf_text, details = pdf_result
                     if not pdf_text:
                         self.logger.warning("OCR needed for scanned university PDF: %s", pdf_url)
                         continue
-                    details = self.extract_job_details(pdf_text)
                     item["full_details"] = pdf_text
                     item["last_date_to_apply"] = details["last_date_to_apply"]
                     item["age_limit"] = details["age_limit"] or "Not specified"
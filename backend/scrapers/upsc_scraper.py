@@ -46,7 +46,7 @@ class UPSCScraper(BaseScraper):
     def check_if_new(
         self, item: dict[str, Any], last_scraped_time: datetime | date | str | None
     ) -> bool:
-        key = item.get("pdf_url") or f"{item.get('job_title','')}::{item.get('notification_date','')}"
+        key = self.item_key(item)
         if key in self._seen_keys:
             return False
         self._seen_keys.add(key)
@@ -73,35 +73,40 @@ class UPSCScraper(BaseScraper):
                 return True
         return True
 
-    def scrape(self, last_scraped_time: datetime | date | str | None = None) -> list[dict[str, Any]]:
-        soup = self.fetch_page(self.url)
-        if not soup:
-            page_source = self.fetch_with_selenium(self.url)
-            if not page_source:
-                return []
-            soup = BeautifulSoup(page_source, "lxml")
+    def listing_selectors(self) -> list[str]:
+        return ["table tr", "tr"]
 
+    def parse_listing(
+        self, soup: BeautifulSoup, last_scraped_time: datetime | date | str | None = None
+    ) -> list[dict[str, Any]]:
         rows = soup.select("table tr")
         if not rows:
             rows = [row for row in soup.select("tr") if row.find("a", href=True)]
+        rows = self.diff_listing([row for row in rows if isinstance(row, Tag)])
 
-        results: list[dict[str, Any]] = []
+        items: list[dict[str, Any]] = []
         for row in rows:
             if not isinstance(row, Tag):
                 continue
             item = self.parse_notification(row)
-            if not item.get("job_title"):
-                continue
+            if item.get("job_title"):
+                items.append(item)
+        items = self.drop_seen_items(items)
 
+        pdf_results = self.fetch_pdf_details_many(
+            [item["pdf_url"] for item in items if item.get("pdf_url")]
+        )
+
+        results: list[dict[str, Any]] = []
+        for item in items:
             pdf_url = item.get("pdf_url")
             if pdf_url:
-                pdf_bytes = self.download_pdf(pdf_url)
-                if pdf_bytes:
-                    pdf_text = self.extract_text_from_pdf(pdf_bytes)
+                pdf_result = pdf_results.get(pdf_url)
+                if pdf_result is not None:
+                    pdf_text, pdf_details = pdf_result
                     if not pdf_text:
                         self.logger.warning("OCR needed for scanned UPSC PDF: %s", pdf_url)
                         continue
-                    pdf_details = self.extract_job_details(pdf_text)
                     item["full_details"] = pdf_text
                     item["age_limit"] = pdf_details["age_limit"] or item["age_limit"]
                     item["qualification_required"] = (
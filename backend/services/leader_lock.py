@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import or_, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from models import SchedulerLease, db
+
+
+class LeaseLost(RuntimeError):
+    """Raised by `LeaderLock.renew_if_due` when another process has taken the lease."""
+
+
+class LeaderLock:
+    """
+    Database-backed lease electing one scheduler process as leader.
+
+    The leader holds a row in `scheduler_leases` whose `expires_at` it keeps
+    pushing forward by calling `try_acquire` well within the lease length.
+    Any other process may take the row over once the lease has expired, so
+    a crashed leader is replaced after at most `ttl_seconds`.
+
+    Example:
+        lock = LeaderLock(app)
+        if lock.try_acquire():
+            ...  # run jobs, and call try_acquire again before the lease runs out
+    """
+
+    def __init__(self, app=None, name: str = "scheduler", ttl_seconds: int | None = None) -> None:
+        self.app = app
+        self.name = name
+        self.ttl_seconds = ttl_seconds or int(os.getenv("SCHEDULER_LEASE_SECONDS", "60"))
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        # Monotonic time of the last successful acquire or renewal.
+        self.renewed_at: float | None = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def renew_interval_seconds(self) -> float:
+        """How often the holder should renew: a third of the lease length."""
+        return self.ttl_seconds / 3
+
+    def renew_if_due(self) -> None:
+        """
+        Renew a held lease if `renew_interval_seconds` have passed since the last renewal.
+
+        Long passes that run while holding the lease call this between steps,
+        so the lease cannot expire under them. Does nothing when the lease is
+        not held.
+
+        Raises:
+            LeaseLost: The lease could not be renewed; stop acting as leader.
+        """
+        if not self.is_leader:
+            return
+        if self.renewed_at is not None and time.monotonic() - self.renewed_at < self.renew_interval_seconds:
+            return
+        if not self.try_acquire():
+            raise LeaseLost(f"Scheduler lease {self.name} was lost.")
+
+    def try_acquire(self, status: dict[str, Any] | None = None) -> bool:
+        """
+        Take the lease if it is free or expired, or renew it if already held.
+
+        `status`, when given, is stored on the lease row for other processes
+        to read through `lease_info`. Any database error counts as not
+        holding the lease, so a leader that cannot reach the database steps
+        down rather than running unfenced.
+        """
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=self.ttl_seconds)
+        values: dict[str, Any] = {"holder": self.holder, "expires_at": expires_at, "renewed_at": now}
+        if status is not None:
+            values["status"] = status
+        try:
+            with self.app.app_context():
+                result = db.session.execute(
+                    update(SchedulerLease)
+                    .where(
+                        SchedulerLease.name == self.name,
+                        or_(SchedulerLease.holder == self.holder, SchedulerLease.expires_at < now),
+                    )
+                    .values(**values)
+                )
+                if result.rowcount == 0:
+                    if db.session.get(SchedulerLease, self.name) is not None:
+                        db.session.rollback()
+                        return self._set_leader(False)
+                    db.session.add(SchedulerLease(name=self.name, **values))
+                db.session.commit()
+        except SQLAlchemyError:
+            # Includes losing a race to insert the first lease row.
+            self.logger.exception("Could not acquire scheduler lease %s", self.name)
+            return self._set_leader(False)
+        self.renewed_at = time.monotonic()
+        return self._set_leader(True)
+
+    def lease_info(self) -> dict[str, Any] | None:
+        """Return the current lease row (holder, times and published status), or None if unset."""
+        lease = db.session.get(SchedulerLease, self.name)
+        if lease is None:
+            return None
+        return {
+            "holder": lease.holder,
+            "renewed_at": lease.renewed_at.isoformat(),
+            "expires_at": lease.expires_at.isoformat(),
+            "active": lease.expires_at >= datetime.utcnow(),
+            "status": lease.status,
+        }
+
+    def release(self) -> None:
+        """Give the lease up early so a standby can take over without waiting."""
+        if not self.is_leader:
+            return
+        try:
+            with self.app.app_context():
+                db.session.execute(
+                    update(SchedulerLease)
+                    .where(SchedulerLease.name == self.name, SchedulerLease.holder == self.holder)
+                    .values(expires_at=datetime.utcnow())
+                )
+                db.session.commit()
+        except SQLAlchemyError:
+            self.logger.exception("Could not release scheduler lease %s", self.name)
+        self._set_leader(False)
+
+    def _set_leader(self, is_leader: bool) -> bool:
+        if is_leader != self.is_leader:
+            self.logger.info(
+                "%s scheduler lease %s as %s",
+                "Acquired" if is_leader else "Lost",
+                self.name,
+                self.holder,
+            )
+        self.is_leader = is_leader
+        return is_leader
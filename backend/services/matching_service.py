@@ -305,14 +305,21 @@ class MatchingService:
         # Missing age limit in notification implies eligible.
         return True
 
-    def _is_location_match(self, job_notification: Any, prefs: list[Any]) -> bool:
+    def uses_full_details(self, user_preferences: Any) -> bool:
+        """Return whether matching these preferences reads a notification's `full_details`."""
+        preferred = self._preferred_locations(self._normalize_preferences(user_preferences))
+        return bool(preferred) and "all india" not in preferred
+
+    def _preferred_locations(self, prefs: list[Any]) -> list[str]:
         preferred_locations: list[str] = []
         for pref in prefs:
             locs = getattr(pref, "preferred_locations", None)
             if isinstance(locs, list):
                 preferred_locations.extend([str(loc).strip().lower() for loc in locs if str(loc).strip()])
+        return sorted(set(preferred_locations))
 
-        preferred_unique = sorted(set(preferred_locations))
+    def _is_location_match(self, job_notification: Any, prefs: list[Any]) -> bool:
+        preferred_unique = self._preferred_locations(prefs)
         if not preferred_unique:
             return True
         if "all india" in preferred_unique:
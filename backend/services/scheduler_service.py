@@ -1,59 +1,384 @@
 from __future__ import annotations
 
+import hashlib
 import logging
-from datetime import date, datetime, timedelta
+import os
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
-from sqlalchemy.exc import SQLAlchemyError
-
-from models import JobNotification, MonitoredURL, SentAlert, User, UserPreference, db
-from scrapers import get_scraper
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from models import (
+    JobNotification,
+    MonitoredURL,
+    ScrapeRun,
+    SentAlert,
+    User,
+    UserPreference,
+    db,
+)
+from scrapers import AsyncScrapeEngine, get_scraper, runtime_stats
+from scrapers.date_parsing import match_date_format
 from services.email_service import EmailService
+from services.leader_lock import LeaderLock, LeaseLost
 from services.matching_service import MatchingService
+from services.seen_store import SeenItemStore
+from services.url_canonical import canonicalize_url
+
+# Fixed reference instant that per-source phase offsets are measured from.
+_PHASE_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Service whose scheduler is running jobs in this process; see `scrape_source_job`.
+_job_service: SchedulerService | None = None
+
+
+def scrape_source_job(source_url: str, attempt: int = 1) -> dict[str, Any]:
+    """
+    APScheduler entry point for scraping one source.
+
+    Jobs in the persistent job store must reference a module-level callable
+    rather than a bound method, so they call through to the running service.
+    """
+    if _job_service is None:
+        raise RuntimeError("No SchedulerService is running jobs in this process.")
+    return _job_service.scrape_source(source_url, attempt=attempt)
+
+
+def backfill_subscriber_job(monitored_url_id: int) -> int:
+    """APScheduler entry point for `SchedulerService.backfill_subscriber`; see `scrape_source_job`."""
+    if _job_service is None:
+        raise RuntimeError("No SchedulerService is running jobs in this process.")
+    return _job_service.backfill_subscriber(monitored_url_id)
 
 
 class SchedulerService:
     """APScheduler orchestration service for periodic scraping and alert delivery."""
 
+    # Non-ISO date formats accepted from scraper output.
+    COERCE_DATE_FORMATS = ("%d/%m/%Y", "%d-%m-%Y", "%d-%b-%Y", "%d %b %Y")
+
     def __init__(self, app=None) -> None:
         self.app = app
-        self.scheduler = BackgroundScheduler()
+        # Jobs this late still run (once, coalesced) instead of being skipped.
+        self.misfire_grace_seconds = int(os.getenv("SCHEDULER_MISFIRE_GRACE_SECONDS", "3600"))
+        # Gap between jobs that were overdue when this process became leader.
+        self.catchup_spacing_seconds = int(os.getenv("SCHEDULER_CATCHUP_SPACING_SECONDS", "30"))
+        # How often the leader diffs monitored URLs against registered jobs.
+        self.reconcile_interval_seconds = int(os.getenv("SCHEDULER_RECONCILE_SECONDS", "60"))
+        # Random delay added to every scheduled run, capped at a tenth of the interval.
+        self.jitter_seconds = int(os.getenv("SCHEDULER_JITTER_SECONDS", "300"))
+        # Adaptive frequency: a source is scraped every `adaptive_factor` times
+        # the hours since it last produced something new, kept between
+        # `min_frequency_hours` and its subscribers' frequency; see `_source_frequency`.
+        self.adaptive_frequency = os.getenv("SCHEDULER_ADAPTIVE", "true").strip().lower() in {
+            "1", "true", "yes", "on"
+        }
+        self.adaptive_factor = float(os.getenv("SCHEDULER_ADAPTIVE_FACTOR", "0.1"))
+        self.min_frequency_hours = int(os.getenv("SCHEDULER_MIN_FREQUENCY_HOURS", "1"))
+        # How long a run waits for the rest of partially read PDFs before
+        # saving and matching them on their first pages only.
+        self.full_text_wait_seconds = int(os.getenv("SCHEDULER_FULL_TEXT_WAIT_SECONDS", "120"))
+        self.scheduler = self._create_scheduler()
+        # Held while `self.scheduler` is started, replaced or has its jobs
+        # changed, so request threads never edit a scheduler being discarded.
+        self._scheduler_lock = threading.RLock()
         self.logger = logging.getLogger(self.__class__.__name__)
         self.email_service = EmailService()
         self.matching_service = MatchingService()
+        self.scrape_engine = AsyncScrapeEngine()
+        self.seen_store = SeenItemStore(app)
+        self.leader_lock = LeaderLock(app)
+        self._leader_thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
 
     def set_app(self, app) -> None:
         self.app = app
+        self.seen_store.app = app
+        self.leader_lock.app = app
+
+    def _create_scheduler(self) -> BackgroundScheduler:
+        """
+        Build an APScheduler backed by the app database.
+
+        Jobs and their next run times live in the `apscheduler_jobs` table, so
+        timers and pending retries survive restarts and leader changes.
+        """
+        job_defaults = {
+            "coalesce": True,
+            "max_instances": 1,
+            "misfire_grace_time": self.misfire_grace_seconds,
+        }
+        if not self.app:
+            return BackgroundScheduler(job_defaults=job_defaults)
+
+        with self.app.app_context():
+            engine = db.engine
+        return BackgroundScheduler(
+            jobstores={"default": SQLAlchemyJobStore(engine=engine, tablename="apscheduler_jobs")},
+            job_defaults=job_defaults,
+        )
 
     def schedule_scraping_jobs(self) -> int:
-        """Schedule scraping interval jobs for all active monitored URLs."""
+        """
+        Schedule one scraping interval job per distinct monitored source URL.
+
+        A source monitored by many users is fetched once per interval: the
+        shortest `scrape_frequency_hours` among its subscribers, or less while
+        the source is busy (see `_source_frequency`). See `reconcile_jobs`.
+
+        Returns:
+            Number of sources scheduled.
+        """
+        return self.reconcile_jobs()["sources"]
+
+    def reconcile_jobs(self) -> dict[str, int]:
+        """
+        Bring the registered scrape jobs in line with the monitored URLs in the database.
+
+        Jobs whose interval is unchanged keep their next run time. New sources
+        get a job whose first run is due right away, staggered
+        `catchup_spacing_seconds` apart. Sources whose interval changed,
+        through subscriber settings or adaptive frequency, are rescheduled,
+        and jobs (including pending retries) for sources nobody monitors any
+        more are removed. The leader runs this when it starts and every
+        `reconcile_interval_seconds`, which picks up URL changes made by
+        other processes, including alert backfills they flagged (see
+        `_enqueue_backfills`). The lease is renewed between sources, so a
+        long pass cannot outlive it.
+
+        Returns:
+            Counts of `sources`, `added`, `rescheduled` and `removed` jobs.
+        """
         if not self.app:
             raise RuntimeError("SchedulerService requires a Flask app instance.")
 
-        scheduled = 0
-        with self.app.app_context():
-            monitored_urls = MonitoredURL.query.filter_by(is_active=True).all()
-            for monitored_url in monitored_urls:
-                frequency = monitored_url.scrape_frequency_hours or 6
-                job_id = f"scrape_{monitored_url.id}"
-                self.scheduler.add_job(
-                    func=self.scrape_and_notify,
-                    trigger=IntervalTrigger(hours=frequency),
-                    args=[monitored_url.id],
-                    id=job_id,
-                    replace_existing=True,
-                    max_instances=1,
-                    coalesce=True,
+        frequencies = self._source_frequencies()
+        counts = {"sources": len(frequencies), "added": 0, "rescheduled": 0, "removed": 0}
+        wanted = {self._source_job_id(source_url) for source_url in frequencies}
+        with self._scheduler_lock:
+            for source_url, frequency in frequencies.items():
+                self.leader_lock.renew_if_due()
+                change = self._ensure_source_job(
+                    source_url,
+                    frequency,
+                    first_run_delay_seconds=counts["added"] * self.catchup_spacing_seconds,
                 )
-                scheduled += 1
-        return scheduled
+                if change:
+                    counts[change] += 1
+
+            for job in self.scheduler.get_jobs():
+                source_job_id = job.id.removeprefix("retry_")
+                if source_job_id.startswith("scrape_source_") and source_job_id not in wanted:
+                    job.remove()
+                    counts["removed"] += job.id == source_job_id
+        self._enqueue_backfills()
+
+        if counts["added"] or counts["rescheduled"] or counts["removed"]:
+            self.logger.info(
+                "Reconciled scrape jobs: %s added, %s rescheduled, %s removed (%s sources).",
+                counts["added"],
+                counts["rescheduled"],
+                counts["removed"],
+                counts["sources"],
+            )
+        return counts
+
+    def sync_source(self, source_url: str) -> bool:
+        """
+        Apply monitored-URL changes for one source to the running scheduler.
+
+        Called by the preference routes after a URL is added or removed. The
+        source's job is added, rescheduled or removed immediately when this
+        process runs the scheduler.
+
+        Returns:
+            False when no scheduler is running here; the leader's next
+            `reconcile_jobs` pass applies the change instead.
+        """
+        if not self.scheduler.running:
+            return False
+
+        with self.app.app_context():
+            rows = self._source_rows(source_url)
+            frequency = self._source_frequency(rows) if rows else None
+
+        job_id = self._source_job_id(source_url)
+        # The leader thread may stop or replace the scheduler meanwhile.
+        with self._scheduler_lock:
+            if not self.scheduler.running:
+                return False
+            if frequency is not None:
+                self._ensure_source_job(source_url, frequency)
+                self._enqueue_backfills()
+                return True
+            for stale_id in (job_id, f"retry_{job_id}"):
+                if self.scheduler.get_job(stale_id):
+                    self.scheduler.remove_job(stale_id)
+        self.logger.info("Removed scrape job for %s: no active subscribers.", source_url)
+        return True
+
+    def _source_frequencies(self) -> dict[str, int]:
+        """Map each active source to its current scrape interval in hours."""
+        with self.app.app_context():
+            return {
+                source_url: self._source_frequency(rows)
+                for source_url, rows in self._active_sources().items()
+            }
+
+    def _source_frequency(self, rows: list[MonitoredURL], now: datetime | None = None) -> int:
+        """
+        Pick a source's scrape interval from how recently it produced new items.
+
+        The interval is `adaptive_factor` times the hours since the source's
+        last new item, rounded to whole hours so reconciliation does not
+        reschedule it on every pass. A source that posted recently is scraped
+        more often, down to `min_frequency_hours`, and one that stays quiet
+        drifts back to the upper bound: the shortest `scrape_frequency_hours`
+        among subscribers, which is never exceeded. Sources that have not
+        posted since they were first scraped keep the subscribers' frequency.
+        """
+        user_frequency = min(row.scrape_frequency_hours or 6 for row in rows)
+        last_new = max(
+            (row.last_new_notification_at for row in rows if row.last_new_notification_at), default=None
+        )
+        if not self.adaptive_frequency or last_new is None:
+            return user_frequency
+
+        idle_hours = ((now or datetime.utcnow()) - last_new).total_seconds() / 3600
+        lower = min(self.min_frequency_hours, user_frequency)
+        return max(lower, min(user_frequency, round(idle_hours * self.adaptive_factor)))
+
+    @staticmethod
+    def _source_phase(source_url: str, interval: timedelta) -> timedelta:
+        """Deterministic offset of a source's runs within its interval, from a hash of the URL."""
+        interval_seconds = max(int(interval.total_seconds()), 1)
+        digest = hashlib.sha1(source_url.encode("utf-8")).hexdigest()
+        return timedelta(seconds=int(digest[:12], 16) % interval_seconds)
+
+    def source_trigger(self, source_url: str, frequency_hours: int) -> IntervalTrigger:
+        """
+        Build the interval trigger for a source, phase-shifted and jittered.
+
+        Runs fall on a grid offset from `_PHASE_EPOCH` by `_source_phase`, so
+        sources sharing an interval are scattered across it instead of firing
+        together, and each keeps its slot across restarts. Every run is then
+        delayed by up to `jitter_seconds` at random.
+        """
+        interval = timedelta(hours=frequency_hours)
+        jitter = min(self.jitter_seconds, int(interval.total_seconds()) // 10)
+        return IntervalTrigger(
+            hours=frequency_hours,
+            start_date=_PHASE_EPOCH + self._source_phase(source_url, interval),
+            jitter=jitter or None,
+        )
+
+    def load_histogram(self, window_hours: int = 24, bucket_minutes: int = 1) -> dict[datetime, int]:
+        """
+        Count the scrape runs planned per time bucket over the coming window.
+
+        Uses the phase-shifted run times of every active source without
+        jitter, which moves each run later by at most `jitter_seconds`.
+
+        Returns:
+            Run counts keyed by bucket start (UTC), for non-empty buckets only.
+        """
+        now = datetime.now(timezone.utc)
+        end = now + timedelta(hours=window_hours)
+        bucket_seconds = bucket_minutes * 60
+        counts: Counter[datetime] = Counter()
+        for source_url, frequency in self._source_frequencies().items():
+            interval = timedelta(hours=frequency)
+            start = _PHASE_EPOCH + self._source_phase(source_url, interval)
+            run_at = start + -((start - now) // interval) * interval
+            while run_at < end:
+                offset = (run_at - _PHASE_EPOCH).total_seconds() // bucket_seconds * bucket_seconds
+                counts[_PHASE_EPOCH + timedelta(seconds=offset)] += 1
+                run_at += interval
+        return dict(sorted(counts.items()))
+
+    def _ensure_source_job(
+        self, source_url: str, frequency_hours: int, first_run_delay_seconds: float = 0
+    ) -> str | None:
+        """Add or reschedule a source's interval job; returns "added", "rescheduled" or None."""
+        job_id = self._source_job_id(source_url)
+        job = self.scheduler.get_job(job_id)
+        trigger = self.source_trigger(source_url, frequency_hours)
+        if job is None:
+            # The first run comes soon; later runs settle into the source's phase.
+            self.scheduler.add_job(
+                func=scrape_source_job,
+                trigger=trigger,
+                args=[source_url],
+                id=job_id,
+                replace_existing=True,
+                next_run_time=datetime.now(timezone.utc) + timedelta(seconds=first_run_delay_seconds),
+            )
+            return "added"
+        current = job.trigger
+        if (
+            getattr(current, "interval", None) == trigger.interval
+            and getattr(current, "start_date", None) == trigger.start_date
+            and getattr(current, "jitter", None) == trigger.jitter
+        ):
+            return None
+
+        # The next phase slot is never more than one interval away.
+        job.reschedule(trigger=trigger)
+        return "rescheduled"
+
+    def _spread_overdue_jobs(self) -> int:
+        """
+        Stagger jobs that came due while no scheduler was running.
+
+        After a restart every overdue source would otherwise fire at once;
+        instead they run `catchup_spacing_seconds` apart, most overdue first.
+        Interval jobs keep the new phase on later runs.
+        """
+        now = datetime.now(self.scheduler.timezone)
+        overdue = sorted(
+            (job for job in self.scheduler.get_jobs() if job.next_run_time and job.next_run_time <= now),
+            key=lambda job: job.next_run_time,
+        )
+        for index, job in enumerate(overdue):
+            self.leader_lock.renew_if_due()
+            job.modify(next_run_time=now + timedelta(seconds=index * self.catchup_spacing_seconds))
+        if overdue:
+            self.logger.info(
+                "Spread %s overdue jobs over %s seconds.",
+                len(overdue),
+                (len(overdue) - 1) * self.catchup_spacing_seconds,
+            )
+        return len(overdue)
 
     def scrape_and_notify(self, monitored_url_id: int, attempt: int = 1) -> dict[str, Any]:
+        """Scrape the source of one monitored URL and alert all of its subscribers."""
+        if not self.app:
+            self.logger.error("App context missing. Cannot run scraping job.")
+            return {"success": False, "notifications_found": 0, "message": "App context missing."}
+
+        with self.app.app_context():
+            monitored_url = db.session.get(MonitoredURL, monitored_url_id)
+            if not monitored_url or not monitored_url.is_active:
+                self.logger.info("Monitored URL %s is missing/inactive. Skipping.", monitored_url_id)
+                return {"success": False, "notifications_found": 0, "message": "Monitored URL missing/inactive."}
+            source_url = monitored_url.canonical_url or canonicalize_url(monitored_url.url)
+        return self.scrape_source(source_url, attempt=attempt)
+
+    def scrape_source(self, source_url: str, attempt: int = 1) -> dict[str, Any]:
         """
-        Scrape one monitored URL and send alerts for matching users.
+        Scrape one source once and send alerts to every subscribing user.
+
+        `source_url` is the canonical URL shared by the subscribing rows; the
+        oldest row's own URL is the one fetched. Fetching and parsing run on
+        `scrape_engine`, under the same concurrency caps as batch scrapes.
 
         Retries once after 1 hour when scraper execution fails.
         """
@@ -61,83 +386,175 @@ class SchedulerService:
             self.logger.error("App context missing. Cannot run scraping job.")
             return {"success": False, "notifications_found": 0, "message": "App context missing."}
 
+        started_at = datetime.utcnow()
         try:
             with self.app.app_context():
-                monitored_url = MonitoredURL.query.get(monitored_url_id)
-                if not monitored_url or not monitored_url.is_active:
-                    self.logger.info("Monitored URL %s is missing/inactive. Skipping.", monitored_url_id)
-                    return {"success": False, "notifications_found": 0, "message": "Monitored URL missing/inactive."}
-
-                scraper = get_scraper(
-                    monitored_url.url,
-                    scraper_type=monitored_url.scraper_type,
-                    config={
-                        "organization_name": monitored_url.website_name or "Not specified",
-                    },
-                )
-
-                notifications = scraper.scrape(last_scraped_time=monitored_url.last_scraped_at)
-                saved_count = 0
+                rows = self._source_rows(source_url)
+                if not rows:
+                    self.logger.info("No active subscribers for %s. Skipping.", source_url)
+                    return {"success": False, "notifications_found": 0, "message": "Source has no active subscribers."}
 
-                for notification in notifications:
-                    job_notification = self._get_or_create_notification(notification)
-                    if job_notification is None:
-                        continue
-                    saved_count += 1
-                    self._process_alerts_for_notification(monitored_url, job_notification)
-
-                monitored_url.last_scraped_at = datetime.utcnow()
-                db.session.commit()
-                self.logger.info(
-                    "Scraped %s - Found %s notifications",
-                    monitored_url.url,
-                    len(notifications),
-                )
-                return {
-                    "success": True,
-                    "notifications_found": len(notifications),
-                    "new_notifications_saved": saved_count,
-                    "message": "Scrape completed.",
-                }
-        except Exception as e:
-            print(f"[ERROR] SCRAPER ERROR for URL ID {monitored_url_id}")
-            print(f"[ERROR] Error: {str(e)}")
-            import traceback
-
-            traceback.print_exc()
-            self.logger.exception("Scraping job failed for monitored_url_id=%s", monitored_url_id)
+                scraper = self._build_scraper(rows[0], full_text=self._needs_full_text(rows))
+                notifications = self.scrape_engine.scrape(scraper, rows[0].last_scraped_at)
+                return self._save_scrape_results(rows, scraper, notifications, started_at)
+        except Exception:
+            self.logger.exception("Scraping job failed for %s", source_url)
 
             try:
                 with self.app.app_context():
-                    monitored_url = MonitoredURL.query.get(monitored_url_id)
-                    if monitored_url:
-                        monitored_url.last_scraped_at = datetime.now()
+                    rows = self._source_rows(source_url)
+                    if rows:
+                        for row in rows:
+                            row.last_scraped_at = datetime.now()
+                        self._record_scrape_run(rows[0].id, started_at=started_at, success=False)
                         db.session.commit()
             except Exception:
                 pass
 
-            self._schedule_retry(monitored_url_id, attempt)
+            self._schedule_retry(source_url, attempt)
             return {
                 "success": False,
                 "notifications_found": 0,
                 "message": "Scrape failed; retry scheduled if eligible.",
             }
 
+    def scrape_batch(self, monitored_url_ids: list[int] | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Scrape many sources concurrently with `AsyncScrapeEngine`.
+
+        Each distinct source URL is fetched once. Fetching and parsing run
+        concurrently under the engine's global and per-host caps; results
+        are then persisted and fanned out one source at a time exactly like
+        `scrape_source`.
+
+        Args:
+            monitored_url_ids: Scrape the sources of these monitored URLs;
+                defaults to all active sources.
+
+        Returns:
+            Result dictionary per source URL.
+        """
+        if not self.app:
+            raise RuntimeError("SchedulerService requires a Flask app instance.")
+
+        results: dict[str, dict[str, Any]] = {}
+        with self.app.app_context():
+            sources = self._active_sources()
+            if monitored_url_ids is not None:
+                wanted = set(monitored_url_ids)
+                sources = {
+                    source_url: rows
+                    for source_url, rows in sources.items()
+                    if any(row.id in wanted for row in rows)
+                }
+
+            started_at = datetime.utcnow()
+            scrapers = {
+                source_url: self._build_scraper(rows[0], full_text=self._needs_full_text(rows))
+                for source_url, rows in sources.items()
+            }
+            outcomes = self.scrape_engine.run(
+                (source_url, scraper, sources[source_url][0].last_scraped_at)
+                for source_url, scraper in scrapers.items()
+            )
+
+            for source_url, outcome in outcomes.items():
+                rows = sources[source_url]
+                if outcome["error"] is None:
+                    try:
+                        results[source_url] = self._save_scrape_results(
+                            rows, scrapers[source_url], outcome["notifications"], started_at
+                        )
+                        continue
+                    except Exception:
+                        db.session.rollback()
+                        self.logger.exception("Saving batch results failed for %s", source_url)
+
+                for row in rows:
+                    row.last_scraped_at = datetime.utcnow()
+                self._record_scrape_run(rows[0].id, started_at=started_at, success=False)
+                db.session.commit()
+                self._schedule_retry(source_url, attempt=1)
+                results[source_url] = {
+                    "success": False,
+                    "notifications_found": 0,
+                    "message": "Scrape failed; retry scheduled if eligible.",
+                }
+        return results
+
     def start_scheduler(self) -> None:
-        """Start APScheduler and register all scraping jobs."""
-        if self.scheduler.running:
+        """
+        Start competing for scheduler leadership in a background thread.
+
+        Scraping jobs are registered and run only while this process holds the
+        database `LeaderLock`. Standby processes keep renewing their claim
+        and take over once the leader's lease expires, so any number of
+        processes can call this and jobs still run once.
+        """
+        if not self.app:
+            raise RuntimeError("SchedulerService requires a Flask app instance.")
+        if self._leader_thread and self._leader_thread.is_alive():
             self.logger.info("Scheduler already running.")
             return
 
-        job_count = self.schedule_scraping_jobs()
-        self.scheduler.start()
-        self.logger.info("Scheduler started with %s jobs", job_count)
+        self._stop_event.clear()
+        self._leader_thread = threading.Thread(
+            target=self._lead, name="scheduler-leader", daemon=True
+        )
+        self._leader_thread.start()
 
     def stop_scheduler(self) -> None:
-        """Gracefully stop APScheduler."""
-        if self.scheduler.running:
-            self.scheduler.shutdown(wait=False)
-            self.logger.info("Scheduler stopped.")
+        """Gracefully stop APScheduler and hand leadership to a standby."""
+        self._stop_event.set()
+        if self._leader_thread and self._leader_thread is not threading.current_thread():
+            self._leader_thread.join(timeout=5)
+        self._stop_jobs()
+        self.leader_lock.release()
+
+    def _lead(self) -> None:
+        global _job_service
+        last_reconciled = 0.0
+        while not self._stop_event.is_set():
+            try:
+                # A running leader publishes its scraper counters with each renewal.
+                status = runtime_stats() if self.scheduler.running else None
+                if self.leader_lock.try_acquire(status=status):
+                    if not self.scheduler.running:
+                        with self._scheduler_lock:
+                            _job_service = self
+                            # Start paused so persisted jobs can be reconciled and
+                            # staggered before any of them fires.
+                            self.scheduler.start(paused=True)
+                            try:
+                                job_count = self.schedule_scraping_jobs()
+                                self._spread_overdue_jobs()
+                            except BaseException:
+                                # Never leave a paused scheduler behind; retry next turn.
+                                self._stop_jobs()
+                                raise
+                            self.scheduler.resume()
+                        last_reconciled = time.monotonic()
+                        self.logger.info("Scheduler started with %s jobs", job_count)
+                    elif time.monotonic() - last_reconciled >= self.reconcile_interval_seconds:
+                        self.reconcile_jobs()
+                        last_reconciled = time.monotonic()
+                elif self.scheduler.running:
+                    self.logger.warning("Scheduler lease lost; stopping jobs.")
+                    self._stop_jobs()
+            except LeaseLost:
+                self.logger.warning("Scheduler lease lost during reconciliation; stopping jobs.")
+                self._stop_jobs()
+            except Exception:
+                self.logger.exception("Scheduler leadership check failed.")
+            self._stop_event.wait(self.leader_lock.renew_interval_seconds)
+
+    def _stop_jobs(self) -> None:
+        with self._scheduler_lock:
+            if self.scheduler.running:
+                self.scheduler.shutdown(wait=False)
+                self.logger.info("Scheduler stopped.")
+                # A shut-down APScheduler cannot be restarted; start afresh if leadership returns.
+                self.scheduler = self._create_scheduler()
 
     def run_manual_scrape(self, monitored_url_id: int) -> dict[str, Any]:
         """Run immediate scrape for one monitored URL (useful for dashboard testing)."""
@@ -148,36 +565,324 @@ class SchedulerService:
             self.logger.exception("Manual scrape failed for monitored_url_id=%s", monitored_url_id)
             return {"success": False, "notifications_found": 0, "message": str(exc)}
 
-    def _schedule_retry(self, monitored_url_id: int, attempt: int) -> None:
+    def _enqueue_backfills(self) -> int:
+        """
+        Queue a one-off `backfill_subscriber` job for each URL flagged `alerts_backfill_pending`.
+
+        The preference routes only set the flag; the leader runs the backfill
+        on its job pool, from `sync_source` or its next `reconcile_jobs`.
+        """
+        with self.app.app_context():
+            pending_ids = [
+                row.id
+                for row in MonitoredURL.query.filter(
+                    MonitoredURL.alerts_backfill_pending.is_(True), MonitoredURL.is_active.is_(True)
+                ).with_entities(MonitoredURL.id)
+            ]
+        queued = 0
+        with self._scheduler_lock:
+            if not self.scheduler.running:
+                return 0
+            for monitored_url_id in pending_ids:
+                job_id = f"backfill_{monitored_url_id}"
+                if self.scheduler.get_job(job_id):
+                    continue
+                self.scheduler.add_job(
+                    func=backfill_subscriber_job,
+                    trigger=DateTrigger(run_date=datetime.now(timezone.utc)),
+                    args=[monitored_url_id],
+                    id=job_id,
+                    replace_existing=True,
+                )
+                queued += 1
+        if queued:
+            self.logger.info("Queued alert backfills for %s new subscriptions.", queued)
+        return queued
+
+    def backfill_subscriber(self, monitored_url_id: int) -> int:
+        """
+        Alert a new subscriber to notices their source already lists.
+
+        A source is scraped once for all its subscribers and only new items
+        trigger alerts, so someone who adds a URL that is already monitored
+        would otherwise never hear about its current notices. Active
+        notifications from the source whose last date has not passed are
+        matched against the subscriber as if they had just been scraped, and
+        the row's `alerts_backfill_pending` flag is cleared. Runs as a job on
+        the leader; see `_enqueue_backfills`.
+
+        Returns:
+            Number of notifications checked.
+        """
+        with self.app.app_context():
+            monitored_url = db.session.get(MonitoredURL, monitored_url_id)
+            if monitored_url is None:
+                return 0
+            monitored_url.alerts_backfill_pending = False
+            source_url = monitored_url.canonical_url or canonicalize_url(monitored_url.url)
+            subscribers = self._load_subscribers([monitored_url]) if monitored_url.is_active else []
+            if not subscribers:
+                db.session.commit()
+                return 0
+
+            source_rows = self._source_rows(source_url)
+            legacy_source_urls = sorted({row.url for row in source_rows} | {monitored_url.url})
+            notifications = (
+                JobNotification.query.filter(
+                    JobNotification.is_active.is_(True),
+                    or_(
+                        JobNotification.last_date_to_apply.is_(None),
+                        JobNotification.last_date_to_apply >= date.today(),
+                    ),
+                    or_(
+                        JobNotification.canonical_source_url == source_url,
+                        and_(
+                            JobNotification.canonical_source_url.is_(None),
+                            JobNotification.source_url.in_(legacy_source_urls),
+                        ),
+                    ),
+                )
+                .order_by(JobNotification.id)
+                .all()
+            )
+            for job_notification in notifications:
+                self._process_alerts_for_notification(job_notification, subscribers)
+            db.session.commit()
+            self.logger.info(
+                "Backfilled %s notifications from %s for user_id=%s",
+                len(notifications),
+                source_url,
+                monitored_url.user_id,
+            )
+            return len(notifications)
+
+    def _schedule_retry(self, source_url: str, attempt: int) -> None:
         if attempt >= 2:
             return
-        retry_id = f"retry_scrape_{monitored_url_id}"
-        self.scheduler.add_job(
-            func=self.scrape_and_notify,
-            trigger=DateTrigger(run_date=datetime.utcnow() + timedelta(hours=1)),
-            args=[monitored_url_id, attempt + 1],
-            id=retry_id,
-            replace_existing=True,
-            max_instances=1,
+        retry_id = f"retry_{self._source_job_id(source_url)}"
+        with self._scheduler_lock:
+            if not self.scheduler.running:
+                # Only the leader writes to the shared job store; the source's
+                # interval job will pick it up again.
+                self.logger.info("No scheduler running here; not scheduling a retry for %s.", source_url)
+                return
+            self.scheduler.add_job(
+                func=scrape_source_job,
+                trigger=DateTrigger(run_date=datetime.now(timezone.utc) + timedelta(hours=1)),
+                args=[source_url, attempt + 1],
+                id=retry_id,
+                replace_existing=True,
+            )
+        self.logger.info("Scheduled retry for %s after 1 hour.", source_url)
+
+    @staticmethod
+    def _source_job_id(source_url: str) -> str:
+        # URLs can exceed job-store ID limits, so jobs are keyed by a digest.
+        return f"scrape_source_{hashlib.sha1(source_url.encode('utf-8')).hexdigest()[:16]}"
+
+    def _active_sources(self) -> dict[str, list[MonitoredURL]]:
+        """Group active monitored URL rows by canonical URL, oldest row first."""
+        sources: dict[str, list[MonitoredURL]] = {}
+        missing_canonical = False
+        for row in MonitoredURL.query.filter_by(is_active=True).order_by(MonitoredURL.id).all():
+            if not row.canonical_url:
+                row.canonical_url = canonicalize_url(row.url)
+                missing_canonical = True
+            sources.setdefault(row.canonical_url, []).append(row)
+        if missing_canonical:
+            db.session.commit()
+        return sources
+
+    def _source_rows(self, source_url: str) -> list[MonitoredURL]:
+        return (
+            MonitoredURL.query.filter_by(canonical_url=source_url, is_active=True)
+            .order_by(MonitoredURL.id)
+            .all()
+        )
+
+    def _needs_full_text(self, source_rows: list[MonitoredURL]) -> bool:
+        """Return whether any subscriber is matched on text past a PDF's first pages."""
+        return any(
+            self.matching_service.uses_full_details(preferences)
+            for _, preferences in self._load_subscribers(source_rows)
+        )
+
+    def _build_scraper(self, monitored_url: MonitoredURL, full_text: bool = False):
+        return get_scraper(
+            monitored_url.url,
+            scraper_type=monitored_url.scraper_type,
+            config={
+                "organization_name": monitored_url.website_name or "Not specified",
+                "http_validators": monitored_url.http_validators or {},
+                "content_fingerprint": monitored_url.content_fingerprint,
+                "listing_snapshot": monitored_url.listing_snapshot,
+                "render_strategy": monitored_url.render_strategy,
+                "runs_since_static_probe": monitored_url.runs_since_static_probe,
+                "seen_store": self.seen_store,
+                "seen_source": monitored_url.canonical_url or canonicalize_url(monitored_url.url),
+                "pdf_full_text": full_text,
+            },
+        )
+
+    def _save_scrape_results(
+        self,
+        source_rows: list[MonitoredURL],
+        scraper,
+        notifications: list[dict[str, Any]],
+        started_at: datetime,
+    ) -> dict[str, Any]:
+        """
+        Persist one source's scrape and alert its subscribers.
+
+        Scraper state is written to every subscribing row, so whichever row
+        is oldest next time starts from the same validators and fingerprint;
+        the run itself is recorded against the first row. PDFs still being
+        read past their first pages are waited for, so notifications are
+        saved and matched on their full text.
+        """
+        primary = source_rows[0]
+        subscribers = self._load_subscribers(source_rows)
+        scraper.complete_full_texts(notifications, timeout=self.full_text_wait_seconds)
+        saved_count = 0
+        unsaved_keys: set[str] = set()
+        for notification in notifications:
+            job_notification = self._get_or_create_notification(
+                notification, primary.canonical_url, legacy_source_urls=[row.url for row in source_rows]
+            )
+            if job_notification is None:
+                unsaved_keys.add(scraper.item_key(notification))
+                continue
+            saved_count += 1
+            self._process_alerts_for_notification(job_notification, subscribers)
+
+        http_validators = scraper.export_http_validators()
+        render_state = scraper.export_render_state()
+        scraped_at = datetime.utcnow()
+        # Items that failed to save or whose PDF could not be read stay unseen,
+        # and the previous listing snapshot is kept so the next run's diff
+        # offers them again; the seen store filters out everything else.
+        retry_keys = unsaved_keys | scraper.incomplete_item_keys
+        newly_seen = scraper.new_item_keys - retry_keys
+        # On a source's first run every item is "new"; that is not activity.
+        baseline_run = scraper.previous_listing is None and not self.seen_store.has_items(
+            scraper.seen_source
+        )
+        listing_snapshot = None if retry_keys else scraper.export_listing_snapshot()
+        if retry_keys:
+            # A 304 or fingerprint hit would otherwise skip the listing entirely.
+            http_validators.pop(scraper.url, None)
+        for row in source_rows:
+            row.http_validators = http_validators
+            if scraper.content_fingerprint and not retry_keys:
+                row.content_fingerprint = scraper.content_fingerprint
+            if listing_snapshot is not None:
+                row.listing_snapshot = listing_snapshot
+            row.render_strategy = render_state["render_strategy"]
+            row.runs_since_static_probe = render_state["runs_since_static_probe"]
+            row.last_scraped_at = scraped_at
+            if newly_seen and not baseline_run:
+                row.last_new_notification_at = scraped_at
+        self.seen_store.mark_seen(scraper.seen_source, newly_seen)
+        self._record_scrape_run(
+            primary.id,
+            started_at=started_at,
+            success=True,
+            notifications_found=len(notifications),
+            new_notifications_saved=saved_count,
+            stats={**scraper.run_stats, "subscribers": len(subscribers)},
         )
+        db.session.commit()
         self.logger.info(
-            "Scheduled retry for monitored_url_id=%s after 1 hour.",
-            monitored_url_id,
+            "Scraped %s - Found %s notifications for %s subscribers%s",
+            primary.canonical_url,
+            len(notifications),
+            len(subscribers),
+            " (unchanged)" if scraper.listing_unchanged else "",
         )
+        return {
+            "success": True,
+            "notifications_found": len(notifications),
+            "new_notifications_saved": saved_count,
+            "listing_unchanged": scraper.listing_unchanged,
+            "listing_added": scraper.run_stats.get("listing_added"),
+            "listing_removed": scraper.run_stats.get("listing_removed"),
+            "subscribers": len(subscribers),
+            "message": "Scrape completed.",
+        }
+
+    def _record_scrape_run(
+        self,
+        monitored_url_id: int,
+        started_at: datetime,
+        success: bool,
+        notifications_found: int = 0,
+        new_notifications_saved: int = 0,
+        stats: dict[str, Any] | None = None,
+    ) -> None:
+        stats = dict(stats or {})
+        fingerprint = stats.get("fingerprint")
+        db.session.add(
+            ScrapeRun(
+                monitored_url_id=monitored_url_id,
+                started_at=started_at,
+                finished_at=datetime.utcnow(),
+                success=success,
+                notifications_found=notifications_found,
+                new_notifications_saved=new_notifications_saved,
+                fingerprint_hit=None if fingerprint is None else fingerprint == "hit",
+                stats=stats,
+            )
+        )
+
+    def _get_or_create_notification(
+        self,
+        data: dict[str, Any],
+        canonical_source_url: str | None = None,
+        legacy_source_urls: list[str] | None = None,
+    ) -> JobNotification | None:
+        """
+        Return the notification with this title from this source, creating it if needed.
 
-    def _get_or_create_notification(self, data: dict[str, Any]) -> JobNotification | None:
+        Rows saved before `canonical_source_url` existed (and not yet
+        backfilled by `migrate_canonical_urls.py`) have it NULL; they are
+        matched on their raw `source_url` instead and get it filled in.
+        """
         title = (data.get("job_title") or "Not specified").strip()
         source_url = (data.get("source_url") or "").strip()
         if not source_url:
             source_url = data.get("pdf_url") or "Not specified"
-
-        existing = JobNotification.query.filter_by(job_title=title, source_url=source_url).first()
+        canonical_source_url = canonical_source_url or canonicalize_url(source_url)
+        legacy_source_urls = {source_url, *(legacy_source_urls or ())}
+
+        existing = (
+            JobNotification.query.filter(
+                JobNotification.job_title == title,
+                or_(
+                    JobNotification.canonical_source_url == canonical_source_url,
+                    and_(
+                        JobNotification.canonical_source_url.is_(None),
+                        JobNotification.source_url.in_(sorted(legacy_source_urls)),
+                    ),
+                ),
+            )
+            .order_by(JobNotification.id)
+            .first()
+        )
         if existing:
+            if existing.canonical_source_url is None:
+                existing.canonical_source_url = canonical_source_url
+            # Fill fields an earlier run left empty, e.g. because its PDF timed out.
+            for field in ("age_limit", "qualification_required"):
+                if getattr(existing, field) in (None, "Not specified") and data.get(field):
+                    setattr(existing, field, data[field])
+            if existing.last_date_to_apply is None:
+                existing.last_date_to_apply = self._coerce_date(data.get("last_date_to_apply"))
             return existing
 
         try:
             job = JobNotification(
                 source_url=source_url,
+                canonical_source_url=canonical_source_url,
                 job_title=title,
                 organization=data.get("organization") or "Not specified",
                 notification_date=self._coerce_date(data.get("notification_date")),
@@ -189,27 +894,43 @@ class SchedulerService:
                 pdf_url=data.get("pdf_url"),
                 is_active=True,
             )
-            db.session.add(job)
-            db.session.flush()
+            # A savepoint, so a failed insert does not roll back the rest of the run.
+            with db.session.begin_nested():
+                db.session.add(job)
             return job
         except SQLAlchemyError:
-            db.session.rollback()
             self.logger.exception("Failed to persist JobNotification for title=%s", title)
             return None
 
+    def _load_subscribers(
+        self, source_rows: list[MonitoredURL]
+    ) -> list[tuple[User, list[UserPreference]]]:
+        """Load active subscribers of a source with their preferences, once per run."""
+        user_ids = sorted({row.user_id for row in source_rows if row.user_id})
+        if not user_ids:
+            return []
+
+        preferences: dict[int, list[UserPreference]] = {}
+        for preference in UserPreference.query.filter(UserPreference.user_id.in_(user_ids)).all():
+            preferences.setdefault(preference.user_id, []).append(preference)
+        users = User.query.filter(User.id.in_(user_ids), User.is_active.is_(True)).order_by(User.id).all()
+        return [(user, preferences[user.id]) for user in users if user.id in preferences]
+
     def _process_alerts_for_notification(
-        self, monitored_url: MonitoredURL, job_notification: JobNotification
+        self,
+        job_notification: JobNotification,
+        subscribers: list[tuple[User, list[UserPreference]]],
     ) -> None:
-        user_rows = MonitoredURL.query.filter_by(url=monitored_url.url, is_active=True).all()
-        user_ids = sorted({row.user_id for row in user_rows if row.user_id})
-
-        for user_id in user_ids:
-            user = User.query.get(user_id)
-            if not user or not user.is_active:
-                continue
+        already_sent = {
+            alert.user_id
+            for alert in SentAlert.query.filter_by(job_notification_id=job_notification.id).with_entities(
+                SentAlert.user_id
+            )
+        }
 
-            preferences = UserPreference.query.filter_by(user_id=user_id).all()
-            if not preferences:
+        for user, preferences in subscribers:
+            user_id = user.id
+            if user_id in already_sent:
                 continue
 
             matches = self.matching_service.is_match(
@@ -221,10 +942,17 @@ class SchedulerService:
             if not matches:
                 continue
 
-            already_sent = SentAlert.query.filter_by(
-                user_id=user_id, job_notification_id=job_notification.id
-            ).first()
-            if already_sent:
+            # Claim the alert before sending it. A concurrent run (a backfill
+            # and a scrape of the same source) that claimed it first wins.
+            sent_alert = SentAlert(
+                user_id=user_id,
+                job_notification_id=job_notification.id,
+                email_status="pending",
+            )
+            try:
+                with db.session.begin_nested():
+                    db.session.add(sent_alert)
+            except IntegrityError:
                 continue
 
             send_result = self.email_service.send_job_alert(
@@ -233,12 +961,7 @@ class SchedulerService:
                 job_notification=job_notification,
             )
             status = "sent" if send_result.get("success") else "failed"
-            sent_alert = SentAlert(
-                user_id=user_id,
-                job_notification_id=job_notification.id,
-                email_status=status,
-            )
-            db.session.add(sent_alert)
+            sent_alert.email_status = status
             db.session.flush()
 
             if status == "sent":
@@ -267,10 +990,8 @@ class SchedulerService:
                 return datetime.fromisoformat(value).date()
             except ValueError:
                 pass
-            for fmt in ("%d/%m/%Y", "%d-%m-%Y", "%d-%b-%Y", "%d %b %Y"):
-                try:
-                    return datetime.strptime(value, fmt).date()
-                except ValueError:
-                    continue
+            matched = match_date_format(value)
+            if matched and matched[1] in self.COERCE_DATE_FORMATS:
+                return matched[0]
         return None
 
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import os
+import threading
+from collections.abc import Iterable
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from models import SeenItem, db
+
+
+def hash_item_key(key: str) -> str:
+    """Return the SHA-256 hex digest stored for a scraper item key."""
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over SHA-256 hex digests (no false negatives)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        capacity = max(capacity, 1)
+        self.size = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hash_count = max(round(self.size / capacity * math.log(2)), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, digest: str) -> list[int]:
+        # Double hashing: two 64-bit halves of the digest give every probe.
+        first, second = int(digest[:16], 16), int(digest[16:32], 16) | 1
+        return [(first + index * second) % self.size for index in range(self.hash_count)]
+
+    def add(self, digest: str) -> None:
+        for position in self._positions(digest):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, digest: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+
+class SeenItemStore:
+    """
+    Cross-run record of listing items each source has already produced.
+
+    Rows live in the `seen_items` table. Each source also gets an in-memory
+    Bloom filter, loaded from the table on first use, so items never seen
+    before are recognized without a query; only Bloom hits are confirmed
+    against the database. Scrapers receive the store through
+    `config["seen_store"]` and call it from worker threads, so every query
+    runs in its own app context.
+
+    Example:
+        unseen = store.unseen_keys("https://upsc.gov.in/", keys)
+        ...
+        store.mark_seen("https://upsc.gov.in/", unseen)  # before committing the run
+    """
+
+    def __init__(self, app=None, capacity: int | None = None, error_rate: float | None = None) -> None:
+        self.app = app
+        self.capacity = capacity or int(os.getenv("SEEN_BLOOM_CAPACITY", "5000"))
+        self.error_rate = error_rate or float(os.getenv("SEEN_BLOOM_ERROR_RATE", "0.01"))
+        self._filters: dict[str, BloomFilter] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def unseen_keys(self, source_url: str, keys: Iterable[str]) -> set[str]:
+        """
+        Return the keys this source has not produced on an earlier run.
+
+        When the database cannot be read every Bloom hit is treated as new,
+        so a lookup failure costs extra work rather than lost notifications.
+        """
+        digests = {key: hash_item_key(key) for key in keys}
+        try:
+            bloom = self._filter(source_url)
+        except SQLAlchemyError:
+            self.logger.exception("Could not load seen items for %s", source_url)
+            return set(digests)
+        unseen = {key for key, digest in digests.items() if digest not in bloom}
+        maybe_seen = {digest: key for key, digest in digests.items() if key not in unseen}
+        if not maybe_seen:
+            return unseen
+
+        try:
+            with self.app.app_context():
+                confirmed = {
+                    row.item_key
+                    for row in SeenItem.query.filter(
+                        SeenItem.source_url == source_url,
+                        SeenItem.item_key.in_(list(maybe_seen)),
+                    ).with_entities(SeenItem.item_key)
+                }
+        except SQLAlchemyError:
+            self.logger.exception("Seen-item lookup failed for %s", source_url)
+            confirmed = set()
+        return unseen | {key for digest, key in maybe_seen.items() if digest not in confirmed}
+
+    def mark_seen(self, source_url: str, keys: Iterable[str]) -> int:
+        """
+        Add rows for newly seen keys to the current `db.session`.
+
+        The caller commits them together with the rest of the run, so items
+        from a run that fails to save are offered again next time.
+
+        Returns:
+            Number of rows added.
+        """
+        digests = {hash_item_key(key) for key in keys}
+        if not digests:
+            return 0
+
+        existing = {
+            row.item_key
+            for row in SeenItem.query.filter(
+                SeenItem.source_url == source_url, SeenItem.item_key.in_(list(digests))
+            ).with_entities(SeenItem.item_key)
+        }
+        bloom = self._filter(source_url)
+        added = 0
+        for digest in digests:
+            # A rolled-back run leaves extra Bloom bits, which the database
+            # check in `unseen_keys` filters out again.
+            bloom.add(digest)
+            if digest not in existing:
+                db.session.add(SeenItem(source_url=source_url, item_key=digest))
+                added += 1
+        return added
+
+    def has_items(self, source_url: str) -> bool:
+        """Return whether any item was recorded as seen for the source."""
+        return db.session.query(SeenItem.query.filter_by(source_url=source_url).exists()).scalar()
+
+    def forget(self, source_url: str) -> None:
+        """Drop the cached Bloom filter for a source (rows are kept)."""
+        with self._lock:
+            self._filters.pop(source_url, None)
+
+    def _filter(self, source_url: str) -> BloomFilter:
+        bloom = self._filters.get(source_url)
+        if bloom is not None:
+            return bloom
+
+        with self._lock:
+            bloom = self._filters.get(source_url)
+            if bloom is None:
+                with self.app.app_context():
+                    digests = [
+                        row.item_key
+                        for row in SeenItem.query.filter_by(source_url=source_url).with_entities(
+                            SeenItem.item_key
+                        )
+                    ]
+                bloom = BloomFilter(max(self.capacity, 2 * len(digests)), self.error_rate)
+                for digest in digests:
+                    bloom.add(digest)
+                self._filters[source_url] = bloom
+        return bloom
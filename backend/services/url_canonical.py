@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+_DEFAULT_PORTS = {("http", 80), ("https", 443)}
+_TRACKING_PARAMS = re.compile(r"^(?:utm_\w+|fbclid|gclid)$", flags=re.IGNORECASE)
+_REPEATED_SLASHES = re.compile(r"/{2,}")
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Return the canonical form used to recognize one source behind many URL spellings.
+
+    `http` and `https`, a leading `www.`, host case, default ports, trailing
+    and repeated slashes, fragments, tracking parameters and query-parameter
+    order are all normalized away. The result identifies a source; scrapers
+    still fetch the URL the user entered.
+
+    Example:
+        canonicalize_url("http://www.UPSC.gov.in/exams/?b=2&a=1#top")
+        # -> "https://upsc.gov.in/exams?a=1&b=2"
+    """
+    parts = urlsplit((url or "").strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+
+    netloc = host if port is None or (scheme, port) in _DEFAULT_PORTS else f"{host}:{port}"
+    path = _REPEATED_SLASHES.sub("/", parts.path).rstrip("/") or "/"
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not _TRACKING_PARAMS.match(key)
+        )
+    )
+    if scheme == "http":
+        scheme = "https"
+    return urlunsplit((scheme, netloc, path, query, ""))